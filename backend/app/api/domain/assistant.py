@@ -0,0 +1,46 @@
+import logging
+from typing import AsyncIterator
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.security import get_user_id
+from app.schemas.orchestrator.assistant import AssistantMessageCommand, AssistantStreamEvent
+from app.services.orchestrator.runner import AssistantRunner
+from app.services.system.exceptions import InternalError, QueueFullError
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.post("/messages", status_code=status.HTTP_200_OK)
+async def send_message(command: AssistantMessageCommand, user_id: UUID = Depends(get_user_id)):
+    """Send a message to the assistant and stream the reply as Server-Sent Events."""
+    events = AssistantRunner.stream(user_id=user_id, message=command.message)
+    try:
+        # Wait for this turn's slot before answering so a full queue still maps to a status code
+        first = await anext(events, None)
+    except QueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except InternalError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return StreamingResponse(
+        _to_sse(first, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+async def _to_sse(first: AssistantStreamEvent | None, events: AsyncIterator[AssistantStreamEvent]) -> AsyncIterator[str]:
+    """Serialize assistant events to SSE frames; a disconnect closes the generator and cancels the run."""
+    try:
+        if first is None:
+            return
+        yield f"event: {first.event}\ndata: {first.model_dump_json(exclude_none=True)}\n\n"
+        async for event in events:
+            yield f"event: {event.event}\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+    except Exception:
+        logger.exception("LOGGER:Failed while streaming assistant reply")
+        error = AssistantStreamEvent(event="error", text="Sorry, something went wrong while processing your request.")
+        yield f"event: error\ndata: {error.model_dump_json(exclude_none=True)}\n\n"
+    finally:
+        await events.aclose()
@@ -1,17 +1,74 @@
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.core.security import get_user_id
+from app.schemas.domain.event import EventBatchCommand, EventBatchResultDTO, EventDTO, EventListCommand, EventStreamCommand
 from app.services.domain.event import EventService
-from app.services.system.exceptions import InternalError
+from app.services.system.exceptions import InternalError, TooManyRequestsError
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/events", status_code=status.HTTP_200_OK)
-async def list_events(user_id: UUID = Depends(get_user_id)):
-    """List events for the current user."""
+async def list_events(
+    start_dt: Optional[datetime] = None,
+    end_dt: Optional[datetime] = None,
+    limit: int = Query(10, ge=1),
+    calendar_ids: Optional[List[str]] = Query(None),
+    user_id: UUID = Depends(get_user_id),
+):
+    """List events for the current user across their calendars."""
     try:
-        return await EventService.list_events(user_id)
+        command = EventListCommand(start_dt=start_dt, end_dt=end_dt, limit=limit, calendar_ids=calendar_ids)
+        return await EventService.list_events(user_id, command)
+    except TooManyRequestsError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
     except InternalError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.post("/events:batch", status_code=status.HTTP_200_OK, response_model=List[EventBatchResultDTO])
+async def batch_events(command: EventBatchCommand, user_id: UUID = Depends(get_user_id)):
+    """Create, update and delete many events at once; failures are reported per item."""
+    try:
+        return await EventService.batch(user_id, command)
+    except TooManyRequestsError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except InternalError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+@router.get("/events/stream", status_code=status.HTTP_200_OK)
+async def stream_events(
+    start_dt: Optional[datetime] = None,
+    end_dt: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    calendar_ids: Optional[List[str]] = Query(None),
+    user_id: UUID = Depends(get_user_id),
+):
+    """Stream events for the current user across their calendars as NDJSON, one event per line."""
+    command = EventStreamCommand(start_dt=start_dt, end_dt=end_dt, limit=limit, calendar_ids=calendar_ids)
+    events = EventService.iter_events(user_id, command)
+    try:
+        # Pull the first event before answering so setup failures still map to a status code
+        first = await anext(events, None)
+    except TooManyRequestsError as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    except InternalError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return StreamingResponse(_to_ndjson(first, events), media_type="application/x-ndjson")
+
+async def _to_ndjson(first: EventDTO | None, events: AsyncIterator[EventDTO]) -> AsyncIterator[str]:
+    """Serialize events to NDJSON lines."""
+    if first is None:
+        return
+    yield first.model_dump_json() + "\n"
+    try:
+        async for event in events:
+            yield event.model_dump_json() + "\n"
+    except Exception:
+        # Headers are already sent; end the stream and keep the failure in logs
+        logger.exception("LOGGER:Failed while streaming events")
@@ -4,6 +4,7 @@ from app.api.system.handler import router as router_handler
 from app.api.domain.auth import router as router_auth
 from app.api.domain.profile import router as router_profile
 from app.api.domain.calendar import router as router_calendar
+from app.api.domain.assistant import router as router_assistant
 from app.core.config import API_ROOT_PREFIX
 
 
@@ -17,6 +18,7 @@ def get_root():
 router_root.include_router(router_auth, prefix="/auth")
 router_root.include_router(router_profile, prefix="/profile")
 router_root.include_router(router_calendar, prefix="/calendar")
+router_root.include_router(router_assistant, prefix="/assistant")
 
 # System routes
 router_root.include_router(router_handler, prefix="/handlers")
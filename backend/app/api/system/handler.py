@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Request, status, HTTPException, Depends, Query
+from fastapi import APIRouter, Request, Response, status, HTTPException, Depends, Query, Header
 from uuid import UUID
 
 from app.services.intergration.calendar_connection import CalendarConnectionService
-from app.services.system.exceptions import InternalError
-from app.core.security import get_user_id
+from app.services.external.google_scheduler import GoogleRequestScheduler
+from app.services.external.thread_pool import ThreadPool
+from app.services.domain.session import SessionService
+from app.services.orchestrator.intent import IntentRouter
+from app.services.orchestrator.runner import AssistantRunner
+from app.services.orchestrator.time_parser import TimeParser
+from app.services.orchestrator.tool_output import ToolOutputSerializer
+from app.services.intergration.calendar_watch import CalendarWatchService
+from app.services.system.exceptions import InternalError, NotFoundError, UnauthorizedError
+from app.core.security import get_user_id, check_internal_token
 
 router = APIRouter()
 
@@ -26,3 +34,36 @@ async def fetch_token(request: Request, state: str = Query(...)): # type: ignore
         return {"status": "success"}
     except InternalError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))    
+
+
+@router.post("/notifications", status_code=status.HTTP_200_OK)
+async def calendar_notification(
+    x_goog_channel_id: str = Header(...),
+    x_goog_resource_state: str = Header(...),
+    x_goog_channel_token: str | None = Header(None),
+):
+    """Receive Google Calendar push notifications."""
+    try:
+        await CalendarWatchService.handle_notification(x_goog_channel_id, x_goog_channel_token, x_goog_resource_state)
+        return Response(status_code=status.HTTP_200_OK)
+    except NotFoundError as e:
+        # Google stops retrying a channel once it gets 404
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UnauthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except InternalError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK, dependencies=[Depends(check_internal_token)])
+async def metrics():
+    """Expose in-process cache and client counters."""
+    return {
+        "google_scheduler": GoogleRequestScheduler.stats(),
+        "assistant_queue": AssistantRunner.stats(),
+        "intent_router": IntentRouter.stats(),
+        "time_parser": TimeParser.stats(),
+        "tool_output": ToolOutputSerializer.stats(),
+        "sessions": SessionService.stats(),
+        "thread_pool": ThreadPool.stats(),
+    }
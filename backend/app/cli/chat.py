@@ -7,8 +7,12 @@ import logging
 import app.orm.user  # noqa: F401
 import app.orm.session  # noqa: F401
 import app.orm.token  # noqa: F401
+import app.orm.event  # noqa: F401
+import app.orm.calendar_sync  # noqa: F401
+import app.orm.watch_channel  # noqa: F401
 
 from app.services.orchestrator.runner import AssistantRunner
+from app.services.external.openai import ChatCompletionProvider
 from app.schemas.orchestrator.assistant import AssistantOutput
 
 logging.basicConfig(level=logging.WARNING)
@@ -32,8 +36,9 @@ async def main():
             )
             if output.text:
                 print(output.text)
-            elif output.tool:
-                print(f"CHECK: [tool:{output.tool}] {output.arguments}")
+            elif output.tool_calls:
+                for call in output.tool_calls:
+                    print(f"CHECK: [tool:{call.name}] {call.arguments}")
             else:
                 print("[empty output]")
 
@@ -42,6 +47,7 @@ async def main():
         except Exception as e:
             print(f"Error: {e}")
 
+    await ChatCompletionProvider.close()
     print("\nBye!")
 
 
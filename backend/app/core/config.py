@@ -15,6 +15,8 @@ API_ROOT_PREFIX = os.environ.get("API_ROOT_PREFIX")
 SECRET_KEY = os.environ.get("SECRET_KEY")
 ALGORITHM = os.environ.get("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_HOURS = os.environ.get("ACCESS_TOKEN_EXPIRE_HOURS")
+# Internal endpoints such as /handlers/metrics are disabled when METRICS_TOKEN is not set
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
 
 # Google Auth
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
@@ -22,6 +24,63 @@ GOOGLE_CLIENT_SECRET =  os.environ.get("GOOGLE_CLIENT_SECRET")
 GOOGLE_REDIRECT_URI =  os.environ.get("GOOGLE_REDIRECT_URI") + API_ROOT_PREFIX + "/handlers/callback"
 GOOGLE_SCOPES = json.loads(os.environ.get("GOOGLE_SCOPES"))
 
+# Google API client
+GOOGLE_CREDS_CACHE_SIZE = int(os.environ.get("GOOGLE_CREDS_CACHE_SIZE", 1024))
+GOOGLE_CREDS_RENEW_AHEAD = int(os.environ.get("GOOGLE_CREDS_RENEW_AHEAD", 300))
+GOOGLE_CREDS_RENEW_INTERVAL = int(os.environ.get("GOOGLE_CREDS_RENEW_INTERVAL", 60))
+GOOGLE_PROJECT_QPS = float(os.environ.get("GOOGLE_PROJECT_QPS", 50))
+GOOGLE_USER_QPS = float(os.environ.get("GOOGLE_USER_QPS", 5))
+GOOGLE_MAX_RETRIES = int(os.environ.get("GOOGLE_MAX_RETRIES", 4))
+GOOGLE_BACKOFF_BASE = float(os.environ.get("GOOGLE_BACKOFF_BASE", 0.5))
+GOOGLE_BACKOFF_MAX = float(os.environ.get("GOOGLE_BACKOFF_MAX", 32))
+GOOGLE_API_BASE_URL = os.environ.get("GOOGLE_API_BASE_URL", "https://www.googleapis.com/calendar/v3")
+GOOGLE_BATCH_URL = os.environ.get("GOOGLE_BATCH_URL", "https://www.googleapis.com/batch/calendar/v3")
+GOOGLE_TOKEN_URI = os.environ.get("GOOGLE_TOKEN_URI", "https://oauth2.googleapis.com/token")
+GOOGLE_HTTP_TIMEOUT = float(os.environ.get("GOOGLE_HTTP_TIMEOUT", 15))
+GOOGLE_HTTP_MAX_CONNECTIONS = int(os.environ.get("GOOGLE_HTTP_MAX_CONNECTIONS", 100))
+GOOGLE_HTTP_MAX_KEEPALIVE = int(os.environ.get("GOOGLE_HTTP_MAX_KEEPALIVE", 20))
+
+# Calendar mirror
+CALENDAR_MIRROR_MAX_AGE = int(os.environ.get("CALENDAR_MIRROR_MAX_AGE", 60))
+CALENDAR_LIST_CACHE_TTL = int(os.environ.get("CALENDAR_LIST_CACHE_TTL", 600))
+CALENDAR_FANOUT_CONCURRENCY = int(os.environ.get("CALENDAR_FANOUT_CONCURRENCY", 8))
+CALENDAR_EVENT_CACHE_SIZE = int(os.environ.get("CALENDAR_EVENT_CACHE_SIZE", 4096))
+CALENDAR_LOCAL_RECURRENCE = os.environ.get("CALENDAR_LOCAL_RECURRENCE", "true").lower() == "true"
+
+# Calendar push notifications (disabled when GOOGLE_WEBHOOK_URL is not set)
+GOOGLE_WEBHOOK_URL = os.environ.get("GOOGLE_WEBHOOK_URL")
+GOOGLE_WATCH_TTL = int(os.environ.get("GOOGLE_WATCH_TTL", 7 * 24 * 3600))
+GOOGLE_WATCH_RENEW_BEFORE = int(os.environ.get("GOOGLE_WATCH_RENEW_BEFORE", 12 * 3600))
+GOOGLE_WATCH_RECONCILE_INTERVAL = int(os.environ.get("GOOGLE_WATCH_RECONCILE_INTERVAL", 600))
+# How often reconcile re-reads the calendar list of users that already have channels
+GOOGLE_WATCH_DISCOVERY_INTERVAL = int(os.environ.get("GOOGLE_WATCH_DISCOVERY_INTERVAL", 24 * 3600))
+
+# Users
+DEFAULT_TIMEZONE = os.environ.get("DEFAULT_TIMEZONE", "Europe/Moscow")
+USER_TIMEZONE_CACHE_TTL = int(os.environ.get("USER_TIMEZONE_CACHE_TTL", 300))
+TIME_PARSER_CACHE_SIZE = int(os.environ.get("TIME_PARSER_CACHE_SIZE", 4096))
+
 # AI
 AI_KEY = os.environ.get("AI_KEY")
-AI_ASSISTANT_ID = os.environ.get("AI_ASSISTANT_ID")
\ No newline at end of file
+AI_ASSISTANT_ID = os.environ.get("AI_ASSISTANT_ID")
+AI_BASE_URL = os.environ.get("AI_BASE_URL", "https://api.proxyapi.ru/openai/v1")
+AI_TIMEOUT = float(os.environ.get("AI_TIMEOUT", 60))
+AI_CONNECT_TIMEOUT = float(os.environ.get("AI_CONNECT_TIMEOUT", 5))
+AI_MAX_RETRIES = int(os.environ.get("AI_MAX_RETRIES", 2))
+AI_MAX_CONNECTIONS = int(os.environ.get("AI_MAX_CONNECTIONS", 100))
+AI_MAX_KEEPALIVE = int(os.environ.get("AI_MAX_KEEPALIVE", 20))
+AI_POLL_INTERVAL_MS = int(os.environ.get("AI_POLL_INTERVAL_MS", 500))
+AI_TOOL_CONCURRENCY = int(os.environ.get("AI_TOOL_CONCURRENCY", 4))
+AI_TOOL_OUTPUT_BUDGET = int(os.environ.get("AI_TOOL_OUTPUT_BUDGET", 800))
+AI_MAX_CONCURRENT_RUNS = int(os.environ.get("AI_MAX_CONCURRENT_RUNS", 32))
+AI_MAX_QUEUED_TURNS = int(os.environ.get("AI_MAX_QUEUED_TURNS", 3))
+AI_MAX_PENDING_TURNS = int(os.environ.get("AI_MAX_PENDING_TURNS", 256))
+AI_THREAD_MAX_MESSAGES = int(os.environ.get("AI_THREAD_MAX_MESSAGES", 60))
+AI_THREAD_MAX_TOKENS = int(os.environ.get("AI_THREAD_MAX_TOKENS", 24000))
+AI_SUMMARY_MODEL = os.environ.get("AI_SUMMARY_MODEL", "gpt-4o-mini")
+AI_SUMMARY_MAX_TOKENS = int(os.environ.get("AI_SUMMARY_MAX_TOKENS", 400))
+AI_SUMMARY_SOURCE_MESSAGES = int(os.environ.get("AI_SUMMARY_SOURCE_MESSAGES", 40))
+# Ready threads for the whole deployment; each of the WEB_CONCURRENCY worker processes keeps its share
+AI_THREAD_POOL_SIZE = int(os.environ.get("AI_THREAD_POOL_SIZE", 8))
+WEB_CONCURRENCY = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+AI_SESSION_CACHE_TTL = int(os.environ.get("AI_SESSION_CACHE_TTL", 600))
\ No newline at end of file
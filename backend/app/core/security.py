@@ -1,12 +1,13 @@
+import secrets
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Request, HTTPException, status
+from fastapi import Request, HTTPException, Header, status
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
 
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_HOURS
+from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_HOURS, METRICS_TOKEN
 
 
 
@@ -46,6 +47,15 @@ def get_user_id(request: Request) -> UUID:
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user ID format in token")
 
+
+def check_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """Allow internal endpoints only for callers presenting METRICS_TOKEN."""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if not x_internal_token or not secrets.compare_digest(x_internal_token, METRICS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid internal token")
+
+
 def _get_token_from_request(request: Request) -> Optional[str]:
     """Extract the JWT token from the request's Authorization header or cookies."""
     auth_header = request.headers.get("Authorization")
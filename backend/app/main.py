@@ -1,9 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import router_root
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.external.openai import ChatCompletionProvider
+from app.services.external.thread_pool import ThreadPool
+from app.services.domain.credential import CredentialService
+from app.services.intergration.calendar_watch import CalendarWatchService
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background = [asyncio.create_task(CredentialService.run()), asyncio.create_task(ThreadPool.run())]
+    if CalendarWatchService.is_enabled():
+        background.append(asyncio.create_task(CalendarWatchService.run()))
+    yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await GoogleCalendarClient.close()
+    await ChatCompletionProvider.close()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(router_root)
 app.add_middleware(
     CORSMiddleware,
@@ -11,4 +32,4 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-)
\ No newline at end of file
+)
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+import uuid
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.orm.base import Base
+
+
+class CalendarSyncOrm(Base):
+    __tablename__ = "calendar_syncs"
+    __table_args__ = (
+        UniqueConstraint("user_id", "calendar_id", name="uq_calendar_syncs_user_calendar"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    user_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    sync_token: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    watched_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    sync_failed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+import uuid
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.orm.base import Base
+
+
+class EventOrm(Base):
+    __tablename__ = "events"
+    __table_args__ = (
+        UniqueConstraint("user_id", "calendar_id", "google_id", name="uq_events_user_calendar_google"),
+        Index("ix_events_user_window", "user_id", "start_dt", "end_dt"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    user_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    google_id: Mapped[str] = mapped_column(String(1024), nullable=False)
+    etag: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    summary: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    attendees: Mapped[Optional[List[str]]] = mapped_column(JSONB, nullable=True)
+    start_dt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_dt: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    all_day: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Google's "transparent" marks an event shown as free; response_status is the owner's own answer to an invitation
+    transparency: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+    response_status: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import BigInteger, ForeignKey, DateTime, String
+from sqlalchemy import BigInteger, ForeignKey, DateTime, Integer, String, Text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -15,4 +15,14 @@ class SessionOrm(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())        
     user_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     provider_thread_id: Mapped[str] = mapped_column(String(255), nullable=False)
-    topic: Mapped[str] = mapped_column(String(255), nullable=False)
\ No newline at end of file
+    topic: Mapped[str] = mapped_column(String(255), nullable=False)
+    active_run_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    run_status: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # Thread size, used to decide when to rotate to a fresh thread
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    token_estimate: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Session whose thread this one replaced, and the summary the new thread was seeded with
+    parent_session_id: Mapped[uuid.UUID | None] = mapped_column(PGUUID(as_uuid=True), ForeignKey("sessions.id"), nullable=True)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Set by the one worker that wins the rotation of this session; a conditional update keeps the others out
+    rotated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -5,6 +5,7 @@ from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.orm.base import Base
+from app.core.config import DEFAULT_TIMEZONE
 
 
 class UserOrm(Base):
@@ -17,3 +18,4 @@ class UserOrm(Base):
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     status: Mapped[str] = mapped_column(String(255), nullable=False, default='active')
     password: Mapped[str] = mapped_column(String(255), nullable=False)
+    timezone: Mapped[str] = mapped_column(String(64), nullable=False, default=DEFAULT_TIMEZONE, server_default=DEFAULT_TIMEZONE)
@@ -0,0 +1,21 @@
+from datetime import datetime
+import uuid
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.orm.base import Base
+
+
+class WatchChannelOrm(Base):
+    __tablename__ = "watch_channels"
+
+    id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    user_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    token_id: Mapped[uuid.UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("tokens.id", ondelete="CASCADE"), nullable=False)
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    resource_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    channel_token: Mapped[str] = mapped_column(String(255), nullable=False)
+    expiration: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,39 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import select
+
+from app.core.db import db_session
+from app.orm.calendar_sync import CalendarSyncOrm
+
+
+class CalendarSyncRepository:
+    """Repository class for managing CalendarSyncOrm database operations."""
+
+    @classmethod
+    async def retrieve(cls, user_id: UUID, calendar_id: str) -> Optional[CalendarSyncOrm]:
+        """Retrieve sync state for a user calendar."""
+        async with db_session() as session:
+            query = select(CalendarSyncOrm).where(
+                CalendarSyncOrm.user_id == user_id,
+                CalendarSyncOrm.calendar_id == calendar_id,
+            )
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
+
+    @classmethod
+    async def create(cls, data: CalendarSyncOrm) -> CalendarSyncOrm:
+        """Create sync state."""
+        async with db_session() as session:
+            session.add(data)
+            await session.flush()
+            await session.commit()
+            return data
+
+    @classmethod
+    async def update(cls, data: CalendarSyncOrm) -> CalendarSyncOrm:
+        """Update sync state."""
+        async with db_session() as session:
+            session.add(data)
+            await session.flush()
+            await session.commit()
+            return data
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional
+from uuid import UUID
+from sqlalchemy import String, all_, any_, delete, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from app.core.db import db_session
+from app.orm.event import EventOrm
+
+
+class EventRepository:
+    """Repository class for managing mirrored EventOrm database operations."""
+
+    @classmethod
+    async def list_window(cls, user_id: UUID, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, limit: Optional[int] = None, calendar_id: Optional[str] = None) -> List[EventOrm]:
+        """List mirrored events overlapping a time window, ordered by start time."""
+        async with db_session() as session:
+            query = cls._window_query(user_id, start_dt, end_dt, limit, calendar_id)
+            result = await session.execute(query)
+            return result.scalars().all()
+
+    @classmethod
+    async def stream_window(cls, user_id: UUID, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, limit: Optional[int] = None, calendar_id: Optional[str] = None, page_size: int = 500) -> AsyncIterator[EventOrm]:
+        """Stream mirrored events overlapping a time window, fetching page_size rows at a time."""
+        async with db_session() as session:
+            query = cls._window_query(user_id, start_dt, end_dt, limit, calendar_id).execution_options(yield_per=page_size)
+            result = await session.stream_scalars(query)
+            async for row in result:
+                yield row
+
+    @staticmethod
+    def _window_query(user_id: UUID, start_dt: Optional[datetime], end_dt: Optional[datetime], limit: Optional[int], calendar_id: Optional[str]):
+        """Build the window select shared by list and stream."""
+        query = select(EventOrm).where(EventOrm.user_id == user_id)
+        if calendar_id:
+            query = query.where(EventOrm.calendar_id == calendar_id)
+        if start_dt:
+            query = query.where(EventOrm.end_dt > start_dt)
+        if end_dt:
+            query = query.where(EventOrm.start_dt < end_dt)
+        query = query.order_by(EventOrm.start_dt, EventOrm.google_id)
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    @classmethod
+    async def upsert_many(cls, rows: List[dict], chunk_size: int = 500) -> None:
+        """Insert or update mirrored events keyed by (user_id, calendar_id, google_id), chunk_size rows per statement."""
+        if not rows:
+            return
+        # A multi-row VALUES binds one parameter per column, and asyncpg caps a statement at 32767
+        async with db_session() as session:
+            for i in range(0, len(rows), chunk_size):
+                stmt = insert(EventOrm).values(rows[i:i + chunk_size])
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_events_user_calendar_google",
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in ("etag", "summary", "description", "location", "attendees", "start_dt", "end_dt", "all_day", "transparency", "response_status")
+                    },
+                )
+                await session.execute(stmt)
+            await session.commit()
+
+    @classmethod
+    async def delete_many(cls, user_id: UUID, calendar_id: str, google_ids: Iterable[str]) -> None:
+        """Delete mirrored events by Google ID."""
+        google_ids = list(google_ids)
+        if not google_ids:
+            return
+        async with db_session() as session:
+            query = delete(EventOrm).where(
+                EventOrm.user_id == user_id,
+                EventOrm.calendar_id == calendar_id,
+                EventOrm.google_id == any_(literal(google_ids, ARRAY(String))),
+            )
+            await session.execute(query)
+            await session.commit()
+
+    @classmethod
+    async def delete_except(cls, user_id: UUID, calendar_id: str, keep_ids: Iterable[str]) -> None:
+        """Delete mirrored events of a calendar that are not in keep_ids."""
+        async with db_session() as session:
+            # A single array parameter instead of one per id, so large calendars stay under the parameter cap
+            query = delete(EventOrm).where(
+                EventOrm.user_id == user_id,
+                EventOrm.calendar_id == calendar_id,
+                EventOrm.google_id != all_(literal(list(keep_ids), ARRAY(String))),
+            )
+            await session.execute(query)
+            await session.commit()
+
+    @classmethod
+    async def delete_by_calendar(cls, user_id: UUID, calendar_id: str) -> None:
+        """Delete all mirrored events of a calendar."""
+        async with db_session() as session:
+            query = delete(EventOrm).where(EventOrm.user_id == user_id, EventOrm.calendar_id == calendar_id)
+            await session.execute(query)
+            await session.commit()
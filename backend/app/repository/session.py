@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 from typing import Optional, List
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 
 from app.core.db import db_session
 from app.orm.session import SessionOrm
@@ -31,6 +32,39 @@ class SessionRepository:
             await session.commit()
             return data
 
-            
-        
-  
\ No newline at end of file
+    @classmethod
+    async def update_run_state(cls, id: UUID, active_run_id: Optional[str], run_status: Optional[str]) -> None:
+        async with db_session() as session:
+            stmt = update(SessionOrm).where(SessionOrm.id == id).values(active_run_id=active_run_id, run_status=run_status)
+            await session.execute(stmt)
+            await session.commit()
+
+    @classmethod
+    async def add_usage(cls, id: UUID, messages: int, tokens: int) -> Optional[datetime]:
+        """Add to the thread size and return rotated_at, so callers learn when another worker retired the session."""
+        async with db_session() as session:
+            stmt = update(SessionOrm).where(SessionOrm.id == id).values(
+                message_count=SessionOrm.message_count + messages,
+                token_estimate=SessionOrm.token_estimate + tokens,
+            ).returning(SessionOrm.rotated_at)
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.scalar_one_or_none()
+
+    @classmethod
+    async def claim_rotation(cls, id: UUID) -> bool:
+        """Mark the session as rotated unless it already is; True only for the caller that set it."""
+        async with db_session() as session:
+            stmt = update(SessionOrm).where(SessionOrm.id == id, SessionOrm.rotated_at.is_(None)).values(
+                rotated_at=func.now(),
+            ).returning(SessionOrm.id)
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.scalar_one_or_none() is not None
+
+    @classmethod
+    async def release_rotation(cls, id: UUID) -> None:
+        async with db_session() as session:
+            stmt = update(SessionOrm).where(SessionOrm.id == id).values(rotated_at=None)
+            await session.execute(stmt)
+            await session.commit()
@@ -0,0 +1,64 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+from sqlalchemy import select, delete, func
+
+from app.core.db import db_session
+from app.orm.watch_channel import WatchChannelOrm
+
+# pg advisory lock key shared by every worker running the reconcile loop
+RECONCILE_LOCK_KEY = 4_702_113_001
+
+
+class WatchChannelRepository:
+    """Repository class for managing WatchChannelOrm database operations."""
+
+    @classmethod
+    async def create(cls, data: WatchChannelOrm) -> WatchChannelOrm:
+        """Create a new watch channel."""
+        async with db_session() as session:
+            session.add(data)
+            await session.flush()
+            await session.commit()
+            return data
+
+    @classmethod
+    async def retrieve(cls, id: UUID) -> Optional[WatchChannelOrm]:
+        """Retrieve a watch channel by ID."""
+        async with db_session() as session:
+            query = select(WatchChannelOrm).where(WatchChannelOrm.id == id)
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
+
+    @classmethod
+    async def list_active(cls, now: datetime) -> List[WatchChannelOrm]:
+        """List channels that have not expired yet."""
+        async with db_session() as session:
+            query = select(WatchChannelOrm).where(WatchChannelOrm.expiration > now)
+            result = await session.execute(query)
+            return result.scalars().all()
+
+    @classmethod
+    async def list_expiring(cls, before: datetime) -> List[WatchChannelOrm]:
+        """List channels expiring before the given moment."""
+        async with db_session() as session:
+            query = select(WatchChannelOrm).where(WatchChannelOrm.expiration < before)
+            result = await session.execute(query)
+            return result.scalars().all()
+
+    @classmethod
+    async def delete(cls, id: UUID) -> None:
+        """Delete a watch channel by ID."""
+        async with db_session() as session:
+            query = delete(WatchChannelOrm).where(WatchChannelOrm.id == id)
+            await session.execute(query)
+            await session.commit()
+
+    @classmethod
+    @asynccontextmanager
+    async def reconcile_lock(cls) -> AsyncIterator[bool]:
+        """Try the transaction-scoped reconcile lock; yields whether this worker holds it until the block exits."""
+        async with db_session() as session:
+            result = await session.execute(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_KEY)))
+            yield bool(result.scalar())
@@ -1,6 +1,15 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+
+# Nested Data Transfer Objects
+class EventBatchOperationEnum(str, Enum):
+    """Enumeration for batch event operations."""
+    create = "create"
+    update = "update"
+    delete = "delete"
 
 
 # Data Transfer Objects
@@ -13,6 +22,7 @@ class EventDTO(BaseModel):
     end_dt: datetime
     location: Optional[str] = None
     attendees: Optional[List[str]] = None
+    calendar_id: Optional[str] = None
 
 # Commands (inputs / intents)
 class EventListCommand(BaseModel):
@@ -20,6 +30,14 @@ class EventListCommand(BaseModel):
     start_dt: Optional[datetime] = None
     end_dt: Optional[datetime] = None
     limit: int = Field(default=10, ge=1)
+    calendar_ids: Optional[List[str]] = None
+
+class EventStreamCommand(BaseModel):
+    """Command for streaming calendar events without materializing the whole window."""
+    start_dt: Optional[datetime] = None
+    end_dt: Optional[datetime] = None
+    limit: Optional[int] = Field(default=None, ge=1)
+    calendar_ids: Optional[List[str]] = None
 
 class EventCreateCommand(BaseModel):
     """Command for creating a calendar event."""
@@ -37,4 +55,35 @@ class EventUpdateCommand(BaseModel):
     end_dt: Optional[datetime] = None
     description: Optional[str] = None
     location: Optional[str] = None
-    attendees: Optional[List[str]] = None
\ No newline at end of file
+    attendees: Optional[List[str]] = None
+
+class EventBatchItem(BaseModel):
+    """Single operation inside a batch command."""
+    operation: EventBatchOperationEnum
+    event_id: Optional[str] = None
+    calendar_id: str = "primary"
+    create: Optional[EventCreateCommand] = None
+    update: Optional[EventUpdateCommand] = None
+
+    @model_validator(mode="after")
+    def check_payload(self):
+        if self.operation == EventBatchOperationEnum.create and self.create is None:
+            raise ValueError("create operation requires 'create'")
+        if self.operation == EventBatchOperationEnum.update and (self.update is None or not self.event_id):
+            raise ValueError("update operation requires 'event_id' and 'update'")
+        if self.operation == EventBatchOperationEnum.delete and not self.event_id:
+            raise ValueError("delete operation requires 'event_id'")
+        return self
+
+class EventBatchCommand(BaseModel):
+    """Command for running many event mutations in as few round trips as possible."""
+    items: List[EventBatchItem] = Field(..., min_length=1, max_length=1000)
+
+# Results
+class EventBatchResultDTO(BaseModel):
+    """Outcome of one batch item, in the order the items were sent."""
+    index: int
+    success: bool
+    status_code: int
+    event: Optional[EventDTO] = None
+    error: Optional[str] = None
@@ -0,0 +1,30 @@
+from datetime import datetime, time
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+# Data Transfer Objects
+class FreeSlotDTO(BaseModel):
+    """Free time slot."""
+    start_dt: datetime
+    end_dt: datetime
+
+# Commands (inputs / intents)
+class FreeSlotQueryCommand(BaseModel):
+    """Command for finding free slots across one or more calendars."""
+    start_dt: datetime
+    end_dt: datetime
+    duration_minutes: int = Field(default=30, ge=1)
+    calendar_ids: List[str] = Field(default_factory=lambda: ["primary"], min_length=1)
+    working_hours_start: Optional[time] = time(9, 0)
+    working_hours_end: Optional[time] = time(18, 0)
+    timezone: str = "UTC"
+    limit: int = Field(default=10, ge=1)
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if self.end_dt <= self.start_dt:
+            raise ValueError("end_dt must be after start_dt")
+        if (self.working_hours_start is None) != (self.working_hours_end is None):
+            raise ValueError("working hours need both start and end")
+        return self
@@ -1,7 +1,8 @@
 import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, ConfigDict
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import BaseModel, EmailStr, ConfigDict, field_validator
 
 from app.schemas.domain.user import UserStateEnum
 
@@ -13,6 +14,7 @@ class ProfileDTO(BaseModel):
     status: UserStateEnum
     email: EmailStr
     name: str
+    timezone: str
     model_config = ConfigDict(from_attributes=True)
 
 class ProfileExternalDTO(ProfileDTO):
@@ -23,6 +25,19 @@ class ProfileUpdateDTO(BaseModel):
     """Data Transfer Object for updating user profile information."""
     email: Optional[EmailStr] = None
     name: Optional[str] = None
+    timezone: Optional[str] = None
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: Optional[str]) -> Optional[str]:
+        # Only an explicit null gets here (defaults are not validated); users.timezone is NOT NULL
+        if value is None:
+            raise ValueError("Timezone cannot be null")
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {value}")
+        return value
 
 class ProfileUpdatePasswordDTO(BaseModel):
     """Data Transfer Object for updating user password."""
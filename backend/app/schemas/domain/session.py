@@ -13,6 +13,12 @@ class SessionDTO(BaseModel):
     user_id: UUID
     provider_thread_id: str
     topic: Optional[str] = None    
+    active_run_id: Optional[str] = None
+    run_status: Optional[str] = None
+    message_count: int = 0
+    token_estimate: int = 0
+    parent_session_id: Optional[UUID] = None
+    summary: Optional[str] = None
     model_config = ConfigDict(from_attributes=True)
 
 class SessionCreateDTO(BaseModel):
@@ -20,4 +26,7 @@ class SessionCreateDTO(BaseModel):
     user_id: UUID
     provider_thread_id: str
     topic: Optional[str] = None
-
+    message_count: int = 0
+    token_estimate: int = 0
+    parent_session_id: Optional[UUID] = None
+    summary: Optional[str] = None
@@ -20,6 +20,7 @@ class UserDTO(BaseModel):
     email: EmailStr
     password: str
     name: str
+    timezone: str
     model_config = ConfigDict(from_attributes=True)
 
 class UserExternalDTO(BaseModel):
@@ -40,6 +41,7 @@ class UserUpdateDTO(BaseModel):
     """Data Transfer Object for updating user information."""
     email: Optional[EmailStr] = None
     name: Optional[str] = None
+    timezone: Optional[str] = None
 
 class UserUpdatePasswordDTO(BaseModel):
     """Data Transfer Object for updating user password."""
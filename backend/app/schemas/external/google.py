@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Type, get_args
 from pydantic import BaseModel
 
 
@@ -19,13 +19,56 @@ class GoogleEventAttendee(BaseModel):
     email: str
     displayName: Optional[str] = None
     responseStatus: Optional[str] = None    
+    self: Optional[bool] = None  # True on the attendee entry of the calendar's owner
 
 # Base DTO
 class GoogleEvent(BaseModel):
     id: str
+    etag: Optional[str] = None
     summary: Optional[str] = None
     description: Optional[str] = None
     start: GoogleEventDateTime
     end: GoogleEventDateTime
     location: Optional[str] = None
     attendees: Optional[List[GoogleEventAttendee]] = None
+    transparency: Optional[str] = None  # "transparent" when the event is marked as free
+
+class GoogleEventListItem(GoogleEvent):
+    """Event as returned by events.list for sync and local recurrence expansion."""
+    status: Optional[str] = None
+    recurrence: Optional[List[str]] = None
+    recurringEventId: Optional[str] = None
+    originalStartTime: Optional[GoogleEventDateTime] = None
+
+class GoogleCalendar(BaseModel):
+    id: str
+    summary: Optional[str] = None
+    primary: bool = False
+    selected: bool = False
+    accessRole: Optional[str] = None
+    timeZone: Optional[str] = None
+
+
+# Partial response helpers
+def fields_mask(model: Type[BaseModel]) -> str:
+    """Build a Google partial-response mask (fields=) from a pydantic model, recursing into nested models."""
+    parts = []
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        parts.append(f"{name}({fields_mask(nested)})" if nested else name)
+    return ",".join(parts)
+
+def _nested_model(annotation) -> Optional[Type[BaseModel]]:
+    """Return the BaseModel inside Optional[...] / List[...] annotations, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        nested = _nested_model(arg)
+        if nested:
+            return nested
+    return None
+
+EVENT_FIELDS = fields_mask(GoogleEvent)
+EVENT_LIST_FIELDS = f"items({EVENT_FIELDS}),nextPageToken"
+EVENT_SYNC_FIELDS = f"items({fields_mask(GoogleEventListItem)}),nextPageToken,nextSyncToken"
+CALENDAR_LIST_FIELDS = f"items({fields_mask(GoogleCalendar)}),nextPageToken"
@@ -1,10 +1,29 @@
-from pydantic import BaseModel
+from typing import List, Literal
+from pydantic import BaseModel, Field
 
 
+class AssistantToolCall(BaseModel):
+    """Single tool call requested by a run."""
+    id: str
+    name: str
+    arguments: dict = Field(default_factory=dict)
+
 class AssistantOutput(BaseModel):
-    """Normalized assistant response: either plain text or a tool invocation."""
+    """Normalized assistant response: either plain text or the tool invocations a run is waiting on."""
+    text: str | None = None
+    run_id: str | None = None
+    tool_calls: List[AssistantToolCall] | None = None
+
+class AssistantStreamEvent(BaseModel):
+    """Incremental assistant output sent to the client as one Server-Sent Event."""
+    event: Literal["started", "token", "tool_call", "tool_result", "requires_action", "done", "error"]
     text: str | None = None
     run_id: str | None = None
-    tool_call_id: str | None = None
     tool_name: str | None = None
-    arguments: dict | None = None    
+    arguments: dict | None = None
+    tool_calls: List[AssistantToolCall] | None = None
+
+# Commands (inputs / intents)
+class AssistantMessageCommand(BaseModel):
+    """Command for sending a message to the assistant."""
+    message: str = Field(..., min_length=1)
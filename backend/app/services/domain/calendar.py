@@ -0,0 +1,48 @@
+import logging
+from typing import List
+from uuid import UUID
+from cachetools import TTLCache
+
+from app.core.config import CALENDAR_LIST_CACHE_TTL
+from app.schemas.external.google import GoogleCalendar
+from app.services.domain.credential import CredentialService
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.system.exceptions import InternalError
+
+
+logger = logging.getLogger(__name__)
+
+class CalendarService:
+    """Service class for discovering the calendars of a user."""
+
+    _cache: TTLCache = TTLCache(maxsize=1024, ttl=CALENDAR_LIST_CACHE_TTL)
+
+    @classmethod
+    async def list_calendars(cls, user_id: UUID) -> List[GoogleCalendar]:
+        """Return the user's calendar list, cached for CALENDAR_LIST_CACHE_TTL seconds."""
+        calendars = cls._cache.get(user_id)
+        if calendars is not None:
+            return calendars
+        try:
+            creds = await CredentialService.get_fresh_creds(user_id)
+            calendars = await GoogleCalendarClient.list_calendars(creds)
+            cls._cache[user_id] = calendars
+            return calendars
+        except InternalError:
+            raise
+        except Exception:
+            logger.exception(f"LOGGER:Failed to list calendars for user_id={user_id}")
+            raise InternalError("Failed to list calendars")
+
+    @classmethod
+    async def list_calendar_ids(cls, user_id: UUID) -> List[str]:
+        """Return ids of the calendars shown to the user; the primary calendar is always 'primary'."""
+        calendars = await cls.list_calendars(user_id)
+        ids = ["primary"]
+        ids.extend(c.id for c in calendars if c.selected and not c.primary)
+        return ids
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        """Forget the cached calendar list of a user."""
+        cls._cache.pop(user_id, None)
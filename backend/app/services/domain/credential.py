@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Optional
+from uuid import UUID
+from cachetools import LRUCache
+from google.oauth2.credentials import Credentials
+
+from app.core.config import GOOGLE_CREDS_CACHE_SIZE, GOOGLE_CREDS_RENEW_AHEAD, GOOGLE_CREDS_RENEW_INTERVAL
+from app.repository.token import TokenRepository
+from app.services.external.google import GoogleAuthService
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.external.google_scheduler import RequestPriorityEnum, request_priority
+from app.services.system.exceptions import InternalError
+
+
+logger = logging.getLogger(__name__)
+
+# Credentials closer than this to expiry are refreshed on the request path
+REQUEST_REFRESH_MARGIN = 60
+
+class CredentialService:
+    """Service class for resolving Google credentials of a user with an in-process cache."""
+
+    _cache: LRUCache = LRUCache(maxsize=GOOGLE_CREDS_CACHE_SIZE)
+    _inflight: Dict[UUID, asyncio.Task] = {}
+
+    @classmethod
+    async def get_fresh_creds(cls, user_id: UUID) -> Credentials:
+        """Return valid credentials for the user, loading or refreshing them at most once concurrently."""
+        creds = cls._cache.get(user_id)
+        if creds is not None and not cls._expires_within(creds, REQUEST_REFRESH_MARGIN):
+            return creds
+        return await cls._load(user_id, REQUEST_REFRESH_MARGIN)
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        """Forget cached credentials, e.g. after the user reconnected the calendar."""
+        cls._cache.pop(user_id, None)
+
+    @classmethod
+    async def run(cls) -> None:
+        """Background loop refreshing cached credentials shortly before they expire."""
+        request_priority.set(RequestPriorityEnum.background)
+        while True:
+            await asyncio.sleep(GOOGLE_CREDS_RENEW_INTERVAL)
+            for user_id, creds in list(cls._cache.items()):
+                if not cls._expires_within(creds, GOOGLE_CREDS_RENEW_AHEAD):
+                    continue
+                try:
+                    await cls._load(user_id, GOOGLE_CREDS_RENEW_AHEAD)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # Drop the entry so the next request goes through the regular path
+                    logger.warning(f" Background credential renewal failed for user {user_id}")
+                    cls.invalidate(user_id)
+
+    # Private implementation methods
+    @classmethod
+    async def _load(cls, user_id: UUID, margin: int) -> Credentials:
+        """Join the in-flight load for the user or start one."""
+        task = cls._inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(cls._load_and_refresh(user_id, margin))
+            cls._inflight[user_id] = task
+            task.add_done_callback(lambda _: cls._inflight.pop(user_id, None))
+        # Shield so a cancelled caller does not cancel the refresh for everyone else
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _load_and_refresh(cls, user_id: UUID, margin: int) -> Credentials:
+        """Read the stored token, refresh it if needed and write it back once."""
+        try:
+            token = await TokenRepository.retrieve_by_user_id(user_id)
+            if not token:
+                raise InternalError("Token not found")
+            creds = GoogleAuthService.build_creds(token)
+            if creds.refresh_token and cls._expires_within(creds, margin):
+                await GoogleCalendarClient.refresh_creds(creds)
+                token.access_token = creds.token
+                token.expiry = creds.expiry.replace(tzinfo=timezone.utc)
+                await TokenRepository.update(token)
+            cls._cache[user_id] = creds
+            return creds
+        except InternalError:
+            cls.invalidate(user_id)
+            raise
+        except Exception:
+            cls.invalidate(user_id)
+            logger.exception(f"LOGGER:Failed to get fresh credentials for user_id={user_id}")
+            raise InternalError("Failed to get fresh credentials for user")
+
+    @staticmethod
+    def _expires_within(creds: Credentials, seconds: int) -> bool:
+        """Whether credentials expire within the given number of seconds (expiry is naive UTC)."""
+        expiry: Optional[datetime] = creds.expiry
+        if expiry is None:
+            return False
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return expiry - now < timedelta(seconds=seconds)
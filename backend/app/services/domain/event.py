@@ -1,57 +1,154 @@
+import asyncio
+import heapq
+import itertools
 import logging
-from datetime import datetime, timezone
+from contextlib import aclosing
+from datetime import datetime, timedelta
 from uuid import UUID
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
+from urllib.parse import quote
+from cachetools import LRUCache
 from google.oauth2.credentials import Credentials
 
-from app.repository.token import TokenRepository
-from app.services.system.exceptions import InternalError
-from app.services.external.google import GoogleEventService, GoogleAuthService
-from app.schemas.domain.event import EventCreateCommand, EventDTO, EventListCommand, EventUpdateCommand
-from app.schemas.external.google import GoogleEvent
+from app.core.config import CALENDAR_EVENT_CACHE_SIZE, CALENDAR_FANOUT_CONCURRENCY, CALENDAR_LOCAL_RECURRENCE
+from app.repository.event import EventRepository
+from app.services.domain.calendar import CalendarService
+from app.services.domain.credential import CredentialService
+from app.services.domain.event_converter import EventConverter
+from app.services.domain.event_window import EventWindow
+from app.services.domain.recurrence import RecurrenceExpander
+from app.services.intergration.calendar_sync import CalendarSyncService
+from app.services.system.exceptions import InternalError, TooManyRequestsError
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.schemas.domain.event import (
+    EventBatchCommand,
+    EventBatchOperationEnum,
+    EventBatchResultDTO,
+    EventCreateCommand,
+    EventDTO,
+    EventListCommand,
+    EventStreamCommand,
+    EventUpdateCommand,
+)
+from app.schemas.external.google import GoogleEvent, EVENT_FIELDS
 
 logger = logging.getLogger(__name__)
 
+# Largest gap between an all-day event's UTC midnight and its calendar's local midnight (UTC+14 / UTC-12)
+ALL_DAY_SKEW = timedelta(hours=14)
+
 
 class EventService:
     """Service class for managing event operations."""
 
+    # (user_id, calendar_id, event_id) -> (etag, EventDTO) for conditional single-event reads
+    _event_cache: LRUCache = LRUCache(maxsize=CALENDAR_EVENT_CACHE_SIZE)
+
     @classmethod
     async def list_events(cls, user_id: UUID, command: EventListCommand) -> List[EventDTO]:
         try:
-            creds = await cls._get_fresh_creds_for_user(user_id)
-            events = GoogleEventService.list_events(creds, command.limit, command.start_dt, command.end_dt, order_by="startTime")
-            return [await cls._convert_to_dto(e) for e in events]
+            # Fan out over the user's calendars, bounded, and merge the sorted per-calendar results
+            calendar_ids = command.calendar_ids or await CalendarService.list_calendar_ids(user_id)
+            semaphore = asyncio.Semaphore(CALENDAR_FANOUT_CONCURRENCY)
+
+            async def list_bounded(calendar_id: str) -> List[EventDTO]:
+                async with semaphore:
+                    events = await cls._list_calendar_events(user_id, calendar_id, command)
+                # heapq.merge needs inputs sorted by its key; Google orders all-day events by the calendar's local midnight
+                return sorted(events, key=lambda e: e.start_dt)
+
+            per_calendar = await asyncio.gather(*(list_bounded(c) for c in calendar_ids))
+            merged = heapq.merge(*per_calendar, key=lambda e: e.start_dt)
+            # The same event can sit on several calendars (e.g. invitations)
+            seen = set()
+            events = []
+            for event in merged:
+                if event.id in seen:
+                    continue
+                seen.add(event.id)
+                events.append(event)
+                if len(events) >= command.limit:
+                    break
+            return events
+        except TooManyRequestsError:
+            raise
         except Exception:
             logger.exception("Failed to list events")
             raise InternalError("Failed to list events")
 
     @classmethod
-    async def get_event(cls, user_id: UUID, event_id: str) -> EventDTO:
+    async def iter_events(cls, user_id: UUID, command: EventStreamCommand) -> AsyncIterator[EventDTO]:
+        """Yield events of the user's calendars merged by start time, page by page so memory stays bounded by the page size."""
+        calendar_ids = command.calendar_ids or await CalendarService.list_calendar_ids(user_id)
+        streams = [cls._iter_calendar_events(user_id, c, command) for c in calendar_ids]
+        # The same event can sit on several calendars (e.g. invitations)
+        seen = set()
+        async with aclosing(cls._merge_streams(streams)) as merged:
+            async for event in merged:
+                if event.id in seen:
+                    continue
+                seen.add(event.id)
+                yield event
+                if command.limit and len(seen) >= command.limit:
+                    return
+
+    @classmethod
+    async def get_event_window(cls, user_id: UUID, start_dt: datetime, end_dt: datetime, calendar_ids: Optional[List[str]] = None, busy_only: bool = False) -> EventWindow:
+        """Load every event of a window into a compact EventWindow for internal analytics and free/busy callers.
+
+        With busy_only, keep only events Google free/busy counts as busy: timed, not marked free and not declined.
+        """
+        try:
+            calendar_ids = calendar_ids or await CalendarService.list_calendar_ids(user_id)
+            semaphore = asyncio.Semaphore(CALENDAR_FANOUT_CONCURRENCY)
+
+            async def load_bounded(calendar_id: str) -> EventWindow:
+                async with semaphore:
+                    return await cls._load_calendar_window(user_id, calendar_id, start_dt, end_dt, busy_only)
+
+            return EventWindow.merge(await asyncio.gather(*(load_bounded(c) for c in calendar_ids)))
+        except TooManyRequestsError:
+            raise
+        except Exception:
+            logger.exception("Failed to load event window")
+            raise InternalError("Failed to load event window")
+
+    @classmethod
+    async def get_event(cls, user_id: UUID, event_id: str, calendar_id: str = "primary") -> EventDTO:
         try:
             creds = await cls._get_fresh_creds_for_user(user_id)
-            event = GoogleEventService.get_event(creds, event_id)
-            return await cls._convert_to_dto(event)
+            # Revalidate a cached copy with its etag: unchanged events come back as an empty 304
+            cached = cls._event_cache.get((user_id, calendar_id, event_id))
+            event = await GoogleCalendarClient.get_event(creds, event_id, etag=cached[0] if cached else None, calendar_id=calendar_id)
+            if event is None:
+                return cached[1]
+            return await cls._cache_event(user_id, event, calendar_id)
+        except TooManyRequestsError:
+            raise
         except Exception:
             logger.exception("Failed to get event")
             raise InternalError("Failed to get event")
 
     @classmethod
-    async def create_event(cls, user_id: UUID, command: EventCreateCommand) -> EventDTO:
+    async def create_event(cls, user_id: UUID, command: EventCreateCommand, calendar_id: str = "primary") -> EventDTO:
         try:
             creds = await cls._get_fresh_creds_for_user(user_id)    
-            event = GoogleEventService.create_event(creds, command.model_dump(exclude_none=True))
-            return await cls._convert_to_dto(event)
+            event = await GoogleCalendarClient.create_event(creds, command.model_dump(exclude_none=True), calendar_id)
+            await CalendarSyncService.apply_event(user_id, event, calendar_id)
+            return await cls._cache_event(user_id, event, calendar_id)
+        except TooManyRequestsError:
+            raise
         except Exception:
             logger.exception("Failed to create event")
             raise InternalError("Failed to create event")
 
     @classmethod
-    async def update_event(cls, user_id: UUID, event_id: str, command: EventUpdateCommand) -> EventDTO:
+    async def update_event(cls, user_id: UUID, event_id: str, command: EventUpdateCommand, calendar_id: str = "primary") -> EventDTO:
         try:
             creds = await cls._get_fresh_creds_for_user(user_id)
-            event = GoogleEventService.update_event(creds, event_id, command.model_dump(exclude_none=True))
-            return await cls._convert_to_dto(event)
+            event = await GoogleCalendarClient.update_event(creds, event_id, command.model_dump(exclude_none=True), calendar_id)
+            await CalendarSyncService.apply_event(user_id, event, calendar_id)
+            return await cls._cache_event(user_id, event, calendar_id)
         except InternalError:
             raise
         except Exception:
@@ -59,49 +156,177 @@ class EventService:
             raise InternalError("Failed to update event")
 
     @classmethod
-    async def delete_event(cls, user_id: UUID, event_id: str) -> bool:
+    async def delete_event(cls, user_id: UUID, event_id: str, calendar_id: str = "primary") -> bool:
         try:
             creds = await cls._get_fresh_creds_for_user(user_id)
-            return GoogleEventService.delete_event(creds, event_id)
+            cls._event_cache.pop((user_id, calendar_id, event_id), None)
+            deleted = await GoogleCalendarClient.delete_event(creds, event_id, calendar_id)
+            await CalendarSyncService.remove_event(user_id, event_id, calendar_id)
+            return deleted
+        except TooManyRequestsError:
+            raise
         except Exception:
             logger.exception("Failed to delete event")
             raise InternalError("Failed to delete event")
 
-    @staticmethod
-    async def _convert_to_dto(event: GoogleEvent) -> EventDTO:
-        try:
-            def parse_google_dt(gdt):
-                if getattr(gdt, "dateTime", None):
-                    return gdt.dateTime
-                return datetime.fromisoformat(gdt.date).replace(tzinfo=timezone.utc)
-
-            return EventDTO(
-                id=event.id,
-                title=event.summary,
-                description=event.description,
-                start_dt=parse_google_dt(event.start),
-                end_dt=parse_google_dt(event.end),
-                location=event.location,
-                attendees=[a.email for a in (event.attendees or [])],
-            )
-        except Exception:
-            logger.exception("Failed to convert Google event to API event")
-            raise InternalError("Failed to convert Google event to API event")
-
     @classmethod
-    async def _get_fresh_creds_for_user(cls, user_id: UUID) -> Credentials:
+    async def batch(cls, user_id: UUID, command: EventBatchCommand) -> List[EventBatchResultDTO]:
+        """Run create/update/delete operations through Google batch requests and report each item."""
         try:
-            token = await TokenRepository.retrieve_by_user_id(user_id)
-            if not token:
-                raise InternalError("Token not found")
-            creds = GoogleAuthService.get_fresh_creds(token)
-            if creds.token != token.access_token or creds.expiry != token.expiry:
-                token.access_token = creds.token
-                token.expiry = creds.expiry
-                await TokenRepository.update(token)
-            return creds
+            creds = await cls._get_fresh_creds_for_user(user_id)
+            fields = quote(EVENT_FIELDS, safe="")
+            calls = []
+            for item in command.items:
+                if item.operation == EventBatchOperationEnum.create:
+                    body = GoogleCalendarClient.build_event_body(item.create.model_dump(exclude_none=True))
+                    calls.append(("POST", f"{GoogleCalendarClient.event_path(item.calendar_id)}?fields={fields}", body))
+                elif item.operation == EventBatchOperationEnum.update:
+                    body = GoogleCalendarClient.build_event_body(item.update.model_dump(exclude_none=True))
+                    calls.append(("PATCH", f"{GoogleCalendarClient.event_path(item.calendar_id, item.event_id)}?fields={fields}", body))
+                else:
+                    calls.append(("DELETE", GoogleCalendarClient.event_path(item.calendar_id, item.event_id), None))
+            responses = await GoogleCalendarClient.batch(creds, calls)
+
+            results = []
+            for index, (item, (status_code, body)) in enumerate(zip(command.items, responses)):
+                if status_code >= 400:
+                    error = body.get("error", {}) if isinstance(body, dict) else {}
+                    message = error.get("message") if isinstance(error, dict) else str(error)
+                    results.append(EventBatchResultDTO(index=index, success=False, status_code=status_code, error=message or "Request failed"))
+                    continue
+                if item.operation == EventBatchOperationEnum.delete:
+                    cls._event_cache.pop((user_id, item.calendar_id, item.event_id), None)
+                    await CalendarSyncService.remove_event(user_id, item.event_id, item.calendar_id)
+                    results.append(EventBatchResultDTO(index=index, success=True, status_code=status_code))
+                    continue
+                event = GoogleEvent.model_validate(body)
+                await CalendarSyncService.apply_event(user_id, event, item.calendar_id)
+                results.append(EventBatchResultDTO(index=index, success=True, status_code=status_code, event=await cls._cache_event(user_id, event, item.calendar_id)))
+            return results
         except InternalError:
             raise
         except Exception:
-            logger.exception("Failed to get fresh credentials for user")
-            raise InternalError("Failed to get fresh credentials for user")
+            logger.exception("Failed to run event batch")
+            raise InternalError("Failed to run event batch")
+
+    @classmethod
+    async def _cache_event(cls, user_id: UUID, event: GoogleEvent, calendar_id: str = "primary") -> EventDTO:
+        """Convert an event and remember it with its etag; events without an etag are evicted."""
+        dto = EventConverter.from_google_event(event, calendar_id)
+        key = (user_id, calendar_id, event.id)
+        if event.etag:
+            cls._event_cache[key] = (event.etag, dto)
+        else:
+            cls._event_cache.pop(key, None)
+        return dto
+
+    @classmethod
+    async def _list_calendar_events(cls, user_id: UUID, calendar_id: str, command: EventListCommand) -> List[EventDTO]:
+        """List one calendar's window, sorted by start time, from the mirror or live."""
+        # Serve from the local mirror once it has been fully loaded
+        state = await CalendarSyncService.get_state(user_id, calendar_id)
+        if CalendarSyncService.is_ready(state):
+            if not CalendarSyncService.is_fresh(state):
+                creds = await cls._get_fresh_creds_for_user(user_id)
+                await CalendarSyncService.sync_calendar(user_id, creds, calendar_id)
+            rows = await EventRepository.list_window(user_id, command.start_dt, command.end_dt, command.limit, calendar_id)
+            return [EventConverter.from_row(r) for r in rows]
+
+        # Mirror not loaded yet: answer live and start the full load in the background
+        creds = await cls._get_fresh_creds_for_user(user_id)
+        CalendarSyncService.schedule_sync(user_id, creds, calendar_id)
+        if CALENDAR_LOCAL_RECURRENCE and command.start_dt and command.end_dt:
+            # Fetch recurring masters once and expand them here instead of paging through every occurrence
+            items = await GoogleCalendarClient.list_raw_events(creds, command.start_dt, command.end_dt, calendar_id)
+            return RecurrenceExpander.expand(items, command.start_dt, command.end_dt, calendar_id)[:command.limit]
+        items = await GoogleCalendarClient.list_event_items(creds, command.limit, command.start_dt, command.end_dt, order_by="startTime", calendar_id=calendar_id)
+        return EventConverter.from_google_items(items, calendar_id)
+
+    @classmethod
+    async def _iter_calendar_events(cls, user_id: UUID, calendar_id: str, command: EventStreamCommand) -> AsyncIterator[EventDTO]:
+        """Stream one calendar's window in start_dt order, from the mirror or live."""
+        state = await CalendarSyncService.get_state(user_id, calendar_id)
+        if CalendarSyncService.is_ready(state):
+            if not CalendarSyncService.is_fresh(state):
+                creds = await cls._get_fresh_creds_for_user(user_id)
+                await CalendarSyncService.sync_calendar(user_id, creds, calendar_id)
+            async for row in EventRepository.stream_window(user_id, command.start_dt, command.end_dt, command.limit, calendar_id=calendar_id):
+                yield EventConverter.from_row(row)
+            return
+
+        creds = await cls._get_fresh_creds_for_user(user_id)
+        CalendarSyncService.schedule_sync(user_id, creds, calendar_id)
+        # Google orders all-day events by the calendar's local midnight while EventDTO puts them at UTC midnight,
+        # so hold events back until no later page can sort before them
+        pending: List[Tuple[datetime, int, EventDTO]] = []
+        order = itertools.count()
+        watermark = None
+        pages = GoogleCalendarClient.iter_event_pages(creds, command.limit, command.start_dt, command.end_dt, order_by="startTime", calendar_id=calendar_id)
+        async for page in pages:
+            all_day = {i["id"] for i in page if "date" in (i.get("start") or {})}
+            for event in EventConverter.from_google_items(page, calendar_id):
+                heapq.heappush(pending, (event.start_dt, next(order), event))
+                google_key = event.start_dt - ALL_DAY_SKEW if event.id in all_day else event.start_dt
+                watermark = google_key if watermark is None else max(watermark, google_key)
+            while pending and pending[0][0] <= watermark - ALL_DAY_SKEW:
+                yield heapq.heappop(pending)[2]
+        while pending:
+            yield heapq.heappop(pending)[2]
+
+    @staticmethod
+    async def _merge_streams(streams: List[AsyncIterator[EventDTO]]) -> AsyncIterator[EventDTO]:
+        """Merge per-calendar streams already sorted by start_dt, keeping one event per stream in memory."""
+        try:
+            heads = await asyncio.gather(*(anext(s, None) for s in streams))
+            heap = [(event.start_dt, i, event) for i, event in enumerate(heads) if event is not None]
+            heapq.heapify(heap)
+            while heap:
+                _, i, event = heapq.heappop(heap)
+                yield event
+                following = await anext(streams[i], None)
+                if following is not None:
+                    heapq.heappush(heap, (following.start_dt, i, following))
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+    @classmethod
+    async def _load_calendar_window(cls, user_id: UUID, calendar_id: str, start_dt: datetime, end_dt: datetime, busy_only: bool = False) -> EventWindow:
+        """Load one calendar's window, streaming mirror rows into the columns instead of materializing them."""
+        state = await CalendarSyncService.get_state(user_id, calendar_id)
+        if CalendarSyncService.is_ready(state):
+            if not CalendarSyncService.is_fresh(state):
+                creds = await cls._get_fresh_creds_for_user(user_id)
+                await CalendarSyncService.sync_calendar(user_id, creds, calendar_id)
+            window = EventWindow()
+            async for row in EventRepository.stream_window(user_id, start_dt, end_dt, calendar_id=calendar_id):
+                if not busy_only or cls._blocks_time(row.all_day, row.transparency, row.response_status):
+                    window.append_row(row)
+            return window
+
+        creds = await cls._get_fresh_creds_for_user(user_id)
+        CalendarSyncService.schedule_sync(user_id, creds, calendar_id)
+        if CALENDAR_LOCAL_RECURRENCE:
+            items = await GoogleCalendarClient.list_raw_events(creds, start_dt, end_dt, calendar_id)
+            if busy_only:
+                items = [i for i in items if cls._item_blocks_time(i)]
+            return EventWindow.from_events(RecurrenceExpander.expand(items, start_dt, end_dt, calendar_id))
+        items = await GoogleCalendarClient.list_event_items(creds, None, start_dt, end_dt, order_by="startTime", calendar_id=calendar_id)
+        if busy_only:
+            items = [i for i in items if cls._item_blocks_time(i)]
+        return EventWindow.from_events(EventConverter.from_google_items(items, calendar_id))
+
+    @staticmethod
+    def _blocks_time(all_day: bool, transparency: Optional[str], response_status: Optional[str]) -> bool:
+        """Whether Google free/busy counts an event as busy; all-day events are transparent there by default."""
+        return not all_day and transparency != "transparent" and response_status != "declined"
+
+    @classmethod
+    def _item_blocks_time(cls, item: dict) -> bool:
+        """_blocks_time for a raw events.list item."""
+        response_status = next((a.get("responseStatus") for a in item.get("attendees") or () if a.get("self")), None)
+        return cls._blocks_time("date" in (item.get("start") or {}), item.get("transparency"), response_status)
+
+    @classmethod
+    async def _get_fresh_creds_for_user(cls, user_id: UUID) -> Credentials:
+        return await CredentialService.get_fresh_creds(user_id)
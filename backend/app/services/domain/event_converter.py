@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from pydantic import TypeAdapter
+
+from app.orm.event import EventOrm
+from app.schemas.domain.event import EventDTO
+from app.schemas.external.google import GoogleEvent, GoogleEventDateTime
+
+
+# Built once: constructing a TypeAdapter compiles a validator
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventDTO])
+
+class EventConverter:
+    """Converts Google payloads and mirror rows to EventDTO without validating the same data twice."""
+
+    @staticmethod
+    def from_google_items(items: Iterable[dict], calendar_id: Optional[str] = "primary") -> List[EventDTO]:
+        """Validate raw events.list items straight into EventDTOs in a single pass."""
+        rows = []
+        for item in items:
+            start, end = item.get("start"), item.get("end")
+            if not start or not end:
+                # Cancelled instances carry no times
+                continue
+            rows.append({
+                "id": item["id"],
+                "title": item.get("summary"),
+                "description": item.get("description"),
+                "start_dt": start.get("dateTime") or f"{start['date']}T00:00:00Z",
+                "end_dt": end.get("dateTime") or f"{end['date']}T00:00:00Z",
+                "location": item.get("location"),
+                "attendees": [a["email"] for a in item.get("attendees") or () if a.get("email")],
+                "calendar_id": calendar_id,
+            })
+        return _EVENT_LIST_ADAPTER.validate_python(rows)
+
+    @staticmethod
+    def from_google_event(event: GoogleEvent, calendar_id: Optional[str] = "primary") -> EventDTO:
+        """Build an EventDTO from an already validated GoogleEvent."""
+        return EventDTO.model_construct(
+            id=event.id,
+            title=event.summary,
+            description=event.description,
+            start_dt=EventConverter.parse_google_dt(event.start),
+            end_dt=EventConverter.parse_google_dt(event.end),
+            location=event.location,
+            attendees=[a.email for a in (event.attendees or [])],
+            calendar_id=calendar_id,
+        )
+
+    @staticmethod
+    def from_row(row: EventOrm) -> EventDTO:
+        """Build an EventDTO from a mirror row, whose columns are already typed."""
+        return EventDTO.model_construct(
+            id=row.google_id,
+            title=row.summary,
+            description=row.description,
+            start_dt=row.start_dt,
+            end_dt=row.end_dt,
+            location=row.location,
+            attendees=row.attendees or [],
+            calendar_id=row.calendar_id,
+        )
+
+    @staticmethod
+    def parse_google_dt(gdt: GoogleEventDateTime) -> datetime:
+        """Return a timezone-aware datetime (all-day dates at UTC midnight)."""
+        if gdt.dateTime:
+            return gdt.dateTime
+        return datetime.fromisoformat(gdt.date).replace(tzinfo=timezone.utc)
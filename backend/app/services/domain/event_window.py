@@ -0,0 +1,181 @@
+import heapq
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional, Tuple, overload
+
+from app.orm.event import EventOrm
+from app.schemas.domain.event import EventDTO
+
+
+Interval = Tuple[datetime, datetime]
+
+def _epoch(dt: datetime) -> int:
+    return int(dt.timestamp())
+
+def _from_epoch(ts: int) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+class EventWindow:
+    """Columnar, memory-compact set of events: epoch-second start/end arrays plus interned string columns.
+
+    Events are kept sorted by start; EventDTOs are only built when an item is accessed.
+    """
+
+    __slots__ = ("_starts", "_ends", "_ids", "_titles", "_descriptions", "_locations", "_attendees", "_calendar_ids")
+
+    def __init__(self):
+        self._starts = array("q")
+        self._ends = array("q")
+        self._ids: List[str] = []
+        self._titles: List[Optional[str]] = []
+        self._descriptions: List[Optional[str]] = []
+        self._locations: List[Optional[str]] = []
+        self._attendees: List[Tuple[str, ...]] = []
+        self._calendar_ids: List[Optional[str]] = []
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[EventOrm]) -> "EventWindow":
+        """Build a window from mirror rows ordered by start time."""
+        window = cls()
+        for row in rows:
+            window.append_row(row)
+        return window
+
+    @classmethod
+    def from_events(cls, events: Iterable[EventDTO]) -> "EventWindow":
+        """Build a window from EventDTOs in any order."""
+        window = cls()
+        # Google puts all-day events ahead of timed ones regardless of start, and expanded series arrive per master
+        for e in sorted(events, key=lambda e: _epoch(e.start_dt)):
+            window.append(e.id, e.start_dt, e.end_dt, e.title, e.description, e.location, e.attendees, e.calendar_id)
+        return window
+
+    @classmethod
+    def merge(cls, windows: Iterable["EventWindow"]) -> "EventWindow":
+        """Merge windows by start time, keeping the first copy of events present in several."""
+        windows = list(windows)
+        merged = cls()
+        seen = set()
+        positions = ([(w, i) for i in range(len(w))] for w in windows)
+        for w, i in heapq.merge(*positions, key=lambda p: p[0]._starts[p[1]]):
+            if w._ids[i] in seen:
+                continue
+            seen.add(w._ids[i])
+            for column in cls.__slots__:
+                getattr(merged, column).append(getattr(w, column)[i])
+        return merged
+
+    def append(self, id: str, start_dt: datetime, end_dt: datetime, title: Optional[str] = None, description: Optional[str] = None, location: Optional[str] = None, attendees: Optional[Iterable[str]] = None, calendar_id: Optional[str] = None) -> None:
+        """Add an event; it must not start before the last one added."""
+        start = _epoch(start_dt)
+        if self._starts and start < self._starts[-1]:
+            raise ValueError("Events must be appended in start order")
+        self._starts.append(start)
+        self._ends.append(_epoch(end_dt))
+        self._ids.append(id)
+        self._titles.append(_intern(title))
+        self._descriptions.append(description)
+        self._locations.append(_intern(location))
+        self._attendees.append(tuple(_intern(a) for a in attendees or ()))
+        self._calendar_ids.append(_intern(calendar_id))
+
+    def append_row(self, row: EventOrm) -> None:
+        """Add a mirror row."""
+        self.append(row.google_id, row.start_dt, row.end_dt, row.summary, row.description, row.location, row.attendees, row.calendar_id)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> EventDTO: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[EventDTO]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._to_dto(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EventWindow index out of range")
+        return self._to_dto(index)
+
+    def __iter__(self) -> Iterator[EventDTO]:
+        for i in range(len(self)):
+            yield self._to_dto(i)
+
+    def overlapping(self, start_dt: datetime, end_dt: datetime) -> List[int]:
+        """Indices of events overlapping [start_dt, end_dt)."""
+        start, end = _epoch(start_dt), _epoch(end_dt)
+        return [i for i, (s, e) in enumerate(zip(self._starts, self._ends)) if s < end and e > start]
+
+    def busy(self, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None) -> List[Interval]:
+        """Union of event intervals, clipped to the optional bounds."""
+        return [(_from_epoch(s), _from_epoch(e)) for s, e in self._merged(start_dt, end_dt)]
+
+    def gaps(self, start_dt: datetime, end_dt: datetime, min_duration: timedelta = timedelta(0)) -> List[Interval]:
+        """Free intervals of at least min_duration within [start_dt, end_dt)."""
+        min_seconds = int(min_duration.total_seconds())
+        cursor, end = _epoch(start_dt), _epoch(end_dt)
+        gaps = []
+        for s, e in self._merged(start_dt, end_dt):
+            if s - cursor >= max(min_seconds, 1):
+                gaps.append((_from_epoch(cursor), _from_epoch(s)))
+            cursor = max(cursor, e)
+        if end - cursor >= max(min_seconds, 1):
+            gaps.append((_from_epoch(cursor), _from_epoch(end)))
+        return gaps
+
+    def total_duration(self, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, merge_overlaps: bool = False) -> timedelta:
+        """Sum of event durations clipped to the bounds; with merge_overlaps, time covered by several events counts once."""
+        if merge_overlaps:
+            return timedelta(seconds=sum(e - s for s, e in self._merged(start_dt, end_dt)))
+        lo = _epoch(start_dt) if start_dt else None
+        hi = _epoch(end_dt) if end_dt else None
+        total = 0
+        for s, e in zip(self._starts, self._ends):
+            if lo is not None and s < lo:
+                s = lo
+            if hi is not None and e > hi:
+                e = hi
+            if e > s:
+                total += e - s
+        return timedelta(seconds=total)
+
+    # Private implementation methods
+    def _merged(self, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> Iterator[Tuple[int, int]]:
+        """Yield disjoint (start, end) epoch pairs covering the events, clipped to the bounds."""
+        lo = _epoch(start_dt) if start_dt else None
+        hi = _epoch(end_dt) if end_dt else None
+        current: Optional[List[int]] = None
+        # Starts are sorted, so one pass merges everything
+        for s, e in zip(self._starts, self._ends):
+            if lo is not None and s < lo:
+                s = lo
+            if hi is not None and e > hi:
+                e = hi
+            if e <= s:
+                continue
+            if current and s <= current[1]:
+                current[1] = max(current[1], e)
+                continue
+            if current:
+                yield current[0], current[1]
+            current = [s, e]
+        if current:
+            yield current[0], current[1]
+
+    def _to_dto(self, i: int) -> EventDTO:
+        return EventDTO.model_construct(
+            id=self._ids[i],
+            title=self._titles[i],
+            description=self._descriptions[i],
+            start_dt=_from_epoch(self._starts[i]),
+            end_dt=_from_epoch(self._ends[i]),
+            location=self._locations[i],
+            attendees=list(self._attendees[i]),
+            calendar_id=self._calendar_ids[i],
+        )
@@ -0,0 +1,131 @@
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from app.schemas.domain.freebusy import FreeSlotDTO, FreeSlotQueryCommand
+from app.services.domain.credential import CredentialService
+from app.services.domain.event import EventService
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.intergration.calendar_sync import CalendarSyncService
+from app.services.system.exceptions import InternalError
+
+
+logger = logging.getLogger(__name__)
+
+Interval = Tuple[datetime, datetime]
+
+class IntervalSet:
+    """Sorted set of disjoint half-open intervals; overlapping or touching inserts are merged."""
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def add(self, start: datetime, end: datetime) -> None:
+        """Insert an interval, merging it with every interval it overlaps or touches."""
+        if end <= start:
+            return
+        # Intervals in [i, j) overlap or touch [start, end)
+        i = bisect_left(self._ends, start)
+        j = bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def gaps(self, start: datetime, end: datetime) -> Iterator[Interval]:
+        """Yield the parts of [start, end) not covered by the set."""
+        cursor = start
+        for i in range(bisect_right(self._ends, start), len(self._starts)):
+            if self._starts[i] >= end:
+                break
+            if self._starts[i] > cursor:
+                yield cursor, self._starts[i]
+            cursor = max(cursor, self._ends[i])
+        if cursor < end:
+            yield cursor, end
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+class FreeBusyService:
+    """Service class for free/busy and free slot queries."""
+
+    @classmethod
+    async def get_busy(cls, user_id: UUID, command: FreeSlotQueryCommand) -> IntervalSet:
+        """Merge busy intervals of every requested calendar, preferring the local mirror."""
+        try:
+            busy = IntervalSet()
+            mirrored, remote = [], []
+            for calendar_id in command.calendar_ids:
+                state = await CalendarSyncService.get_state(user_id, calendar_id)
+                if CalendarSyncService.is_ready(state) and CalendarSyncService.is_fresh(state):
+                    mirrored.append(calendar_id)
+                else:
+                    remote.append(calendar_id)
+            if mirrored:
+                # Same rules as the freeBusy API: all-day, "free" and declined events do not block time
+                window = await EventService.get_event_window(user_id, command.start_dt, command.end_dt, mirrored, busy_only=True)
+                for start, end in window.busy(command.start_dt, command.end_dt):
+                    busy.add(start, end)
+            if remote:
+                creds = await CredentialService.get_fresh_creds(user_id)
+                calendars = await GoogleCalendarClient.query_freebusy(creds, command.start_dt, command.end_dt, remote)
+                for intervals in calendars.values():
+                    for start, end in intervals:
+                        busy.add(start, end)
+            return busy
+        except InternalError:
+            raise
+        except Exception:
+            logger.exception(f"LOGGER:Failed to get busy intervals for user_id={user_id}")
+            raise InternalError("Failed to get busy intervals")
+
+    @classmethod
+    async def find_free_slots(cls, user_id: UUID, command: FreeSlotQueryCommand) -> List[FreeSlotDTO]:
+        """Find free slots of at least duration_minutes inside working hours."""
+        try:
+            busy = await cls.get_busy(user_id, command)
+            duration = timedelta(minutes=command.duration_minutes)
+            slots = []
+            for window_start, window_end in cls._working_windows(command):
+                for start, end in busy.gaps(window_start, window_end):
+                    if end - start >= duration:
+                        slots.append(FreeSlotDTO(start_dt=start, end_dt=end))
+                        if len(slots) >= command.limit:
+                            return slots
+            return slots
+        except InternalError:
+            raise
+        except Exception:
+            logger.exception(f"LOGGER:Failed to find free slots for user_id={user_id}")
+            raise InternalError("Failed to find free slots")
+
+    # Private implementation methods
+    @staticmethod
+    def _working_windows(command: FreeSlotQueryCommand) -> Iterator[Interval]:
+        """Split the query window into per-day working-hours windows (UTC)."""
+        start = command.start_dt.astimezone(timezone.utc)
+        end = command.end_dt.astimezone(timezone.utc)
+        if command.working_hours_start is None:
+            yield start, end
+            return
+        tz = ZoneInfo(command.timezone)
+        day = start.astimezone(tz).date()
+        last_day = end.astimezone(tz).date()
+        while day <= last_day:
+            day_start = datetime.combine(day, command.working_hours_start, tz).astimezone(timezone.utc)
+            day_end = datetime.combine(day, command.working_hours_end, tz).astimezone(timezone.utc)
+            window_start, window_end = max(day_start, start), min(day_end, end)
+            if window_start < window_end:
+                yield window_start, window_end
+            day += timedelta(days=1)
@@ -0,0 +1,131 @@
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+from dateutil.rrule import rrulestr
+
+from app.schemas.domain.event import EventDTO
+from app.schemas.external.google import GoogleEvent, GoogleEventDateTime
+
+
+logger = logging.getLogger(__name__)
+
+_UNTIL = re.compile(r"UNTIL=(\d{8})(T\d{6})?(Z)?")
+
+class RecurrenceExpander:
+    """Expands recurring masters plus their exceptions into EventDTO occurrences within a window."""
+
+    @classmethod
+    def expand(cls, items: Iterable[dict], start_dt: datetime, end_dt: datetime, calendar_id: Optional[str] = None) -> List[EventDTO]:
+        """Expand a singleEvents=false events.list result into occurrences sorted by start time."""
+        start_dt = start_dt.astimezone(timezone.utc)
+        end_dt = end_dt.astimezone(timezone.utc)
+        masters: List[GoogleEvent] = []
+        recurrences: Dict[str, List[str]] = {}
+        # Original starts (UTC) of instances that were moved or cancelled, per master
+        overridden: Dict[str, Set[datetime]] = {}
+        events: List[EventDTO] = []
+
+        for item in items:
+            master_id = item.get("recurringEventId")
+            if master_id:
+                original = cls._parse_dt(GoogleEventDateTime.model_validate(item["originalStartTime"]))
+                overridden.setdefault(master_id, set()).add(original)
+                if item.get("status") != "cancelled":
+                    event = cls._to_dto(GoogleEvent.model_validate(item), calendar_id)
+                    if event.end_dt > start_dt and event.start_dt < end_dt:
+                        events.append(event)
+                continue
+            if item.get("status") == "cancelled":
+                continue
+            event = GoogleEvent.model_validate(item)
+            if item.get("recurrence"):
+                masters.append(event)
+                recurrences[event.id] = item["recurrence"]
+            else:
+                dto = cls._to_dto(event, calendar_id)
+                if dto.end_dt > start_dt and dto.start_dt < end_dt:
+                    events.append(dto)
+
+        for master in masters:
+            try:
+                events.extend(cls._occurrences(master, recurrences[master.id], start_dt, end_dt, overridden.get(master.id, set()), calendar_id))
+            except Exception:
+                # One malformed rule should not hide the rest of the calendar
+                logger.exception(f"LOGGER:Failed to expand recurrence of event {master.id}")
+
+        events.sort(key=lambda e: (e.start_dt, e.id))
+        return events
+
+    # Private implementation methods
+    @classmethod
+    def _occurrences(cls, master: GoogleEvent, recurrence: List[str], start_dt: datetime, end_dt: datetime, overridden: Set[datetime], calendar_id: Optional[str]) -> Iterable[EventDTO]:
+        """Yield occurrences of one master overlapping [start_dt, end_dt)."""
+        all_day = master.start.dateTime is None
+        first_start = cls._parse_dt(master.start)
+        duration = cls._parse_dt(master.end) - first_start
+        if all_day:
+            # All-day rules run on floating dates
+            dtstart = first_start.replace(tzinfo=None)
+            after, before = (start_dt - duration).replace(tzinfo=None), end_dt.replace(tzinfo=None)
+        else:
+            # Expand in the event's own zone so wall-clock times survive DST changes
+            tz = ZoneInfo(master.start.timeZone) if master.start.timeZone else timezone.utc
+            dtstart = first_start.astimezone(tz)
+            after, before = start_dt - duration, end_dt
+        lines = [cls._normalize_until(line, aware=not all_day) for line in recurrence]
+        ruleset = rrulestr("\n".join(lines), dtstart=dtstart, forceset=True)
+
+        for occurrence in ruleset.between(after, before, inc=False):
+            occurrence_start = occurrence.replace(tzinfo=timezone.utc) if all_day else occurrence.astimezone(timezone.utc)
+            if occurrence_start in overridden:
+                continue
+            yield EventDTO.model_construct(
+                id=cls._instance_id(master.id, occurrence_start, all_day),
+                title=master.summary,
+                description=master.description,
+                start_dt=occurrence_start,
+                end_dt=occurrence_start + duration,
+                location=master.location,
+                attendees=[a.email for a in (master.attendees or [])],
+                calendar_id=calendar_id,
+            )
+
+    @staticmethod
+    def _normalize_until(line: str, aware: bool) -> str:
+        """Make UNTIL match DTSTART: dateutil rejects a UTC UNTIL with a floating DTSTART and vice versa."""
+        def replace(match: re.Match) -> str:
+            date, time, _ = match.groups()
+            if aware:
+                return f"UNTIL={date}{time or 'T235959'}Z"
+            return f"UNTIL={date}{time or 'T235959'}"
+        return _UNTIL.sub(replace, line) if line.startswith("RRULE") or line.startswith("EXRULE") else line
+
+    @staticmethod
+    def _instance_id(master_id: str, start: datetime, all_day: bool) -> str:
+        """Build the instance id Google uses for an occurrence so it can be updated or deleted."""
+        if all_day:
+            return f"{master_id}_{start:%Y%m%d}"
+        return f"{master_id}_{start.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}"
+
+    @staticmethod
+    def _parse_dt(gdt: GoogleEventDateTime) -> datetime:
+        """Return a timezone-aware datetime (all-day dates at UTC midnight)."""
+        if gdt.dateTime:
+            return gdt.dateTime.astimezone(timezone.utc)
+        return datetime.fromisoformat(gdt.date).replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _to_dto(event: GoogleEvent, calendar_id: Optional[str]) -> EventDTO:
+        """Convert a non-recurring event or a modified instance."""
+        return EventDTO.model_construct(
+            id=event.id,
+            title=event.summary,
+            description=event.description,
+            start_dt=RecurrenceExpander._parse_dt(event.start),
+            end_dt=RecurrenceExpander._parse_dt(event.end),
+            location=event.location,
+            attendees=[a.email for a in (event.attendees or [])],
+            calendar_id=calendar_id,
+        )
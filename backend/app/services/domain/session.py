@@ -1,12 +1,15 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
+from cachetools import TTLCache
 
+from app.core.config import AI_THREAD_MAX_MESSAGES, AI_THREAD_MAX_TOKENS, AI_SUMMARY_SOURCE_MESSAGES, AI_SESSION_CACHE_TTL
 from app.orm.session import SessionOrm
 from app.repository.session import SessionRepository
 from app.services.system.exceptions import InternalError, NotFoundError
 from app.schemas.domain.session import SessionDTO, SessionCreateDTO
 from app.services.external.openai import ChatCompletionProvider
+from app.services.external.thread_pool import ThreadPool
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +17,12 @@ logger = logging.getLogger(__name__)
 class SessionService:
     """Service class for managing session operations."""
 
+    # Current session per user; this process's writes keep the cached DTO up to date
+    _sessions: TTLCache = TTLCache(maxsize=10000, ttl=AI_SESSION_CACHE_TTL)
+    # Session id -> user id, to find the cached DTO from run state and usage updates
+    _owners: TTLCache = TTLCache(maxsize=10000, ttl=AI_SESSION_CACHE_TTL)
+    _counters: Dict[str, int] = {"hits": 0, "misses": 0, "rotations": 0}
+
     @classmethod
     async def create(cls, data: SessionCreateDTO) -> SessionDTO:
         """Create a new session for the user and return it with extended information."""
@@ -29,14 +38,153 @@ class SessionService:
     async def get_or_create_for_user(cls, user_id: UUID) -> SessionDTO:
         """Get or create a session for the user."""
         try:
-            session = await SessionRepository.retrieve_by_user_id(user_id)
-            if not session:
-                ai_thread = await ChatCompletionProvider.create_thread()
-                session_data = SessionCreateDTO(user_id=user_id, provider_thread_id=ai_thread.id)
-                session = await cls.create(session_data)
-            return SessionDTO.model_validate(session)
+            session = cls._sessions.get(user_id)
+            cls._counters["hits" if session is not None else "misses"] += 1
+            if session is None:
+                session = await SessionRepository.retrieve_by_user_id(user_id)
+                if not session:
+                    session_data = SessionCreateDTO(user_id=user_id, provider_thread_id=await ThreadPool.acquire())
+                    session = await cls.create(session_data)
+                session = cls._remember(SessionDTO.model_validate(session))
+            if cls._needs_rotation(session):
+                # The cached DTO can be behind other workers; decide on the stored newest session
+                session = await cls._reload(session)
+            if cls._needs_rotation(session):
+                try:
+                    session = await cls.rotate(session)
+                except InternalError:
+                    # An oversized thread is still usable; try again on the next turn
+                    logger.warning(f" Keeping session {session.id} after failed rotation")
+            return session
         except InternalError:
             raise
         except Exception:
             logger.exception(f"LOGGER:Failed to get or create session for user_id={user_id}")
-            raise InternalError("Failed to get or create session")
\ No newline at end of file
+            raise InternalError("Failed to get or create session")
+
+    @classmethod
+    async def set_run_state(cls, session_id: UUID, active_run_id: Optional[str], run_status: Optional[str]) -> None:
+        """Record the session's current run and its status."""
+        try:
+            await SessionRepository.update_run_state(session_id, active_run_id, run_status)
+            session = cls._cached(session_id)
+            if session is not None:
+                session.active_run_id, session.run_status = active_run_id, run_status
+        except Exception:
+            logger.exception(f"LOGGER:Failed to update run state for session_id={session_id}")
+            raise InternalError("Failed to update run state")
+
+    @classmethod
+    async def record_usage(cls, session_id: UUID, messages: int, tokens: int) -> None:
+        """Add a turn's messages and estimated tokens to the session's thread size."""
+        try:
+            rotated_at = await SessionRepository.add_usage(session_id, messages, tokens)
+            session = cls._cached(session_id)
+            if session is not None and rotated_at is not None:
+                # Another worker replaced this thread; read its successor on the next turn
+                cls._forget(session)
+            elif session is not None:
+                session.message_count += messages
+                session.token_estimate += tokens
+        except Exception:
+            logger.exception(f"LOGGER:Failed to record usage for session_id={session_id}")
+            raise InternalError("Failed to record session usage")
+
+    @classmethod
+    async def rotate(cls, session: SessionDTO) -> SessionDTO:
+        """Replace the session's thread with a new one seeded with a summary of it; only one worker gets to rotate a session."""
+        try:
+            if not await SessionRepository.claim_rotation(session.id):
+                # Another worker is rotating it; keep the old thread for this turn and re-read on the next one
+                cls._forget(session)
+                return session
+        except Exception:
+            logger.exception(f"LOGGER:Failed to claim rotation of session_id={session.id}")
+            raise InternalError("Failed to rotate session")
+        try:
+            if session.active_run_id and session.run_status in ChatCompletionProvider.ACTIVE_RUN_STATUSES:
+                await ChatCompletionProvider.cancel_run(session.provider_thread_id, session.active_run_id)
+            summary = await cls._summarize(session)
+            ai_thread = await ChatCompletionProvider.create_thread(seed=summary)
+            logger.warning(
+                f" Rotating session {session.id} after {session.message_count} messages / ~{session.token_estimate} tokens"
+            )
+            new_session = await cls.create(SessionCreateDTO(
+                user_id=session.user_id,
+                provider_thread_id=ai_thread.id,
+                topic=session.topic,
+                message_count=1 if summary else 0,
+                # Same four-characters-per-token estimate the assistant uses for turns
+                token_estimate=(len(summary) + 3) // 4 if summary else 0,
+                parent_session_id=session.id,
+                summary=summary,
+            ))
+            cls._owners.pop(session.id, None)
+            cls._counters["rotations"] += 1
+            return cls._remember(new_session)
+        except InternalError:
+            await cls._release_rotation(session)
+            raise
+        except Exception:
+            logger.exception(f"LOGGER:Failed to rotate session_id={session.id}")
+            await cls._release_rotation(session)
+            raise InternalError("Failed to rotate session")
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return session cache size and hit counters."""
+        return {"cached": len(cls._sessions), **cls._counters}
+
+    # Private implementation methods
+    @classmethod
+    def _remember(cls, session: SessionDTO) -> SessionDTO:
+        cls._sessions[session.user_id] = session
+        cls._owners[session.id] = session.user_id
+        return session
+
+    @classmethod
+    def _forget(cls, session: SessionDTO) -> None:
+        if cls._sessions.get(session.user_id) is session:
+            cls._sessions.pop(session.user_id, None)
+        cls._owners.pop(session.id, None)
+
+    @classmethod
+    async def _reload(cls, session: SessionDTO) -> SessionDTO:
+        """Replace a cached session with the user's newest stored one."""
+        latest = await SessionRepository.retrieve_by_user_id(session.user_id)
+        if not latest:
+            return session
+        if latest.id != session.id:
+            cls._owners.pop(session.id, None)
+        return cls._remember(SessionDTO.model_validate(latest))
+
+    @classmethod
+    async def _release_rotation(cls, session: SessionDTO) -> None:
+        """Let a later turn retry a rotation that failed after it was claimed."""
+        try:
+            await SessionRepository.release_rotation(session.id)
+        except Exception:
+            logger.warning(f" Failed to release rotation of session {session.id}")
+
+    @classmethod
+    def _cached(cls, session_id: UUID) -> Optional[SessionDTO]:
+        user_id = cls._owners.get(session_id)
+        session = cls._sessions.get(user_id) if user_id else None
+        return session if session is not None and session.id == session_id else None
+
+    @staticmethod
+    def _needs_rotation(session: SessionDTO) -> bool:
+        return session.message_count >= AI_THREAD_MAX_MESSAGES or session.token_estimate >= AI_THREAD_MAX_TOKENS
+
+    @staticmethod
+    async def _summarize(session: SessionDTO) -> Optional[str]:
+        """Summarize the old thread, falling back to its last messages if the summary call fails."""
+        transcript = await ChatCompletionProvider.get_transcript(session.provider_thread_id, AI_SUMMARY_SOURCE_MESSAGES)
+        if not transcript:
+            return None
+        try:
+            summary = await ChatCompletionProvider.summarize(transcript)
+        except Exception:
+            logger.warning(f" Summary failed for session {session.id}, seeding with recent messages")
+            summary = "\n".join(f"{role}: {text[:300]}" for role, text in transcript[-6:])
+        return f"Summary of our earlier conversation:\n{summary}" if summary else None
@@ -2,7 +2,9 @@ import logging
 from datetime import datetime, timezone
 from uuid import UUID
 from pydantic import EmailStr
+from cachetools import TTLCache
 
+from app.core.config import DEFAULT_TIMEZONE, USER_TIMEZONE_CACHE_TTL
 from app.orm.user import UserOrm
 from app.repository.user import UserRepository
 from app.schemas.domain.user import UserDTO, UserCreateDTO, UserUpdateDTO, UserUpdatePasswordDTO
@@ -14,6 +16,9 @@ logger = logging.getLogger(__name__)
 class UserService:
     """Service class for user operations."""
 
+    # user_id -> timezone name, read on every assistant turn and tool call
+    _timezones: TTLCache = TTLCache(maxsize=10000, ttl=USER_TIMEZONE_CACHE_TTL)
+
     # Public API methods
     @classmethod
     async def list(cls) -> list[UserDTO]:
@@ -79,6 +84,7 @@ class UserService:
             for field, value in data.model_dump(exclude_unset=True).items():
                 setattr(user, field, value)
             setattr(user, "updated_at", datetime.now(timezone.utc))
+            cls._timezones.pop(user_id, None)
             return await UserRepository.update(user)
         except NotFoundError:
             raise
@@ -98,4 +104,18 @@ class UserService:
             raise
         except Exception:
             logger.exception(f"LOGGER:Failed to update user password for user_id={user_id}, data={data}")
-            raise InternalError("Failed to update user password")
\ No newline at end of file
+            raise InternalError("Failed to update user password")
+
+    @classmethod
+    async def get_timezone(cls, user_id: UUID) -> str:
+        """Public: Return the user's timezone, falling back to the default one."""
+        timezone_name = cls._timezones.get(user_id)
+        if timezone_name is None:
+            try:
+                user = await UserRepository.retrieve(user_id)
+                timezone_name = (user.timezone if user else None) or DEFAULT_TIMEZONE
+            except Exception:
+                logger.exception(f"LOGGER:Failed to retrieve timezone for user_id={user_id}")
+                return DEFAULT_TIMEZONE
+            cls._timezones[user_id] = timezone_name
+        return timezone_name
@@ -0,0 +1,508 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urlparse
+import httpx
+from google.oauth2.credentials import Credentials
+
+from app.core.config import (
+    GOOGLE_API_BASE_URL,
+    GOOGLE_BATCH_URL,
+    GOOGLE_CLIENT_ID,
+    GOOGLE_CLIENT_SECRET,
+    GOOGLE_HTTP_MAX_CONNECTIONS,
+    GOOGLE_HTTP_MAX_KEEPALIVE,
+    GOOGLE_HTTP_TIMEOUT,
+    GOOGLE_TOKEN_URI,
+)
+from app.schemas.external.google import GoogleCalendar, GoogleEvent, EVENT_FIELDS, EVENT_LIST_FIELDS, EVENT_SYNC_FIELDS, CALENDAR_LIST_FIELDS
+from app.services.external.google_scheduler import GoogleRequestScheduler
+from app.services.system.exceptions import InternalError, ExternalAPIError
+
+
+logger = logging.getLogger(__name__)
+
+# Largest page events.list returns
+MAX_PAGE_SIZE = 2500
+# Most calls Calendar accepts in one batch request
+MAX_BATCH_SIZE = 50
+# Methods safe to resend after a 5xx; patches here always set absolute field values
+IDEMPOTENT_METHODS = {"GET", "PUT", "PATCH", "DELETE"}
+
+class GoogleCalendarClient:
+    """Asyncio-native Google Calendar client on a shared keep-alive connection pool."""
+
+    _client: Optional[httpx.AsyncClient] = None
+
+    # Connection pool
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                base_url=GOOGLE_API_BASE_URL,
+                timeout=httpx.Timeout(GOOGLE_HTTP_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=GOOGLE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=GOOGLE_HTTP_MAX_KEEPALIVE,
+                ),
+                # Google only compresses responses for user agents that mention gzip
+                headers={"Accept-Encoding": "gzip", "User-Agent": "calapp (gzip)"},
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP client."""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+
+    # Events
+    @classmethod
+    async def list_events(cls, creds: Credentials, limit: Optional[int] = 10, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, order_by: Optional[Literal["startTime"]] = None, calendar_id: str = "primary") -> List[GoogleEvent]:
+        """List events across pages up to limit"""
+        try:
+            return [e async for e in cls.iter_events(creds, limit, start_dt, end_dt, order_by, calendar_id=calendar_id)]
+        except (ExternalAPIError, InternalError):
+            raise
+        except Exception:
+            logger.exception("Failed to list events")
+            raise InternalError("Failed to list events")
+
+    @classmethod
+    async def list_event_items(cls, creds: Credentials, limit: Optional[int] = 10, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, order_by: Optional[Literal["startTime"]] = None, calendar_id: str = "primary") -> List[dict]:
+        """List raw event items across pages up to limit, leaving validation to the caller"""
+        try:
+            items: List[dict] = []
+            async for page in cls.iter_event_pages(creds, limit, start_dt, end_dt, order_by, calendar_id=calendar_id):
+                items.extend(page)
+            return items
+        except (ExternalAPIError, InternalError):
+            raise
+        except Exception:
+            logger.exception("Failed to list events")
+            raise InternalError("Failed to list events")
+
+    @classmethod
+    async def iter_events(cls, creds: Credentials, limit: Optional[int] = None, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, order_by: Optional[Literal["startTime"]] = None, page_size: int = MAX_PAGE_SIZE, calendar_id: str = "primary") -> AsyncIterator[GoogleEvent]:
+        """Walk every events.list page, validating items only as they are consumed"""
+        async for page in cls.iter_event_pages(creds, limit, start_dt, end_dt, order_by, page_size, calendar_id):
+            for item in page:
+                yield GoogleEvent.model_validate(item)
+
+    @classmethod
+    async def iter_event_pages(cls, creds: Credentials, limit: Optional[int] = None, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None, order_by: Optional[Literal["startTime"]] = None, page_size: int = MAX_PAGE_SIZE, calendar_id: str = "primary") -> AsyncIterator[List[dict]]:
+        """Walk every events.list page, yielding the raw items of each page"""
+        params = {
+            "timeMin": start_dt.astimezone(timezone.utc).isoformat() if start_dt else None,
+            "timeMax": end_dt.astimezone(timezone.utc).isoformat() if end_dt else None,
+            "singleEvents": "true",
+            "orderBy": order_by,
+            "fields": EVENT_LIST_FIELDS,
+        }
+        remaining = limit
+        page_token = None
+        while True:
+            # Only ask for what is still needed so the last page stays small
+            params["maxResults"] = min(page_size, remaining) if remaining else page_size
+            params["pageToken"] = page_token
+            response = await cls._request("GET", cls.event_path(calendar_id), creds, params=params)
+            items = response.get("items", [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            if items:
+                yield items
+            page_token = response.get("nextPageToken")
+            if not page_token or remaining == 0:
+                return
+
+    @classmethod
+    async def list_raw_events(cls, creds: Credentials, start_dt: datetime, end_dt: datetime, calendar_id: str = "primary") -> List[dict]:
+        """List recurring masters, exceptions and single events of a window without server-side expansion"""
+        try:
+            params = {
+                "timeMin": start_dt.astimezone(timezone.utc).isoformat(),
+                "timeMax": end_dt.astimezone(timezone.utc).isoformat(),
+                "singleEvents": "false",
+                "maxResults": MAX_PAGE_SIZE,
+                "fields": EVENT_SYNC_FIELDS,
+            }
+            items = []
+            page_token = None
+            while True:
+                params["pageToken"] = page_token
+                response = await cls._request("GET", cls.event_path(calendar_id), creds, params=params)
+                items.extend(response.get("items", []))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return items
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to list raw events")
+            raise InternalError("Failed to list raw events")
+
+    @classmethod
+    async def list_calendars(cls, creds: Credentials) -> List[GoogleCalendar]:
+        """List every calendar on the user's calendar list"""
+        try:
+            calendars = []
+            page_token = None
+            while True:
+                response = await cls._request("GET", "/users/me/calendarList", creds, params={"pageToken": page_token, "maxResults": 250, "fields": CALENDAR_LIST_FIELDS})
+                calendars.extend(GoogleCalendar.model_validate(c) for c in response.get("items", []))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return calendars
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to list calendars")
+            raise InternalError("Failed to list calendars")
+
+    @classmethod
+    async def list_event_changes(cls, creds: Credentials, calendar_id: str = "primary", sync_token: Optional[str] = None, page_token: Optional[str] = None) -> dict:
+        """Return one raw events.list page for a full (no sync token) or incremental sync."""
+        params = {
+            "syncToken": sync_token,
+            "pageToken": page_token,
+            "singleEvents": "true",
+            "showDeleted": "true" if sync_token else None,
+            "maxResults": MAX_PAGE_SIZE,
+            "fields": EVENT_SYNC_FIELDS,
+        }
+        return await cls._request("GET", cls.event_path(calendar_id), creds, params=params)
+
+    @classmethod
+    async def get_event(cls, creds: Credentials, event_id: str, etag: Optional[str] = None, calendar_id: str = "primary") -> Optional[GoogleEvent]:
+        """Get event by event ID; with an etag, return None when the event has not changed (304)"""
+        try:
+            headers = {"If-None-Match": etag} if etag else None
+            response = await cls._send("GET", cls.event_path(calendar_id, event_id), creds, params={"fields": EVENT_FIELDS}, headers=headers)
+            if response.status_code == 304:
+                return None
+            return GoogleEvent.model_validate(response.json())
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to get event")
+            raise InternalError("Failed to get event")
+
+    @classmethod
+    async def create_event(cls, creds: Credentials, payload: dict, calendar_id: str = "primary") -> GoogleEvent:
+        """Create event from a dict payload"""
+        try:
+            body = cls.build_event_body(payload)
+            event = await cls._request("POST", cls.event_path(calendar_id), creds, params={"fields": EVENT_FIELDS}, body=body)
+            return GoogleEvent.model_validate(event)
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to create event")
+            raise InternalError("Failed to create event")
+
+    @classmethod
+    async def update_event(cls, creds: Credentials, event_id: str, payload: dict, calendar_id: str = "primary") -> GoogleEvent:
+        """Update event using dict payload"""
+        try:
+            body = cls.build_event_body(payload)
+            event = await cls._request("PATCH", cls.event_path(calendar_id, event_id), creds, params={"fields": EVENT_FIELDS}, body=body)
+            return GoogleEvent.model_validate(event)
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to update event")
+            raise InternalError("Failed to update event")
+
+    @classmethod
+    async def delete_event(cls, creds: Credentials, event_id: str, calendar_id: str = "primary") -> bool:
+        """Delete event by event ID"""
+        try:
+            await cls._request("DELETE", cls.event_path(calendar_id, event_id), creds)
+            return True
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to delete event")
+            raise InternalError("Failed to delete event")
+
+    @classmethod
+    async def batch(cls, creds: Credentials, calls: List[Tuple[str, str, Optional[dict]]]) -> List[Tuple[int, dict]]:
+        """Send (method, path, body) calls through the batch endpoint and return (status, body) per call in order."""
+        try:
+            chunks = [calls[i:i + MAX_BATCH_SIZE] for i in range(0, len(calls), MAX_BATCH_SIZE)]
+            # Other chunks may already be applied when one fails, so their results must survive
+            responses = await asyncio.gather(*(cls._send_batch(creds, chunk) for chunk in chunks), return_exceptions=True)
+            failures = [r for r in responses if isinstance(r, BaseException)]
+            if len(failures) == len(responses):
+                # Nothing was applied: surface the error itself (e.g. a 429 after retries)
+                raise failures[0]
+            results = []
+            for chunk, response in zip(chunks, responses):
+                if isinstance(response, BaseException):
+                    logger.warning(f" Batch chunk of {len(chunk)} calls failed: {response}")
+                    results.extend([cls._chunk_error(response)] * len(chunk))
+                else:
+                    results.extend(response)
+            return results
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to execute batch")
+            raise InternalError("Failed to execute batch")
+
+    # Free/busy
+    @classmethod
+    async def query_freebusy(cls, creds: Credentials, start_dt: datetime, end_dt: datetime, calendar_ids: List[str]) -> Dict[str, List[Tuple[datetime, datetime]]]:
+        """Return busy intervals per calendar from freebusy.query"""
+        try:
+            body = {
+                "timeMin": start_dt.astimezone(timezone.utc).isoformat(),
+                "timeMax": end_dt.astimezone(timezone.utc).isoformat(),
+                "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+            }
+            response = await cls._request("POST", "/freeBusy", creds, body=body, idempotent=True)
+            busy = {}
+            for calendar_id, calendar in response.get("calendars", {}).items():
+                if calendar.get("errors"):
+                    logger.warning(f" Free/busy errors for calendar {calendar_id}: {calendar['errors']}")
+                busy[calendar_id] = [
+                    (cls._parse_rfc3339(b["start"]), cls._parse_rfc3339(b["end"]))
+                    for b in calendar.get("busy", [])
+                ]
+            return busy
+        except ExternalAPIError:
+            raise
+        except Exception:
+            logger.exception("Failed to query free/busy")
+            raise InternalError("Failed to query free/busy")
+
+    # Push notifications
+    @classmethod
+    async def watch_events(cls, creds: Credentials, channel_id: str, address: str, channel_token: str, ttl: int, calendar_id: str = "primary") -> dict:
+        """Open an events.watch channel and return Google's channel resource."""
+        body = {
+            "id": channel_id,
+            "type": "web_hook",
+            "address": address,
+            "token": channel_token,
+            "params": {"ttl": str(ttl)},
+        }
+        return await cls._request("POST", f"{cls.event_path(calendar_id)}/watch", creds, body=body)
+
+    @classmethod
+    async def stop_channel(cls, creds: Credentials, channel_id: str, resource_id: str) -> None:
+        """Stop a push notification channel."""
+        await cls._request("POST", "/channels/stop", creds, body={"id": channel_id, "resourceId": resource_id})
+
+    # Auth
+    @classmethod
+    async def refresh_creds(cls, creds: Credentials) -> Credentials:
+        """Refresh the access token in place using the refresh token."""
+        try:
+            async def call() -> httpx.Response:
+                response = await cls.get_client().post(
+                    GOOGLE_TOKEN_URI,
+                    data={
+                        "grant_type": "refresh_token",
+                        "refresh_token": creds.refresh_token,
+                        "client_id": GOOGLE_CLIENT_ID,
+                        "client_secret": GOOGLE_CLIENT_SECRET,
+                    },
+                )
+                if response.status_code >= 400:
+                    raise cls._to_error(response)
+                return response
+
+            # Refreshing twice only issues another access token
+            response = await GoogleRequestScheduler.execute(cls._user_key(creds), call, idempotent=True)
+            data = response.json()
+            creds.token = data["access_token"]
+            # google-auth keeps expiry as naive UTC
+            creds.expiry = (datetime.now(timezone.utc) + timedelta(seconds=int(data.get("expires_in", 3600)))).replace(tzinfo=None)
+            return creds
+        except ExternalAPIError as e:
+            if e.status_code in (400, 401):
+                raise InternalError("Google authorization expired. Please reconnect your calendar.")
+            raise
+        except Exception:
+            logger.exception("Failed to refresh credentials")
+            raise InternalError("Failed to refresh credentials")
+
+    # Helpers
+    @staticmethod
+    def event_path(calendar_id: str, event_id: Optional[str] = None) -> str:
+        """Events collection or single event path with both ids URL-quoted."""
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        return f"{path}/{quote(event_id, safe='')}" if event_id else path
+
+    @staticmethod
+    def build_event_body(payload: dict) -> dict:
+        """Map a command payload to a Google event resource body."""
+        body = {}
+        if "title" in payload:
+            body["summary"] = payload["title"]
+        if "description" in payload:
+            body["description"] = payload["description"]
+        if "location" in payload:
+            body["location"] = payload["location"]
+        if "attendees" in payload:
+            body["attendees"] = [{"email": e} for e in payload["attendees"]]
+        if "start_dt" in payload and "end_dt" in payload:
+            body["start"] = {
+                "dateTime": payload["start_dt"].astimezone(timezone.utc).isoformat(),
+                "timeZone": "UTC"
+            }
+            body["end"] = {
+                "dateTime": payload["end_dt"].astimezone(timezone.utc).isoformat(),
+                "timeZone": "UTC",
+            }
+        return body
+
+    @classmethod
+    async def _request(cls, method: str, path: str, creds: Credentials, params: Optional[Dict[str, Any]] = None, body: Optional[dict] = None, idempotent: Optional[bool] = None) -> dict:
+        """Send an authorized request and return the decoded JSON body."""
+        response = await cls._send(method, path, creds, params=params, body=body, idempotent=idempotent)
+        if response.status_code == 204 or not response.content:
+            return {}
+        return response.json()
+
+    @classmethod
+    async def _send(cls, method: str, path: str, creds: Credentials, params: Optional[Dict[str, Any]] = None, body: Optional[dict] = None, headers: Optional[Dict[str, str]] = None, idempotent: Optional[bool] = None) -> httpx.Response:
+        """Send an authorized request and raise ExternalAPIError on error statuses; idempotent defaults by method."""
+        async def call() -> httpx.Response:
+            response = await cls.get_client().request(
+                method,
+                path,
+                params={k: v for k, v in (params or {}).items() if v is not None},
+                json=body,
+                headers={"Authorization": f"Bearer {creds.token}", **(headers or {})},
+            )
+            if response.status_code >= 400:
+                raise cls._to_error(response)
+            return response
+
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        return await GoogleRequestScheduler.execute(cls._user_key(creds), call, idempotent=idempotent)
+
+    @classmethod
+    async def _send_batch(cls, creds: Credentials, calls: List[Tuple[str, str, Optional[dict]]]) -> List[Tuple[int, dict]]:
+        """Send one multipart/mixed batch request."""
+        boundary = f"batch_{uuid.uuid4().hex}"
+        prefix = urlparse(GOOGLE_API_BASE_URL).path
+        parts = []
+        for index, (method, path, body) in enumerate(calls):
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <item-{index}>",
+                "",
+                f"{method} {prefix}{path} HTTP/1.1",
+            ]
+            if body is not None:
+                lines += ["Content-Type: application/json", "", json.dumps(body)]
+            else:
+                lines += [""]
+            parts.append("\r\n".join(lines))
+        payload = "\r\n".join(parts) + f"\r\n--{boundary}--\r\n"
+        async def call() -> httpx.Response:
+            response = await cls.get_client().post(
+                GOOGLE_BATCH_URL,
+                content=payload.encode(),
+                headers={
+                    "Authorization": f"Bearer {creds.token}",
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+            )
+            if response.status_code >= 400:
+                raise cls._to_error(response)
+            return response
+
+        # A batch with inserts may have been partly applied before a 5xx
+        idempotent = all(method in IDEMPOTENT_METHODS for method, _, _ in calls)
+        response = await GoogleRequestScheduler.execute(cls._user_key(creds), call, idempotent=idempotent)
+        results = cls._parse_batch_response(response)
+        return [results.get(i, (500, {"error": {"message": "Missing batch response"}})) for i in range(len(calls))]
+
+    @staticmethod
+    def _chunk_error(error: BaseException) -> Tuple[int, dict]:
+        """Per-item result for a call whose whole batch request failed."""
+        status_code = getattr(error, "status_code", None) or 500
+        return status_code, {"error": {"message": str(error) or "Batch request failed"}}
+
+    @staticmethod
+    def _parse_batch_response(response: httpx.Response) -> Dict[int, Tuple[int, dict]]:
+        """Split a multipart/mixed batch response into (status, body) keyed by item index."""
+        match = re.search(r'boundary="?([^";]+)"?', response.headers.get("Content-Type", ""))
+        if not match:
+            raise InternalError("Batch response has no boundary")
+        results = {}
+        text = response.text.replace("\r\n", "\n")
+        for part in text.split(f"--{match.group(1)}"):
+            part = part.strip()
+            if not part or part == "--":
+                continue
+            headers, _, http = part.partition("\n\n")
+            content_id = re.search(r"Content-ID:\s*<response-item-(\d+)>", headers, re.IGNORECASE)
+            if not content_id:
+                continue
+            status_line, _, rest = http.partition("\n")
+            _, _, body = rest.partition("\n\n")
+            status_code = int(status_line.split(" ")[1])
+            results[int(content_id.group(1))] = (status_code, json.loads(body) if body.strip() else {})
+        return results
+
+    @staticmethod
+    def _user_key(creds: Credentials) -> str:
+        """Quota key of the user behind the credentials."""
+        return hashlib.sha256((creds.refresh_token or creds.token or "").encode()).hexdigest()
+
+    @staticmethod
+    def _parse_rfc3339(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp, including the Z suffix."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    @classmethod
+    def _to_error(cls, response: httpx.Response) -> ExternalAPIError:
+        """Convert a Google error response to ExternalAPIError."""
+        reason = None
+        message = response.reason_phrase
+        try:
+            error = response.json().get("error", {})
+            if isinstance(error, dict):
+                message = error.get("message", message)
+                errors = error.get("errors") or []
+                reason = errors[0].get("reason") if errors else None
+            else:
+                reason = str(error)
+        except ValueError:
+            pass
+        return ExternalAPIError(f"Google API error {response.status_code}: {message}", status_code=response.status_code, reason=reason, retry_after=cls._retry_after(response))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds from a Retry-After header (delta or HTTP date); None when absent or malformed."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.warning(f" Ignoring malformed Retry-After header: {value}")
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import random
+import time
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from cachetools import LRUCache
+
+from app.core.config import (
+    GOOGLE_PROJECT_QPS,
+    GOOGLE_USER_QPS,
+    GOOGLE_MAX_RETRIES,
+    GOOGLE_BACKOFF_BASE,
+    GOOGLE_BACKOFF_MAX,
+)
+from app.services.system.exceptions import ExternalAPIError, TooManyRequestsError
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Statuses and reasons worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded"}
+
+class RequestPriorityEnum(IntEnum):
+    """Scheduling lanes; lower values are served first."""
+    interactive = 0
+    background = 1
+
+# Lane of the current task; background jobs switch it before calling Google
+request_priority: ContextVar[RequestPriorityEnum] = ContextVar("request_priority", default=RequestPriorityEnum.interactive)
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate tokens per second up to capacity."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+class GoogleRequestScheduler:
+    """Central gate for Google API calls: per-user and per-project token buckets, priority lanes and backoff."""
+
+    _project_bucket = TokenBucket(GOOGLE_PROJECT_QPS, GOOGLE_PROJECT_QPS * 2)
+    _user_buckets: LRUCache = LRUCache(maxsize=10000)
+    _interactive_idle = asyncio.Event()
+    _interactive_idle.set()
+    _waiting: Dict[RequestPriorityEnum, int] = {p: 0 for p in RequestPriorityEnum}
+    _counters: Dict[str, int] = {"requests": 0, "throttled": 0, "retries": 0, "rate_limited": 0, "wait_ms": 0}
+
+    @classmethod
+    async def execute(cls, user_key: str, call: Callable[[], Awaitable[T]], priority: Optional[RequestPriorityEnum] = None, idempotent: bool = True) -> T:
+        """Run call once quota allows, retrying rate limits and transient errors with jittered backoff.
+
+        Non-idempotent calls are only retried when Google rejected them for quota, i.e. did not process them.
+        """
+        priority = request_priority.get() if priority is None else priority
+        attempt = 0
+        while True:
+            await cls._acquire(user_key, priority)
+            cls._counters["requests"] += 1
+            try:
+                return await call()
+            except ExternalAPIError as e:
+                rate_limited = cls._is_rate_limited(e)
+                if rate_limited:
+                    cls._counters["rate_limited"] += 1
+                retryable = rate_limited or (idempotent and e.status_code in RETRY_STATUSES)
+                # Waiting out a long Retry-After would hold the caller for minutes; hand it back instead
+                too_long = e.retry_after is not None and e.retry_after > GOOGLE_BACKOFF_MAX
+                if not retryable or too_long or attempt >= GOOGLE_MAX_RETRIES:
+                    if rate_limited:
+                        raise TooManyRequestsError(str(e), status_code=e.status_code, reason=e.reason, retry_after=e.retry_after) from e
+                    raise
+                delay = e.retry_after if e.retry_after is not None else cls._backoff(attempt)
+                attempt += 1
+                cls._counters["retries"] += 1
+                logger.warning(f" Google API {e.status_code} ({e.reason}), retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return queue depth per lane and throttling counters."""
+        return {
+            **{f"queue_{p.name}": n for p, n in cls._waiting.items()},
+            **cls._counters,
+        }
+
+    # Private implementation methods
+    @classmethod
+    async def _acquire(cls, user_key: str, priority: RequestPriorityEnum) -> None:
+        """Wait for a token from both the user's and the project's bucket."""
+        user_bucket = cls._user_buckets.get(user_key)
+        if user_bucket is None:
+            user_bucket = TokenBucket(GOOGLE_USER_QPS, GOOGLE_USER_QPS * 2)
+            cls._user_buckets[user_key] = user_bucket
+        cls._enter(priority)
+        started = time.monotonic()
+        try:
+            while True:
+                # Background work only runs when no interactive call is waiting
+                if priority > RequestPriorityEnum.interactive:
+                    await cls._interactive_idle.wait()
+                wait = max(user_bucket.wait_time(), cls._project_bucket.wait_time())
+                if wait == 0:
+                    user_bucket.consume()
+                    cls._project_bucket.consume()
+                    return
+                cls._counters["throttled"] += 1
+                await asyncio.sleep(wait)
+        finally:
+            cls._counters["wait_ms"] += int((time.monotonic() - started) * 1000)
+            cls._leave(priority)
+
+    @classmethod
+    def _enter(cls, priority: RequestPriorityEnum) -> None:
+        cls._waiting[priority] += 1
+        if priority == RequestPriorityEnum.interactive:
+            cls._interactive_idle.clear()
+
+    @classmethod
+    def _leave(cls, priority: RequestPriorityEnum) -> None:
+        cls._waiting[priority] -= 1
+        if priority == RequestPriorityEnum.interactive and cls._waiting[priority] == 0:
+            cls._interactive_idle.set()
+
+    @staticmethod
+    def _is_rate_limited(e: ExternalAPIError) -> bool:
+        return e.status_code == 429 or (e.status_code == 403 and e.reason in RATE_LIMIT_REASONS)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(GOOGLE_BACKOFF_MAX, GOOGLE_BACKOFF_BASE * 2 ** attempt))
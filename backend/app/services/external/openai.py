@@ -1,88 +1,230 @@
-import openai
+import httpx
 import logging
 import json
-from typing import Literal, Optional
+from typing import AsyncIterator, List, Literal, Optional, Tuple
+from openai import AsyncOpenAI, BadRequestError
+from openai.lib.streaming import AsyncAssistantStreamManager
 from openai.types.beta import Thread
-from app.schemas.orchestrator.assistant import AssistantOutput
-from app.core.config import AI_KEY, AI_ASSISTANT_ID
+from app.schemas.orchestrator.assistant import AssistantOutput, AssistantStreamEvent, AssistantToolCall
+from app.core.config import (
+    AI_KEY,
+    AI_ASSISTANT_ID,
+    AI_BASE_URL,
+    AI_TIMEOUT,
+    AI_CONNECT_TIMEOUT,
+    AI_MAX_RETRIES,
+    AI_MAX_CONNECTIONS,
+    AI_MAX_KEEPALIVE,
+    AI_POLL_INTERVAL_MS,
+    AI_SUMMARY_MODEL,
+    AI_SUMMARY_MAX_TOKENS,
+)
 
 
 logger = logging.getLogger(__name__)
 
-proxy_client = openai.Client(
-    api_key=AI_KEY,
-    base_url="https://api.proxyapi.ru/openai/v1",
+SUMMARY_PROMPT = (
+    "Summarize this conversation between a user and their calendar assistant in a few short bullet points. "
+    "Keep the user's stated preferences, open requests and any events or times still being discussed; drop small talk."
 )
 
 class ChatCompletionProvider:
     """Provides chat completion functionality using OpenAI API."""
 
+    # Run statuses in which a run still holds the thread
+    ACTIVE_RUN_STATUSES = ("queued", "in_progress", "requires_action", "cancelling")
+
+    _client: Optional[AsyncOpenAI] = None
+
+    # Connection pool
     @classmethod
-    async def create_thread(cls) -> Thread:
-        """Creates a new thread."""
+    def get_client(cls) -> AsyncOpenAI:
+        """Return the shared OpenAI client, creating it on first use."""
+        if cls._client is None or cls._client.is_closed():
+            cls._client = AsyncOpenAI(
+                api_key=AI_KEY,
+                base_url=AI_BASE_URL,
+                max_retries=AI_MAX_RETRIES,
+                http_client=httpx.AsyncClient(
+                    timeout=httpx.Timeout(AI_TIMEOUT, connect=AI_CONNECT_TIMEOUT),
+                    limits=httpx.Limits(
+                        max_connections=AI_MAX_CONNECTIONS,
+                        max_keepalive_connections=AI_MAX_KEEPALIVE,
+                    ),
+                ),
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared OpenAI client."""
+        if cls._client is not None and not cls._client.is_closed():
+            await cls._client.close()
+        cls._client = None
+
+    @classmethod
+    async def create_thread(cls, seed: Optional[str] = None) -> Thread:
+        """Creates a new thread, optionally starting with an assistant message carrying earlier context."""
         try:
-            thread = proxy_client.beta.threads.create()
+            messages = [{"role": "assistant", "content": seed}] if seed else []
+            thread = await cls.get_client().beta.threads.create(messages=messages)
             return thread
         except Exception:
             logger.exception("Failed to create thread")
             raise
 
+    @classmethod
+    async def get_transcript(cls, thread_id: str, limit: int) -> List[Tuple[str, str]]:
+        """Returns the last messages of a thread, oldest first, as (role, text) pairs."""
+        try:
+            messages = await cls.get_client().beta.threads.messages.list(thread_id=thread_id, order="desc", limit=limit)
+            transcript = []
+            for message in reversed(messages.data):
+                text = "\n".join(item.text.value for item in message.content if item.type == "text")
+                if text:
+                    transcript.append((message.role, text))
+            return transcript
+        except Exception:
+            logger.exception(f"Failed to read transcript of thread {thread_id}")
+            raise
+
+    @classmethod
+    async def summarize(cls, transcript: List[Tuple[str, str]]) -> str:
+        """Condenses a transcript into a short summary for seeding a new thread."""
+        try:
+            response = await cls.get_client().chat.completions.create(
+                model=AI_SUMMARY_MODEL,
+                max_tokens=AI_SUMMARY_MAX_TOKENS,
+                messages=[
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {"role": "user", "content": "\n".join(f"{role}: {text}" for role, text in transcript)},
+                ],
+            )
+            return (response.choices[0].message.content or "").strip()
+        except Exception:
+            logger.exception("Failed to summarize transcript")
+            raise
+
     @classmethod
     async def complete(cls, thread_id: str, content: str, context: str = None) -> AssistantOutput:
         """Completes the thread and returns the assistant output."""
+        run_id = await cls.start_run(thread_id, content, context)
+        return await cls.wait_run(thread_id, run_id)
+
+    @classmethod
+    async def start_run(cls, thread_id: str, content: str, context: str = None) -> str:
+        """Adds a user message and starts a run without waiting for it; returns the run id."""
         try:
-            # Cancel any active run in the thread
-            await cls._cancel_active_run(thread_id, status=["in_progress", "active", "requires_action"])
-            
-            # Add user message to thread and create and poll the run
-            await cls._add_message(thread_id, content)            
-            run = proxy_client.beta.threads.runs.create_and_poll(
+            await cls._add_user_message(thread_id, content)
+            run = await cls.get_client().beta.threads.runs.create(
                 thread_id=thread_id,
                 assistant_id=AI_ASSISTANT_ID,
-                additional_instructions=context
-            )            
+                additional_instructions=context,
+            )
+            return run.id
+        except Exception:
+            logger.exception(f"Failed to start run in thread {thread_id} with content {content}")
+            raise
 
-            # Handle run result
+    @classmethod
+    async def wait_run(cls, thread_id: str, run_id: str) -> AssistantOutput:
+        """Polls a run until it completes or needs tool outputs."""
+        try:
+            run = await cls.get_client().beta.threads.runs.poll(
+                thread_id=thread_id,
+                run_id=run_id,
+                poll_interval_ms=AI_POLL_INTERVAL_MS,
+            )
             return await cls._handle_run_result(thread_id, run)
         except Exception:
-            logger.exception(f"Failed to complete thread {thread_id} with content {content}")
+            logger.exception(f"Failed to wait for run {run_id} in thread {thread_id}")
             raise
 
     @classmethod
-    async def submit_tool_result(cls, thread_id: str, tool_call_id: str, run_id: str, result: str | dict) -> AssistantOutput:
-        """Submits a tool result to a thread."""
+    async def submit_tool_results(cls, thread_id: str, run_id: str, results: List[Tuple[str, str | dict]]) -> AssistantOutput:
+        """Submits the results of every pending tool call of a run at once."""
         try:
             # Add tool outputs to run
-            proxy_client.beta.threads.runs.submit_tool_outputs(
+            await cls.get_client().beta.threads.runs.submit_tool_outputs(
                 run_id=run_id,
                 thread_id=thread_id,
-                tool_outputs=[
-                    {                        
-                        "tool_call_id": tool_call_id, 
-                        "output": json.dumps(result, ensure_ascii=False) if isinstance(result, dict) else str(result)
-                    }
-                ],
+                tool_outputs=cls._to_tool_outputs(results),
             )
 
             # Poll until run is completed
-            run = proxy_client.beta.threads.runs.poll(
+            run = await cls.get_client().beta.threads.runs.poll(
                 thread_id=thread_id,
-                run_id=run_id
+                run_id=run_id,
+                poll_interval_ms=AI_POLL_INTERVAL_MS,
             )
 
             # Handle run result
             return await cls._handle_run_result(thread_id, run)
         except Exception:
-            logger.exception(f"Failed to submit tool result to thread {thread_id} with tool call id {tool_call_id} and result {result}")
+            logger.exception(f"Failed to submit tool results to thread {thread_id} for run {run_id}")
             raise
 
+    @classmethod
+    async def stream(cls, thread_id: str, content: str, context: str = None) -> AsyncIterator[AssistantStreamEvent]:
+        """Adds a message and streams the run as it is generated."""
+        await cls._add_user_message(thread_id, content)
+        manager = cls.get_client().beta.threads.runs.stream(
+            thread_id=thread_id,
+            assistant_id=AI_ASSISTANT_ID,
+            additional_instructions=context,
+        )
+        async for event in cls._iter_stream(manager):
+            yield event
+
+    @classmethod
+    async def stream_tool_results(cls, thread_id: str, run_id: str, results: List[Tuple[str, str | dict]]) -> AsyncIterator[AssistantStreamEvent]:
+        """Submits tool results and streams the continued run."""
+        manager = cls.get_client().beta.threads.runs.submit_tool_outputs_stream(
+            thread_id=thread_id,
+            run_id=run_id,
+            tool_outputs=cls._to_tool_outputs(results),
+        )
+        async for event in cls._iter_stream(manager):
+            yield event
+
+    @classmethod
+    async def cancel_run(cls, thread_id: str, run_id: str) -> None:
+        """Cancels a single run."""
+        try:
+            await cls.get_client().beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
+            logger.warning(f" Cancelled run {run_id} in thread {thread_id}")
+        except Exception:
+            logger.exception(f"Failed to cancel run {run_id} in thread {thread_id}")
+
+    @classmethod
+    async def _iter_stream(cls, manager: AsyncAssistantStreamManager) -> AsyncIterator[AssistantStreamEvent]:
+        """Normalizes Assistants stream events: text deltas, pending tool calls and the terminal status."""
+        async with manager as stream:
+            async for event in stream:
+                if event.event == "thread.message.delta":
+                    for part in event.data.delta.content or []:
+                        if part.type == "text" and part.text and part.text.value:
+                            yield AssistantStreamEvent(event="token", text=part.text.value)
+                elif event.event == "thread.run.requires_action":
+                    yield AssistantStreamEvent(
+                        event="requires_action",
+                        run_id=event.data.id,
+                        tool_calls=cls._to_tool_calls(event.data.required_action.submit_tool_outputs.tool_calls),
+                    )
+                elif event.event == "thread.run.completed":
+                    yield AssistantStreamEvent(event="done", run_id=event.data.id)
+                elif event.event in ("thread.run.failed", "thread.run.cancelled", "thread.run.expired"):
+                    yield AssistantStreamEvent(event="error", run_id=event.data.id, text=f"Run failed with status: {event.data.status}")
+                elif event.event == "thread.run.created":
+                    yield AssistantStreamEvent(event="started", run_id=event.data.id)
+
     @classmethod
     async def _handle_run_result(cls, thread_id: str, run) -> AssistantOutput:
         """Handles the run result and returns the assistant output."""
         try:
             # Handle completed run
             if run.status == "completed":
-                messages = proxy_client.beta.threads.messages.list(
+                messages = await cls.get_client().beta.threads.messages.list(
                     thread_id=thread_id,
                     run_id=run.id
                 )
@@ -99,11 +241,9 @@ class ChatCompletionProvider:
 
             # Handle requires action run
             if run.status == "requires_action":
-                tool_call = run.required_action.submit_tool_outputs.tool_calls[0]
+                tool_calls = cls._to_tool_calls(run.required_action.submit_tool_outputs.tool_calls)
                 return AssistantOutput(
-                    tool_name=tool_call.function.name,
-                    tool_call_id=tool_call.id,
-                    arguments=json.loads(tool_call.function.arguments),
+                    tool_calls=tool_calls,
                     run_id=run.id
                 )
 
@@ -120,10 +260,10 @@ class ChatCompletionProvider:
     async def _cancel_active_run(cls, thread_id: str, status: Optional[Literal["active", "in_progress", "completed", "requires_action"]] = ["active", "in_progress"]):
         """Cancel any active run in the thread."""
         try:
-            runs = proxy_client.beta.threads.runs.list(thread_id=thread_id)
+            runs = await cls.get_client().beta.threads.runs.list(thread_id=thread_id)
             for run in runs.data:
                 if run.status in status:
-                    proxy_client.beta.threads.runs.cancel(
+                    await cls.get_client().beta.threads.runs.cancel(
                         thread_id=thread_id,
                         run_id=run.id
                     )
@@ -132,15 +272,41 @@ class ChatCompletionProvider:
             logger.exception(f"Failed to cancel active runs in thread {thread_id}")
             raise
 
+    @classmethod
+    async def _add_user_message(cls, thread_id: str, content: str):
+        """Adds a message, sweeping the thread for runs only if one is unexpectedly still active."""
+        try:
+            await cls._add_message(thread_id, content)
+        except BadRequestError:
+            # Run state was lost (e.g. a run started before it was tracked): fall back to the sweep once
+            await cls._cancel_active_run(thread_id, status=["queued", "in_progress", "requires_action"])
+            await cls._add_message(thread_id, content)
+
     @classmethod
     async def _add_message(cls, thread_id: str, content: str):
         """Adds a message to a thread."""
         try:
-            proxy_client.beta.threads.messages.create(
+            await cls.get_client().beta.threads.messages.create(
                 thread_id=thread_id,
                 content=content,
                 role="user"
             )
         except Exception:
             logger.exception(f"Failed to add message to thread {thread_id} with content {content}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def _to_tool_calls(tool_calls) -> List[AssistantToolCall]:
+        """Converts a run's required tool calls."""
+        return [AssistantToolCall(id=c.id, name=c.function.name, arguments=json.loads(c.function.arguments or "{}")) for c in tool_calls]
+
+    @staticmethod
+    def _to_tool_outputs(results: List[Tuple[str, str | dict]]) -> List[dict]:
+        """Serializes (tool_call_id, result) pairs for tool_outputs."""
+        return [
+            {
+                "tool_call_id": tool_call_id,
+                "output": json.dumps(result, ensure_ascii=False) if isinstance(result, dict) else str(result),
+            }
+            for tool_call_id, result in results
+        ]
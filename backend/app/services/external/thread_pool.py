@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict
+
+from app.core.config import AI_THREAD_POOL_SIZE, WEB_CONCURRENCY
+from app.services.external.openai import ChatCompletionProvider
+
+
+logger = logging.getLogger(__name__)
+
+# Pause after a failed fill before trying again
+FILL_RETRY_DELAY = 5
+# This worker's share of the deployment-wide pool, rounded up
+WORKER_POOL_SIZE = -(-AI_THREAD_POOL_SIZE // WEB_CONCURRENCY)
+
+class ThreadPool:
+    """Keeps empty provider threads ready so new sessions do not wait on create_thread."""
+
+    _ready: Deque[str] = deque()
+    _low = asyncio.Event()
+    _counters: Dict[str, int] = {"hits": 0, "misses": 0, "created": 0, "fill_errors": 0}
+
+    @classmethod
+    async def acquire(cls) -> str:
+        """Return an unused thread id, creating one inline only if the pool is empty."""
+        cls._low.set()
+        if cls._ready:
+            cls._counters["hits"] += 1
+            return cls._ready.popleft()
+        cls._counters["misses"] += 1
+        thread = await ChatCompletionProvider.create_thread()
+        return thread.id
+
+    @classmethod
+    async def run(cls) -> None:
+        """Background loop topping the pool up to this worker's share whenever threads are taken."""
+        cls._low.set()
+        while True:
+            await cls._low.wait()
+            cls._low.clear()
+            while len(cls._ready) < WORKER_POOL_SIZE:
+                try:
+                    thread = await ChatCompletionProvider.create_thread()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    cls._counters["fill_errors"] += 1
+                    logger.warning(f" Thread pool fill failed, {len(cls._ready)} threads ready")
+                    await asyncio.sleep(FILL_RETRY_DELAY)
+                    continue
+                cls._ready.append(thread.id)
+                cls._counters["created"] += 1
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return pool size and hit counters."""
+        return {"ready": len(cls._ready), **cls._counters}
@@ -6,7 +6,9 @@ from app.orm.token import TokenOrm
 from app.repository.token import TokenRepository
 from app.schemas.domain.token import TokenProviderEnum
 from app.services.system.exceptions import InternalError
+from app.services.domain.credential import CredentialService
 from app.services.external.google import GoogleAuthService
+from app.services.intergration.calendar_watch import CalendarWatchService
 
 
 logger = logging.getLogger(__name__)
@@ -54,7 +56,14 @@ class CalendarConnectionService:
                 refresh_token=creds.refresh_token,
                 expiry=creds_expiry
             )
-            await TokenRepository.create(token_orm)
+            token_orm = await TokenRepository.create(token_orm)
+            CredentialService.invalidate(user_id)
         except Exception:
             logger.exception(f"Failed to store token in the database")
             raise InternalError("Failed to store token in the database")
+        # Subscribe to changes right away; the reconcile loop retries on failure
+        if CalendarWatchService.is_enabled():
+            try:
+                await CalendarWatchService.register(token_orm)
+            except InternalError:
+                logger.warning(f" Failed to register watch channel for user {user_id}, will retry in background")
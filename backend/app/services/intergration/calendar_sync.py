@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone, timedelta
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+from uuid import UUID
+from google.oauth2.credentials import Credentials
+
+from app.core.config import CALENDAR_MIRROR_MAX_AGE
+from app.orm.calendar_sync import CalendarSyncOrm
+from app.repository.calendar_sync import CalendarSyncRepository
+from app.repository.event import EventRepository
+from app.schemas.external.google import GoogleEvent, GoogleEventDateTime
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.external.google_scheduler import RequestPriorityEnum, request_priority
+from app.services.system.exceptions import InternalError, ExternalAPIError
+
+
+logger = logging.getLogger(__name__)
+
+class CalendarSyncService:
+    """Mirrors user calendars into the events table using Google sync tokens."""
+
+    _locks: Dict[Tuple[UUID, str], asyncio.Lock] = {}
+    _lock_users: Dict[Tuple[UUID, str], int] = {}
+    _tasks: Dict[Tuple[UUID, str], asyncio.Task] = {}
+
+    @classmethod
+    async def get_state(cls, user_id: UUID, calendar_id: str = "primary") -> Optional[CalendarSyncOrm]:
+        """Return the sync state of a user calendar."""
+        try:
+            return await CalendarSyncRepository.retrieve(user_id, calendar_id)
+        except Exception:
+            logger.exception(f"LOGGER:Failed to retrieve sync state for user_id={user_id}")
+            raise InternalError("Failed to retrieve sync state")
+
+    @staticmethod
+    def is_ready(state: Optional[CalendarSyncOrm]) -> bool:
+        """Whether the mirror has completed at least one full load."""
+        return bool(state and state.sync_token)
+
+    @staticmethod
+    def is_fresh(state: Optional[CalendarSyncOrm]) -> bool:
+        """Whether the mirror can answer reads without a delta pull: watched by a push channel or synced recently."""
+        # A failed sync may have dropped a pushed change, so nothing is fresh until the next sync succeeds
+        if not state or not state.synced_at or state.sync_failed_at:
+            return False
+        now = datetime.now(timezone.utc)
+        if state.watched_until and state.watched_until > now:
+            return True
+        return now - state.synced_at < timedelta(seconds=CALENDAR_MIRROR_MAX_AGE)
+
+    @classmethod
+    async def sync_calendar(cls, user_id: UUID, creds: Credentials, calendar_id: str = "primary") -> CalendarSyncOrm:
+        """Pull changes since the last sync token, or load the calendar in full if there is none."""
+        async with cls._calendar_lock(user_id, calendar_id):
+            try:
+                state = await CalendarSyncRepository.retrieve(user_id, calendar_id)
+                if state is None:
+                    state = await CalendarSyncRepository.create(CalendarSyncOrm(user_id=user_id, calendar_id=calendar_id))
+                try:
+                    sync_token = await cls._pull(user_id, creds, calendar_id, state.sync_token)
+                except ExternalAPIError as e:
+                    # 410 Gone: sync token invalidated by Google, start over
+                    if e.status_code != 410 or not state.sync_token:
+                        raise
+                    logger.warning(f" Sync token expired for user {user_id} calendar {calendar_id}, running full sync")
+                    sync_token = await cls._pull(user_id, creds, calendar_id, None)
+                state.sync_token = sync_token
+                state.synced_at = datetime.now(timezone.utc)
+                state.sync_failed_at = None
+                return await CalendarSyncRepository.update(state)
+            except Exception:
+                logger.exception(f"LOGGER:Failed to sync calendar {calendar_id} for user_id={user_id}")
+                await cls._mark_failed(user_id, calendar_id)
+                raise InternalError("Failed to sync calendar")
+
+    @classmethod
+    def schedule_sync(cls, user_id: UUID, creds: Credentials, calendar_id: str = "primary") -> None:
+        """Run sync_calendar in the background unless one is already running for this calendar."""
+        key = (user_id, calendar_id)
+        task = cls._tasks.get(key)
+        if task and not task.done():
+            return
+        task = asyncio.create_task(cls._background_sync(user_id, creds, calendar_id))
+        task.add_done_callback(lambda t: cls._on_task_done(key, t))
+        cls._tasks[key] = task
+
+    @classmethod
+    async def set_watched_until(cls, user_id: UUID, watched_until: Optional[datetime], calendar_id: str = "primary") -> None:
+        """Record until when a push channel keeps the mirror fresh."""
+        async with cls._calendar_lock(user_id, calendar_id):
+            try:
+                state = await CalendarSyncRepository.retrieve(user_id, calendar_id)
+                if state is None:
+                    state = CalendarSyncOrm(user_id=user_id, calendar_id=calendar_id)
+                state.watched_until = watched_until
+                await CalendarSyncRepository.update(state)
+            except Exception:
+                logger.exception(f"LOGGER:Failed to update watch state for user_id={user_id}")
+                raise InternalError("Failed to update watch state")
+
+    @classmethod
+    async def mark_failed(cls, user_id: UUID, calendar_id: str = "primary") -> None:
+        """Stop trusting the mirror until the next successful sync."""
+        async with cls._calendar_lock(user_id, calendar_id):
+            await cls._mark_failed(user_id, calendar_id)
+
+    @classmethod
+    async def apply_event(cls, user_id: UUID, event: GoogleEvent, calendar_id: str = "primary") -> None:
+        """Write a single event returned by a mutation into the mirror."""
+        try:
+            await EventRepository.upsert_many([cls._to_row(user_id, calendar_id, event)])
+        except Exception:
+            logger.exception(f"LOGGER:Failed to mirror event {event.id} for user_id={user_id}")
+
+    @classmethod
+    async def remove_event(cls, user_id: UUID, event_id: str, calendar_id: str = "primary") -> None:
+        """Remove a single deleted event from the mirror."""
+        try:
+            await EventRepository.delete_many(user_id, calendar_id, [event_id])
+        except Exception:
+            logger.exception(f"LOGGER:Failed to remove mirrored event {event_id} for user_id={user_id}")
+
+    # Private implementation methods
+    @classmethod
+    @asynccontextmanager
+    async def _calendar_lock(cls, user_id: UUID, calendar_id: str) -> AsyncIterator[None]:
+        """Serialize writes to one calendar's sync state; the lock is dropped once nobody holds or waits on it."""
+        key = (user_id, calendar_id)
+        lock = cls._locks.setdefault(key, asyncio.Lock())
+        cls._lock_users[key] = cls._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            cls._lock_users[key] -= 1
+            if not cls._lock_users[key]:
+                del cls._lock_users[key]
+                del cls._locks[key]
+
+    @classmethod
+    async def _background_sync(cls, user_id: UUID, creds: Credentials, calendar_id: str) -> CalendarSyncOrm:
+        """sync_calendar in the background lane so it yields quota to interactive requests."""
+        request_priority.set(RequestPriorityEnum.background)
+        return await cls.sync_calendar(user_id, creds, calendar_id)
+
+    @classmethod
+    async def _mark_failed(cls, user_id: UUID, calendar_id: str) -> None:
+        """Record a failed sync; callers hold the calendar lock."""
+        try:
+            state = await CalendarSyncRepository.retrieve(user_id, calendar_id)
+            if state is None:
+                return
+            state.sync_failed_at = datetime.now(timezone.utc)
+            await CalendarSyncRepository.update(state)
+        except Exception:
+            logger.warning(f" Failed to record sync failure for user {user_id} calendar {calendar_id}")
+
+    @classmethod
+    async def _pull(cls, user_id: UUID, creds: Credentials, calendar_id: str, sync_token: Optional[str]) -> str:
+        """Walk every page of a full or incremental sync and apply it; return the next sync token."""
+        full_sync = sync_token is None
+        seen: Set[str] = set()
+        page_token = None
+        while True:
+            page = await GoogleCalendarClient.list_event_changes(creds, calendar_id, sync_token=sync_token, page_token=page_token)
+            rows, cancelled = [], []
+            for item in page.get("items", []):
+                if item.get("status") == "cancelled":
+                    cancelled.append(item["id"])
+                    continue
+                rows.append(cls._to_row(user_id, calendar_id, GoogleEvent.model_validate(item)))
+                seen.add(item["id"])
+            await EventRepository.upsert_many(rows)
+            await EventRepository.delete_many(user_id, calendar_id, cancelled)
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+        if full_sync:
+            await EventRepository.delete_except(user_id, calendar_id, seen)
+        next_sync_token = page.get("nextSyncToken")
+        if not next_sync_token:
+            raise InternalError("Google did not return a sync token")
+        return next_sync_token
+
+    @staticmethod
+    def _to_row(user_id: UUID, calendar_id: str, event: GoogleEvent) -> dict:
+        """Convert a Google event to an events table row."""
+        def parse_google_dt(gdt: GoogleEventDateTime) -> datetime:
+            if gdt.dateTime:
+                return gdt.dateTime
+            return datetime.fromisoformat(gdt.date).replace(tzinfo=timezone.utc)
+
+        return {
+            "user_id": user_id,
+            "calendar_id": calendar_id,
+            "google_id": event.id,
+            "etag": event.etag,
+            "summary": event.summary,
+            "description": event.description,
+            "location": event.location,
+            "attendees": [a.email for a in (event.attendees or [])],
+            "start_dt": parse_google_dt(event.start),
+            "end_dt": parse_google_dt(event.end),
+            "all_day": event.start.dateTime is None,
+            "transparency": event.transparency,
+            "response_status": next((a.responseStatus for a in event.attendees or () if a.self), None),
+        }
+
+    @classmethod
+    def _on_task_done(cls, key: Tuple[UUID, str], task: asyncio.Task) -> None:
+        """Forget a finished background sync and surface its failure in logs."""
+        if cls._tasks.get(key) is task:
+            cls._tasks.pop(key, None)
+        if not task.cancelled() and task.exception():
+            logger.warning(f" Background sync failed for {key}: {task.exception()}")
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import secrets
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Dict
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.core.config import (
+    GOOGLE_WEBHOOK_URL, GOOGLE_WATCH_TTL, GOOGLE_WATCH_RENEW_BEFORE, GOOGLE_WATCH_RECONCILE_INTERVAL,
+    GOOGLE_WATCH_DISCOVERY_INTERVAL, API_ROOT_PREFIX,
+)
+from app.orm.token import TokenOrm
+from app.orm.watch_channel import WatchChannelOrm
+from app.repository.token import TokenRepository
+from app.repository.watch_channel import WatchChannelRepository
+from app.services.domain.calendar import CalendarService
+from app.services.domain.credential import CredentialService
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.external.google_scheduler import RequestPriorityEnum, request_priority
+from app.services.intergration.calendar_sync import CalendarSyncService
+from app.services.system.exceptions import InternalError, NotFoundError, UnauthorizedError
+
+
+logger = logging.getLogger(__name__)
+
+class CalendarWatchService:
+    """Service class for Google Calendar push notification channels."""
+
+    # Users whose calendar list was read recently; others are re-discovered on the next reconcile
+    _discovered: TTLCache = TTLCache(maxsize=10000, ttl=GOOGLE_WATCH_DISCOVERY_INTERVAL)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Push notifications need a public webhook URL."""
+        return bool(GOOGLE_WEBHOOK_URL)
+
+    @classmethod
+    async def register(cls, token: TokenOrm, calendar_id: str = "primary") -> WatchChannelOrm:
+        """Open a watch channel for the token's calendar and store it."""
+        try:
+            creds = await CredentialService.get_fresh_creds(token.user_id)
+            channel_id = uuid.uuid4()
+            channel_token = secrets.token_urlsafe(32)
+            response = await GoogleCalendarClient.watch_events(
+                creds,
+                channel_id=str(channel_id),
+                address=GOOGLE_WEBHOOK_URL + API_ROOT_PREFIX + "/handlers/notifications",
+                channel_token=channel_token,
+                ttl=GOOGLE_WATCH_TTL,
+                calendar_id=calendar_id,
+            )
+            expiration = datetime.fromtimestamp(int(response["expiration"]) / 1000, tz=timezone.utc)
+            channel = await WatchChannelRepository.create(WatchChannelOrm(
+                id=channel_id,
+                user_id=token.user_id,
+                token_id=token.id,
+                calendar_id=calendar_id,
+                resource_id=response["resourceId"],
+                channel_token=channel_token,
+                expiration=expiration,
+            ))
+            await CalendarSyncService.set_watched_until(token.user_id, expiration, calendar_id)
+            return channel
+        except Exception:
+            logger.exception(f"LOGGER:Failed to register watch channel for user_id={token.user_id}")
+            raise InternalError("Failed to register watch channel")
+
+    @classmethod
+    async def stop(cls, channel: WatchChannelOrm) -> None:
+        """Stop a channel at Google and forget it."""
+        try:
+            creds = await CredentialService.get_fresh_creds(channel.user_id)
+            await GoogleCalendarClient.stop_channel(creds, str(channel.id), channel.resource_id)
+        except Exception:
+            # An expired or already stopped channel is not worth failing over
+            logger.warning(f" Failed to stop watch channel {channel.id}")
+        await WatchChannelRepository.delete(channel.id)
+
+    @classmethod
+    async def reconcile(cls) -> None:
+        """Renew channels close to expiry and open channels for tokens that have none; one worker at a time."""
+        async with WatchChannelRepository.reconcile_lock() as acquired:
+            if not acquired:
+                return
+            await cls._reconcile()
+
+    @classmethod
+    async def run(cls) -> None:
+        """Background loop keeping watch channels alive."""
+        request_priority.set(RequestPriorityEnum.background)
+        while True:
+            try:
+                await cls.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("LOGGER:Failed to reconcile watch channels")
+            await asyncio.sleep(GOOGLE_WATCH_RECONCILE_INTERVAL)
+
+    @classmethod
+    async def handle_notification(cls, channel_id: str, channel_token: str | None, resource_state: str) -> None:
+        """Validate a push notification and start an incremental sync for the affected user only."""
+        try:
+            channel = await WatchChannelRepository.retrieve(UUID(channel_id))
+        except ValueError:
+            raise NotFoundError("Unknown channel")
+        if not channel:
+            raise NotFoundError("Unknown channel")
+        if not channel_token or not secrets.compare_digest(channel_token, channel.channel_token):
+            raise UnauthorizedError("Invalid channel token")
+        # "sync" is the handshake sent right after the channel is opened
+        if resource_state == "sync":
+            return
+        try:
+            creds = await CredentialService.get_fresh_creds(channel.user_id)
+            CalendarSyncService.schedule_sync(channel.user_id, creds, channel.calendar_id)
+        except Exception:
+            logger.exception(f"LOGGER:Failed to handle notification for channel {channel_id}")
+            # The change behind this notification is not in the mirror
+            await CalendarSyncService.mark_failed(channel.user_id, channel.calendar_id)
+            raise InternalError("Failed to handle notification")
+
+    # Private implementation methods
+    @classmethod
+    async def _reconcile(cls) -> None:
+        now = datetime.now(timezone.utc)
+        expiring = await WatchChannelRepository.list_expiring(now + timedelta(seconds=GOOGLE_WATCH_RENEW_BEFORE))
+        for channel in expiring:
+            renewed = False
+            token = await TokenRepository.retrieve(channel.token_id)
+            if token:
+                try:
+                    await cls.register(token, channel.calendar_id)
+                    renewed = True
+                except InternalError:
+                    pass
+            await cls.stop(channel)
+            if not renewed:
+                await CalendarSyncService.set_watched_until(channel.user_id, None, channel.calendar_id)
+
+        channels = await WatchChannelRepository.list_active(now)
+        watched = {(c.user_id, c.calendar_id) for c in channels}
+        watched_users = {c.user_id for c in channels}
+        for token in cls._latest_tokens(await TokenRepository.list()).values():
+            # Calendar lists rarely change; only new users and stale entries cost a calendarList call
+            if token.user_id in watched_users and token.user_id in cls._discovered:
+                continue
+            try:
+                calendar_ids = await CalendarService.list_calendar_ids(token.user_id)
+                cls._discovered[token.user_id] = True
+            except InternalError:
+                calendar_ids = ["primary"]
+            for calendar_id in calendar_ids:
+                if (token.user_id, calendar_id) in watched:
+                    continue
+                try:
+                    await cls.register(token, calendar_id)
+                except InternalError:
+                    continue
+
+    @staticmethod
+    def _latest_tokens(tokens) -> Dict[UUID, TokenOrm]:
+        """Pick the newest token of each user."""
+        latest: Dict[UUID, TokenOrm] = {}
+        for token in tokens:
+            current = latest.get(token.user_id)
+            if current is None or token.created_at > current.created_at:
+                latest[token.user_id] = token
+        return latest
@@ -1,10 +1,16 @@
+import asyncio
 import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Set
 from uuid import UUID
 
 from app.services.external.openai import ChatCompletionProvider
 from app.services.orchestrator.tools import ToolDispatcher
-from app.schemas.orchestrator.assistant import AssistantOutput
+from app.services.orchestrator.tool_output import ToolOutputSerializer
+from app.schemas.orchestrator.assistant import AssistantOutput, AssistantStreamEvent
 from app.schemas.orchestrator.tool import ToolCall
+from app.schemas.domain.session import SessionDTO
+from app.services.domain.session import SessionService
 
 logger = logging.getLogger(__name__)
 
@@ -12,44 +18,145 @@ logger = logging.getLogger(__name__)
 class AssistantService:
     """Handles user messages, interacts with LLM provider, and executes tools."""
 
+    MAX_TOOL_STEPS = 5
+    # Cancellations started after a client disconnect, kept referenced until done
+    _cancel_tasks: Set[asyncio.Task] = set()
+
     @classmethod
-    async def handle_user_message(cls, user_id: UUID, message: str, thread_id: str, context: str | None = None) -> AssistantOutput:
+    async def handle_user_message(cls, user_id: UUID, message: str, session: SessionDTO, context: str | None = None) -> AssistantOutput:
         """Handles a message from the user."""
+        thread_id = session.provider_thread_id
+        run_id = None
+        replied = False
+        tokens = ToolOutputSerializer.estimate_tokens(message)
         try:
-            # Start assistant run
-            output = await ChatCompletionProvider.complete(thread_id, message, context)
-            max_tool_steps = 5
-            steps = 0            
+            # Start assistant run, cancelling the previous one only if it is known to be in flight
+            await cls._cancel_previous_run(session)
+            run_id = await ChatCompletionProvider.start_run(thread_id, message, context)
+            await SessionService.set_run_state(session.id, run_id, "queued")
+            output = await ChatCompletionProvider.wait_run(thread_id, run_id)
+            steps = 0
 
             # Handle tool calls iteratively (multi-step tool reasoning)
-            while output.tool_name:
+            while output.tool_calls:
                 # Safety check infinite loop
                 steps += 1
-                if steps > max_tool_steps:
+                if steps > cls.MAX_TOOL_STEPS:
                     logger.warning(f" Max tool steps reached: {steps}")
                     raise RuntimeError("Max tool steps reached")
 
-                # Create tool call and execute it
-                tool_call = ToolCall(
-                    name=output.tool_name,
-                    arguments=output.arguments or {}
-                )
-                logger.warning(f" Tool call: {tool_call.model_dump(mode='json', exclude_none=True)}")
-                result = await ToolDispatcher.dispatch(user_id, tool_call)
+                # Execute every requested tool call concurrently
+                await SessionService.set_run_state(session.id, run_id, "requires_action")
+                tool_calls = [ToolCall(name=c.name, arguments=c.arguments) for c in output.tool_calls]
+                logger.warning(f" Tool calls: {[c.model_dump(mode='json', exclude_none=True) for c in tool_calls]}")
+                results = await ToolDispatcher.dispatch_many(user_id, tool_calls)
 
-                # Submit tool result back to provider and continue the run
-                output = await ChatCompletionProvider.submit_tool_result(
+                # Submit all tool results back to provider and continue the run
+                await SessionService.set_run_state(session.id, run_id, "in_progress")
+                outputs = [(c.id, ToolOutputSerializer.serialize(c.name, r)) for c, r in zip(output.tool_calls, results)]
+                tokens += sum(ToolOutputSerializer.estimate_tokens(o) for _, o in outputs)
+                output = await ChatCompletionProvider.submit_tool_results(
                     thread_id=thread_id,
-                    tool_call_id=output.tool_call_id,
                     run_id=output.run_id,
-                    result=result,
+                    results=outputs,
                 )
 
             # Final assistant response (no more tool calls)
+            await SessionService.set_run_state(session.id, None, "completed")
+            replied = True
+            tokens += ToolOutputSerializer.estimate_tokens(output.text or "")
             return output
 
         except Exception:
             logger.exception(f"LOGGER:Assistant error for user {user_id}")
             return AssistantOutput(
                 text="Sorry, something went wrong while processing your request."
-            )
\ No newline at end of file
+            )
+        finally:
+            if run_id:
+                await cls._record_usage(session.id, 2 if replied else 1, tokens)
+
+    @classmethod
+    async def stream_user_message(cls, user_id: UUID, message: str, session: SessionDTO, context: str | None = None) -> AsyncIterator[AssistantStreamEvent]:
+        """Streams tokens and tool progress for a message; the run is cancelled if the consumer goes away."""
+        thread_id = session.provider_thread_id
+        run_id = None
+        finished = False
+        replied = False
+        tokens = ToolOutputSerializer.estimate_tokens(message)
+        try:
+            await cls._cancel_previous_run(session)
+            events = ChatCompletionProvider.stream(thread_id, message, context)
+            steps = 0
+            while True:
+                pending = None
+                async with aclosing(events):
+                    async for event in events:
+                        if event.event == "started":
+                            run_id = event.run_id
+                            await SessionService.set_run_state(session.id, run_id, "queued")
+                            continue
+                        if event.event == "requires_action":
+                            pending = event
+                            continue
+                        if event.event == "token":
+                            tokens += ToolOutputSerializer.estimate_tokens(event.text or "")
+                        if event.event in ("done", "error"):
+                            finished = True
+                            replied = event.event == "done"
+                            await SessionService.set_run_state(session.id, None, "completed" if event.event == "done" else "failed")
+                        yield event
+                if pending is None:
+                    break
+
+                # Safety check infinite loop
+                steps += 1
+                if steps > cls.MAX_TOOL_STEPS:
+                    logger.warning(f" Max tool steps reached: {steps}")
+                    raise RuntimeError("Max tool steps reached")
+
+                await SessionService.set_run_state(session.id, run_id, "requires_action")
+                for call in pending.tool_calls:
+                    yield AssistantStreamEvent(event="tool_call", run_id=run_id, tool_name=call.name, arguments=call.arguments)
+                results = await ToolDispatcher.dispatch_many(user_id, [ToolCall(name=c.name, arguments=c.arguments) for c in pending.tool_calls])
+                for call in pending.tool_calls:
+                    yield AssistantStreamEvent(event="tool_result", run_id=run_id, tool_name=call.name)
+                await SessionService.set_run_state(session.id, run_id, "in_progress")
+                outputs = [(c.id, ToolOutputSerializer.serialize(c.name, r)) for c, r in zip(pending.tool_calls, results)]
+                tokens += sum(ToolOutputSerializer.estimate_tokens(o) for _, o in outputs)
+                events = ChatCompletionProvider.stream_tool_results(thread_id, pending.run_id, outputs)
+        except Exception:
+            logger.exception(f"LOGGER:Assistant stream error for user {user_id}")
+            yield AssistantStreamEvent(event="error", run_id=run_id, text="Sorry, something went wrong while processing your request.")
+        finally:
+            if run_id and not finished:
+                # The caller's scope may already be cancelled, so cancel the run from a separate task
+                task = asyncio.create_task(cls._abandon_run(session.id, thread_id, run_id, tokens))
+                cls._cancel_tasks.add(task)
+                task.add_done_callback(cls._cancel_tasks.discard)
+            elif run_id:
+                await cls._record_usage(session.id, 2 if replied else 1, tokens)
+
+    @classmethod
+    async def _cancel_previous_run(cls, session: SessionDTO) -> None:
+        """Cancel the session's last run if its recorded status says it still holds the thread."""
+        if session.active_run_id and session.run_status in ChatCompletionProvider.ACTIVE_RUN_STATUSES:
+            await cls._cancel_run(session.id, session.provider_thread_id, session.active_run_id)
+
+    @classmethod
+    async def _cancel_run(cls, session_id: UUID, thread_id: str, run_id: str) -> None:
+        await ChatCompletionProvider.cancel_run(thread_id, run_id)
+        await SessionService.set_run_state(session_id, None, "cancelled")
+
+    @classmethod
+    async def _abandon_run(cls, session_id: UUID, thread_id: str, run_id: str, tokens: int) -> None:
+        await cls._cancel_run(session_id, thread_id, run_id)
+        await cls._record_usage(session_id, 1, tokens)
+
+    @classmethod
+    async def _record_usage(cls, session_id: UUID, messages: int, tokens: int) -> None:
+        """Count the turn towards the thread's size; a failure here must not affect the reply."""
+        try:
+            await SessionService.record_usage(session_id, messages, tokens)
+        except Exception:
+            logger.warning(f" Failed to record usage for session {session_id}")
@@ -1,16 +1,19 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-def build_runtime_context(user_id: UUID) -> str:
+from app.services.orchestrator.time_parser import TimeParser
+
+def build_runtime_context(user_id: UUID, user_timezone: str) -> str:
     """Build dynamic runtime instructions for a single assistant run. This context is ephemeral and should not be stored in the thread."""
 
     now = datetime.now(timezone.utc)
+    local_now = now.astimezone(TimeParser.get_zone(user_timezone))
 
     return f"""
 Runtime context:
-- Today is {now.date().isoformat()}
-- Current time is {now.time().isoformat(timespec="minutes")} UTC
-- User timezone: Europe/Moscow
+- Today is {local_now.date().isoformat()}
+- Current time is {now.time().isoformat(timespec="minutes")} UTC ({local_now.time().isoformat(timespec="minutes")} local)
+- User timezone: {user_timezone}
 
 Rules:
 - Resolve relative dates (today, tomorrow, next week) based on the date above.
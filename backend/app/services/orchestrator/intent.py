@@ -0,0 +1,106 @@
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from app.schemas.domain.event import EventDTO, EventListCommand
+from app.services.domain.event import EventService
+from app.services.domain.user import UserService
+from app.services.orchestrator.time_parser import TimeParser
+from app.services.orchestrator.tools import parse_time_expression
+
+
+logger = logging.getLogger(__name__)
+
+MAX_EVENTS = 50
+
+_WHEN = r"(?P<when>today|tomorrow|this week|next week|monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+_NOUN = r"(agenda|schedule|calendar|events|meetings|plans)"
+# Whole-message patterns only: anything with extra words falls through to the LLM
+_PATTERNS = [
+    re.compile(rf"^(what'?s|what is|what do i have|do i have anything|anything)( on| planned| scheduled)?( for| on)? {_WHEN}$"),
+    re.compile(rf"^(show|list)( me)?( my)? {_NOUN}( for| on)? {_WHEN}$"),
+    re.compile(rf"^(what are )?(my )?{_NOUN}( for| on)? {_WHEN}$"),
+    re.compile(rf"^{_WHEN}'?s? {_NOUN}$"),
+]
+
+class IntentRouter:
+    """Answers simple agenda reads without an LLM run; everything else falls through."""
+
+    _counters: Dict[str, int] = {"routed": 0, "fallthrough": 0, "errors": 0}
+
+    @classmethod
+    async def route(cls, user_id: UUID, message: str) -> Optional[str]:
+        """Return a rendered answer if the message is a recognized agenda read, otherwise None."""
+        when = cls._match(message)
+        if when is None:
+            cls._counters["fallthrough"] += 1
+            return None
+        try:
+            user_timezone = await UserService.get_timezone(user_id)
+            tz = TimeParser.get_zone(user_timezone)
+            start_dt, end_dt, label = cls._resolve_window(when, user_timezone)
+            command = EventListCommand(start_dt=start_dt, end_dt=end_dt, limit=MAX_EVENTS)
+            events = await EventService.list_events(user_id, command)
+        except Exception:
+            # Let the assistant handle it rather than fail the message
+            logger.exception(f"LOGGER:Intent router failed for user {user_id}, falling through")
+            cls._counters["errors"] += 1
+            return None
+        cls._counters["routed"] += 1
+        key = f"intent_{when.replace(' ', '_')}"
+        cls._counters[key] = cls._counters.get(key, 0) + 1
+        return cls._render(events, label, tz, multi_day=end_dt - start_dt > timedelta(days=1))
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return routing decision counters."""
+        return dict(cls._counters)
+
+    # Private implementation methods
+    @staticmethod
+    def _match(message: str) -> Optional[str]:
+        text = re.sub(r"\s+", " ", re.sub(r"[?!.,]", " ", message.lower())).strip()
+        text = text.replace("’", "'")
+        for pattern in _PATTERNS:
+            match = pattern.match(text)
+            if match:
+                return match.group("when")
+        return None
+
+    @staticmethod
+    def _resolve_window(when: str, user_timezone: str) -> Tuple[datetime, datetime, str]:
+        """Turn the matched phrase into a [start, end) window in UTC and a label for the answer."""
+        tz = TimeParser.get_zone(user_timezone)
+        today = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+        if when == "this week":
+            return today.astimezone(timezone.utc), (today + timedelta(days=7 - today.weekday())).astimezone(timezone.utc), "this week"
+        if when == "next week":
+            monday = today + timedelta(days=7 - today.weekday())
+            return monday.astimezone(timezone.utc), (monday + timedelta(days=7)).astimezone(timezone.utc), "next week"
+        # Single days go through the same parser the tools use
+        anchor, _ = parse_time_expression(when, 0, user_timezone)
+        day = anchor.astimezone(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+        label = when if when in ("today", "tomorrow") else f"on {day:%A, %d %B}"
+        return day.astimezone(timezone.utc), (day + timedelta(days=1)).astimezone(timezone.utc), label
+
+    @staticmethod
+    def _render(events: List[EventDTO], label: str, tz: ZoneInfo, multi_day: bool) -> str:
+        if not events:
+            return f"You have nothing scheduled {label}."
+        lines = [f"You have {len(events)} event{'s' if len(events) != 1 else ''} {label}:"]
+        for event in events:
+            start, end = event.start_dt.astimezone(tz), event.end_dt.astimezone(tz)
+            all_day = event.end_dt - event.start_dt >= timedelta(days=1) and event.start_dt.astimezone(timezone.utc).time() == datetime.min.time()
+            when = "all day" if all_day else f"{start:%H:%M}–{end:%H:%M}"
+            if multi_day:
+                when = f"{(event.start_dt.astimezone(timezone.utc) if all_day else start):%a %d %b} {when}"
+            line = f"- {when} {event.title or '(no title)'}"
+            if event.location:
+                line += f" ({event.location})"
+            lines.append(line)
+        if len(events) >= MAX_EVENTS:
+            lines.append(f"Showing the first {MAX_EVENTS}.")
+        return "\n".join(lines)
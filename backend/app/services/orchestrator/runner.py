@@ -1,10 +1,18 @@
+import asyncio
 import logging
+import time
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, Dict
 from uuid import UUID
 
+from app.core.config import AI_MAX_CONCURRENT_RUNS, AI_MAX_QUEUED_TURNS, AI_MAX_PENDING_TURNS
 from app.services.orchestrator.assistant import AssistantService
-from app.schemas.orchestrator.assistant import AssistantOutput
+from app.schemas.orchestrator.assistant import AssistantOutput, AssistantStreamEvent
 from app.services.domain.session import SessionService  
+from app.services.domain.user import UserService
 from app.services.orchestrator.context import build_runtime_context
+from app.services.orchestrator.intent import IntentRouter
+from app.services.system.exceptions import QueueFullError
 
 logger = logging.getLogger(__name__)
 
@@ -12,23 +20,106 @@ logger = logging.getLogger(__name__)
 class AssistantRunner:
     """Orchestrates a single assistant interaction."""
 
+    # Turns of one user run one after another; different users share a global cap
+    _locks: Dict[UUID, asyncio.Lock] = {}
+    _depth: Dict[UUID, int] = {}
+    _slots = asyncio.Semaphore(AI_MAX_CONCURRENT_RUNS)
+    _waiting = 0
+    _active = 0
+    _counters: Dict[str, int] = {"turns": 0, "rejected": 0, "wait_ms_total": 0, "wait_ms_max": 0}
+
     @classmethod
     async def run(cls, *, user_id: UUID, message: str) -> AssistantOutput:
         """Runs one assistant interaction turn."""
+        # Simple agenda reads are answered without a run
+        text = await IntentRouter.route(user_id, message)
+        if text is not None:
+            return AssistantOutput(text=text)
+
+        async with cls._turn(user_id):
+            # Get or create session (thread)
+            session = await SessionService.get_or_create_for_user(user_id)
+
+            # Build runtime context
+            runtime_context = build_runtime_context(user_id, await UserService.get_timezone(user_id))
 
-        # Get or create session (thread)
-        session = await SessionService.get_or_create_for_user(user_id)
+            # Delegate to orchestrator
+            assistant_output = await AssistantService.handle_user_message(
+                user_id=user_id,
+                message=message,
+                session=session,
+                context=runtime_context,
+            )
 
-        # Build runtime context
-        runtime_context = build_runtime_context(user_id)
+            # Return assistant output
+            return assistant_output
+
+    @classmethod
+    async def stream(cls, *, user_id: UUID, message: str) -> AsyncIterator[AssistantStreamEvent]:
+        """Runs one assistant interaction turn, yielding output as it is produced."""
+        text = await IntentRouter.route(user_id, message)
+        if text is not None:
+            yield AssistantStreamEvent(event="token", text=text)
+            yield AssistantStreamEvent(event="done")
+            return
 
-        # Delegate to orchestrator
-        assistant_output = await AssistantService.handle_user_message(
-            user_id=user_id,
-            message=message,
-            thread_id=session.provider_thread_id,
-            context=runtime_context,
-        )
+        async with cls._turn(user_id):
+            session = await SessionService.get_or_create_for_user(user_id)
+            runtime_context = build_runtime_context(user_id, await UserService.get_timezone(user_id))
+            events = AssistantService.stream_user_message(
+                user_id=user_id,
+                message=message,
+                session=session,
+                context=runtime_context,
+            )
+            # Close the inner stream right away when the consumer stops, so the run gets cancelled
+            async with aclosing(events):
+                async for event in events:
+                    yield event
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return queue depth, concurrency and wait-time counters."""
+        return {
+            "active": cls._active,
+            "waiting": cls._waiting,
+            "queued_users": len(cls._depth),
+            **cls._counters,
+        }
+
+    # Private implementation methods
+    @classmethod
+    @asynccontextmanager
+    async def _turn(cls, user_id: UUID) -> AsyncIterator[None]:
+        """Wait for this user's earlier turns and a global slot; reject when queues are full."""
+        depth = cls._depth.get(user_id, 0)
+        if depth >= AI_MAX_QUEUED_TURNS or cls._waiting >= AI_MAX_PENDING_TURNS:
+            cls._counters["rejected"] += 1
+            raise QueueFullError("Too many messages in progress, please wait for the current reply")
 
-        # Return assistant output
-        return assistant_output
\ No newline at end of file
+        cls._depth[user_id] = depth + 1
+        lock = cls._locks.setdefault(user_id, asyncio.Lock())
+        cls._waiting += 1
+        waiting = True
+        started = time.monotonic()
+        try:
+            async with lock, cls._slots:
+                cls._waiting -= 1
+                waiting = False
+                waited_ms = int((time.monotonic() - started) * 1000)
+                cls._counters["turns"] += 1
+                cls._counters["wait_ms_total"] += waited_ms
+                cls._counters["wait_ms_max"] = max(cls._counters["wait_ms_max"], waited_ms)
+                cls._active += 1
+                try:
+                    yield
+                finally:
+                    cls._active -= 1
+        finally:
+            if waiting:
+                cls._waiting -= 1
+            cls._depth[user_id] -= 1
+            if not cls._depth[user_id]:
+                # Nobody holds or waits on the lock any more
+                del cls._depth[user_id]
+                del cls._locks[user_id]
@@ -0,0 +1,74 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+from cachetools import LRUCache
+import parsedatetime
+
+from app.core.config import DEFAULT_TIMEZONE, TIME_PARSER_CACHE_SIZE
+from app.services.system.exceptions import InternalError
+
+
+logger = logging.getLogger(__name__)
+
+class TimeParser:
+    """Resolves human-readable time expressions in the user's timezone, memoized per minute."""
+
+    # Building a Calendar compiles its locale's regexes, so keep one per locale
+    _calendars: Dict[str, parsedatetime.Calendar] = {}
+    _zones: Dict[str, ZoneInfo] = {}
+    # (expression, timezone, locale, minute) -> start (UTC) or None if unparseable
+    _cache: LRUCache = LRUCache(maxsize=TIME_PARSER_CACHE_SIZE)
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def parse(cls, time_expression: str, duration_minutes: int, user_timezone: str = DEFAULT_TIMEZONE, locale: str = "en_US") -> Tuple[datetime, datetime]:
+        """Resolve a time expression into start_dt and end_dt (UTC)."""
+        zone = cls.get_zone(user_timezone)
+        now = datetime.now(zone)
+        # Relative expressions only change meaning from one minute to the next
+        key = (" ".join(time_expression.lower().split()), user_timezone, locale, int(now.timestamp() // 60))
+        if key in cls._cache:
+            cls._hits += 1
+            start_dt = cls._cache[key]
+        else:
+            cls._misses += 1
+            start_dt = cls._parse(time_expression, now.replace(second=0, microsecond=0), zone, locale)
+            cls._cache[key] = start_dt
+        if start_dt is None:
+            raise InternalError(f"Failed to parse time expression: {time_expression}")
+        return start_dt, start_dt + timedelta(minutes=duration_minutes)
+
+    @classmethod
+    def get_zone(cls, name: str) -> ZoneInfo:
+        """Return a cached ZoneInfo."""
+        zone = cls._zones.get(name)
+        if zone is None:
+            zone = cls._zones[name] = ZoneInfo(name)
+        return zone
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Return memoization counters."""
+        return {"size": len(cls._cache), "hits": cls._hits, "misses": cls._misses}
+
+    # Private implementation methods
+    @classmethod
+    def _calendar(cls, locale: str) -> parsedatetime.Calendar:
+        calendar = cls._calendars.get(locale)
+        if calendar is None:
+            calendar = cls._calendars[locale] = parsedatetime.Calendar(parsedatetime.Constants(locale))
+        return calendar
+
+    @classmethod
+    def _parse(cls, time_expression: str, source_time: datetime, zone: ZoneInfo, locale: str) -> Optional[datetime]:
+        try:
+            # Without tzinfo parseDT returns naive wall time, which would be read as the server's zone
+            parsed_time, status = cls._calendar(locale).parseDT(time_expression, sourceTime=source_time.replace(tzinfo=None), tzinfo=zone)
+        except Exception:
+            logger.warning(f" Failed to parse time expression: {time_expression}")
+            return None
+        if status == 0 or parsed_time is None:
+            return None
+        return parsed_time.astimezone(timezone.utc)
@@ -0,0 +1,130 @@
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from app.core.config import AI_TOOL_OUTPUT_BUDGET
+
+
+logger = logging.getLogger(__name__)
+
+# Token budget per tool; others get AI_TOOL_OUTPUT_BUDGET
+TOOL_OUTPUT_BUDGETS: Dict[str, int] = {
+    "list_events": 1500,
+    "find_free_slots": 400,
+}
+# What list items are called in the overflow note
+TOOL_ITEM_NOUNS: Dict[str, str] = {
+    "list_events": "events",
+    "find_free_slots": "slots",
+}
+# Fields dropped first when items do not fit
+LOW_VALUE_FIELDS = ("description", "attendees")
+# Free-text fields that may be shortened; ids, timestamps and emails are passed back to tools and stay whole
+TEXT_FIELDS = ("title", "description", "location")
+
+# (max string length, max list length) per compaction level; the last level also drops LOW_VALUE_FIELDS
+_LEVELS = [(200, 5), (60, 0), (60, 0)]
+
+class ToolOutputSerializer:
+    """Serializes tool results for the LLM within a per-tool token budget."""
+
+    _counters: Dict[str, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "compacted": 0, "tokens_in": 0, "tokens_out": 0})
+
+    @classmethod
+    def serialize(cls, tool_name: str, result: Any) -> str:
+        """Return the tool output string, compacting it if it exceeds the tool's budget."""
+        budget = TOOL_OUTPUT_BUDGETS.get(tool_name, AI_TOOL_OUTPUT_BUDGET)
+        output = cls._dump(result)
+        tokens_in = cls.estimate_tokens(output)
+        counters = cls._counters[tool_name]
+        counters["calls"] += 1
+        counters["tokens_in"] += tokens_in
+        if tokens_in > budget:
+            output = cls._compact(result, budget, TOOL_ITEM_NOUNS.get(tool_name, "items"))
+            counters["compacted"] += 1
+            logger.warning(f" Tool output {tool_name} compacted: ~{tokens_in} -> ~{cls.estimate_tokens(output)} tokens")
+        counters["tokens_out"] += cls.estimate_tokens(output)
+        return output
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Rough token count (about four characters per token)."""
+        return (len(text) + 3) // 4
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """Return per-tool size counters."""
+        return {name: dict(counters) for name, counters in cls._counters.items()}
+
+    # Private implementation methods
+    @staticmethod
+    def _dump(value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    @classmethod
+    def _compact(cls, result: Any, budget: int, noun: str) -> str:
+        max_chars = budget * 4
+        if isinstance(result, list):
+            return cls._compact_list(result, max_chars, noun)
+        if isinstance(result, dict):
+            for max_str, max_list in _LEVELS[:2]:
+                output = cls._dump(cls._slim(result, max_str, max_list, drop_low_value=False))
+                if len(output) <= max_chars:
+                    return output
+            return cls._dump({"truncated": True, "content": output[:max_chars]})
+        output = cls._dump(result)
+        return output[:max_chars - 1] + "…"
+
+    @classmethod
+    def _compact_list(cls, items: List[Any], max_chars: int, noun: str) -> str:
+        """Slim items progressively, then keep as many as fit and summarize the rest."""
+        for level, (max_str, max_list) in enumerate(_LEVELS):
+            slim = [cls._slim(item, max_str, max_list, drop_low_value=level == len(_LEVELS) - 1) for item in items]
+            kept, omitted = cls._fit(slim, max_chars, noun)
+            if not omitted:
+                break
+        output: Dict[str, Any] = {noun: kept, "total": len(items)}
+        if omitted:
+            output["note"] = f"+{omitted} more {noun} not shown; narrow the time range to see them"
+        return cls._dump(output)
+
+    @classmethod
+    def _fit(cls, items: List[Any], max_chars: int, noun: str) -> Tuple[List[Any], int]:
+        # Room for the wrapper and the overflow note
+        used = len(noun) + 96
+        kept = []
+        for item in items:
+            size = len(cls._dump(item)) + 1
+            if used + size > max_chars:
+                break
+            kept.append(item)
+            used += size
+        return kept, len(items) - len(kept)
+
+    @classmethod
+    def _slim(cls, value: Any, max_str: int, max_list: int, drop_low_value: bool) -> Any:
+        """Drop empty fields, shorten long TEXT_FIELDS and cap lists (replaced by their length when max_list is 0)."""
+        if isinstance(value, dict):
+            slim = {}
+            for key, field in value.items():
+                if field is None or field == "" or field == []:
+                    continue
+                if drop_low_value and key in LOW_VALUE_FIELDS:
+                    continue
+                if isinstance(field, list) and max_list == 0:
+                    slim[f"{key}_count"] = len(field)
+                    continue
+                if key in TEXT_FIELDS and isinstance(field, str) and len(field) > max_str:
+                    slim[key] = field[:max_str - 1] + "…"
+                    continue
+                slim[key] = cls._slim(field, max_str, max_list, drop_low_value)
+            return slim
+        if isinstance(value, list):
+            slim = [cls._slim(v, max_str, max_list, drop_low_value) for v in value[:max_list]]
+            if len(value) > max_list:
+                slim.append(f"+{len(value) - max_list} more")
+            return slim
+        return value
@@ -1,13 +1,17 @@
+import asyncio
 import logging
 from uuid import UUID
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from zoneinfo import ZoneInfo
-from datetime import datetime, timezone, timedelta
-import parsedatetime
+from datetime import datetime
 
+from app.core.config import AI_TOOL_CONCURRENCY, DEFAULT_TIMEZONE
 from app.services.domain.event import EventService
+from app.services.domain.freebusy import FreeBusyService
+from app.services.domain.user import UserService
+from app.services.orchestrator.time_parser import TimeParser
 from app.schemas.domain.event import EventCreateCommand, EventListCommand, EventUpdateCommand
-from app.services.system.exceptions import InternalError, ToolExecutionError
+from app.schemas.domain.freebusy import FreeSlotQueryCommand
+from app.services.system.exceptions import ToolExecutionError
 from app.schemas.orchestrator.tool import ToolCall
 
 logger = logging.getLogger(__name__)
@@ -15,34 +19,24 @@ logger = logging.getLogger(__name__)
 # -----------------------------
 # Helper for parsing time expressions
 # -----------------------------
-def parse_time_expression(time_expression: str, duration_minutes: int, user_timezone: str = "Europe/Moscow") -> Tuple[datetime, datetime]:
+def parse_time_expression(time_expression: str, duration_minutes: int, user_timezone: str = DEFAULT_TIMEZONE) -> Tuple[datetime, datetime]:
     """Resolve a human-readable time expression into start_dt and end_dt (UTC)."""
-    try:
-        cal = parsedatetime.Calendar()
-        parsed_time, status = cal.parseDT(
-            time_expression,
-            sourceTime=datetime.now(ZoneInfo(user_timezone))
-            # sourceTime=datetime.now(timezone.utc).astimezone(ZoneInfo(user_timezone))
-        )
-        if status == 0 or parsed_time is None:
-            raise ValueError("Could not parse time expression")
-        start_dt = parsed_time.astimezone(timezone.utc)
-        end_dt = start_dt + timedelta(minutes=duration_minutes)
-        logger.warning(f" Parsed time expression UTC: {start_dt} - {end_dt} ")
-        return start_dt, end_dt
-    except Exception:
-        raise InternalError(f"Failed to parse time expression: {time_expression}")
+    start_dt, end_dt = TimeParser.parse(time_expression, duration_minutes, user_timezone)
+    logger.warning(f" Parsed time expression UTC: {start_dt} - {end_dt} ")
+    return start_dt, end_dt
 
 # -----------------------------
 # Tool handlers (formerly registry)
 # -----------------------------
 
-async def list_events(user_id: UUID, time_expression: str, duration_minutes: Optional[int] = 60, limit: Optional[int] = 10) -> list[dict]:
-    start_dt, end_dt = parse_time_expression(time_expression, duration_minutes or 60)
+async def list_events(user_id: UUID, time_expression: str, duration_minutes: Optional[int] = 60, limit: Optional[int] = 10, calendar_ids: Optional[List[str]] = None) -> list[dict]:
+    user_timezone = await UserService.get_timezone(user_id)
+    start_dt, end_dt = parse_time_expression(time_expression, duration_minutes or 60, user_timezone)
     command = EventListCommand(
         start_dt=start_dt,
         end_dt=end_dt,
         limit=limit or 10,
+        calendar_ids=calendar_ids,
     )
     events = await EventService.list_events(user_id, command)
     return [
@@ -54,6 +48,7 @@ async def list_events(user_id: UUID, time_expression: str, duration_minutes: Opt
             "description": e.description,
             "location": e.location,
             "attendees": e.attendees,
+            "calendar_id": e.calendar_id,
         }
         for e in events
     ]
@@ -66,8 +61,10 @@ async def create_event(
     location: Optional[str] = None,
     description: Optional[str] = None,
     attendees: Optional[List[str]] = None,
+    calendar_id: Optional[str] = None,
 ) -> str:
-    start_dt, end_dt = parse_time_expression(time_expression, duration_minutes or 60)
+    user_timezone = await UserService.get_timezone(user_id)
+    start_dt, end_dt = parse_time_expression(time_expression, duration_minutes or 60, user_timezone)
     command = EventCreateCommand(
         title=title,
         start_dt=start_dt,
@@ -76,7 +73,7 @@ async def create_event(
         location=location,
         attendees=attendees,
     )
-    event = await EventService.create_event(user_id, command)
+    event = await EventService.create_event(user_id, command, calendar_id or "primary")
     return f"Event created: {event.title} ({event.start_dt.isoformat()})"
 
 async def update_event(
@@ -88,15 +85,19 @@ async def update_event(
     location: Optional[str] = None,
     description: Optional[str] = None,
     attendees: Optional[List[str]] = None,
+    calendar_id: Optional[str] = None,
 ) -> str:
+    # Events listed from shared calendars carry their calendar_id; mutate them there
+    calendar_id = calendar_id or "primary"
     start_dt = end_dt = None
     if time_expression:
         if duration_minutes is None:
-            existing = await EventService.get_event(user_id, event_id)
+            existing = await EventService.get_event(user_id, event_id, calendar_id)
             duration_minutes = int(
                 (existing.end_dt - existing.start_dt).total_seconds() / 60
             )
-        start_dt, end_dt = parse_time_expression(time_expression, duration_minutes)
+        user_timezone = await UserService.get_timezone(user_id)
+        start_dt, end_dt = parse_time_expression(time_expression, duration_minutes, user_timezone)
     command = EventUpdateCommand(
         title=title,
         start_dt=start_dt,
@@ -105,13 +106,44 @@ async def update_event(
         description=description,
         attendees=attendees,
     )
-    event = await EventService.update_event(user_id, event_id, command)
+    event = await EventService.update_event(user_id, event_id, command, calendar_id)
     return f"Event updated: {event.title} ({event.start_dt.isoformat()})"
 
-async def delete_event(user_id: UUID, event_id: str) -> str:
-    await EventService.delete_event(user_id, event_id)
+async def delete_event(user_id: UUID, event_id: str, calendar_id: Optional[str] = None) -> str:
+    await EventService.delete_event(user_id, event_id, calendar_id or "primary")
     return f"Event deleted: {event_id}"
 
+async def find_free_slots(
+    user_id: UUID,
+    time_expression: str,
+    window_hours: Optional[int] = 24,
+    duration_minutes: Optional[int] = 30,
+    working_hours_start: Optional[str] = "09:00",
+    working_hours_end: Optional[str] = "18:00",
+    calendar_ids: Optional[List[str]] = None,
+    limit: Optional[int] = 5,
+) -> list[dict]:
+    user_timezone = await UserService.get_timezone(user_id)
+    start_dt, end_dt = parse_time_expression(time_expression, (window_hours or 24) * 60, user_timezone)
+    command = FreeSlotQueryCommand(
+        start_dt=start_dt,
+        end_dt=end_dt,
+        duration_minutes=duration_minutes or 30,
+        calendar_ids=calendar_ids or ["primary"],
+        working_hours_start=working_hours_start,
+        working_hours_end=working_hours_end,
+        timezone=user_timezone,
+        limit=limit or 5,
+    )
+    slots = await FreeBusyService.find_free_slots(user_id, command)
+    return [
+        {
+            "start_dt": s.start_dt.isoformat(),
+            "end_dt": s.end_dt.isoformat(),
+        }
+        for s in slots
+    ]
+
 # -----------------------------
 # Central registry
 # -----------------------------
@@ -120,6 +152,7 @@ TOOL_REGISTRY: Dict[str, Callable] = {
     "list_events": list_events,
     "update_event": update_event,
     "delete_event": delete_event,
+    "find_free_slots": find_free_slots,
 }
 
 # -----------------------------
@@ -128,6 +161,21 @@ TOOL_REGISTRY: Dict[str, Callable] = {
 class ToolDispatcher:
     """Dispatches tool calls to the correct handler."""
 
+    @classmethod
+    async def dispatch_many(cls, user_id: UUID, tool_calls: List[ToolCall]) -> List[Any]:
+        """Run tool calls concurrently; a failed call yields an error result instead of failing the rest."""
+        # AssistantRunner runs one turn per user at a time, so a per-call bound is per-user as well
+        semaphore = asyncio.Semaphore(AI_TOOL_CONCURRENCY)
+
+        async def dispatch_bounded(tool_call: ToolCall) -> Any:
+            async with semaphore:
+                try:
+                    return await cls.dispatch(user_id, tool_call)
+                except ToolExecutionError as e:
+                    return {"error": str(e)}
+
+        return await asyncio.gather(*(dispatch_bounded(c) for c in tool_calls))
+
     @classmethod
     async def dispatch(cls, user_id: UUID, tool_call: ToolCall) -> Any:
         try:
@@ -25,8 +25,23 @@ class UnprocessableEntityError(ServiceError):
 class InternalError(ServiceError):
     """Internal error (maps to 500).""" 
 
+class ExternalAPIError(InternalError):
+    """External API error (maps to 500)."""
+
+    def __init__(self, message: str, status_code: int | None = None, reason: str | None = None, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+class TooManyRequestsError(ExternalAPIError):
+    """Upstream quota still exhausted after retries (maps to 429)."""
+
+class QueueFullError(ServiceError):
+    """Too many pending requests (maps to 429)."""
+
 class ConflictError(ServiceError):
     """Conflict (maps to 409)."""
 
 class ToolExecutionError(ServiceError):
-    """Tool execution error (maps to 400)."""
\ No newline at end of file
+    """Tool execution error (maps to 400)."""
@@ -0,0 +1,48 @@
+"""Event mutations one request at a time vs through the batch endpoint, against a stub with fixed round-trip latency."""
+import argparse
+import asyncio
+
+import httpx
+
+from benchmarks._common import GoogleStub, batch_items, batch_response, creds, install, table, timed_async
+from app.services.external.google_calendar import GoogleCalendarClient
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/batch/"):
+        return batch_response([(index, 200, _event(f"e{index}")) for index, _, _ in batch_items(request)])
+    return httpx.Response(200, json=_event("e"))
+
+def _event(event_id: str) -> dict:
+    return {"id": event_id, "summary": "Bench", "start": {"dateTime": "2026-10-19T09:00:00Z"}, "end": {"dateTime": "2026-10-19T10:00:00Z"}}
+
+async def main(sizes, latency: float) -> None:
+    stub = GoogleStub(handler, latency)
+    install(stub)
+    user = creds()
+    body = {"summary": "Bench", "start": {"dateTime": "2026-10-19T09:00:00Z"}, "end": {"dateTime": "2026-10-19T10:00:00Z"}}
+    rows = []
+    for n in sizes:
+        async def sequential():
+            for _ in range(n):
+                await GoogleCalendarClient._request("POST", "/calendars/primary/events", user, body=body)
+
+        async def batched():
+            await GoogleCalendarClient.batch(user, [("POST", "/calendars/primary/events", body)] * n)
+
+        stub.reset()
+        seq = await timed_async(sequential, repeat=1)
+        seq_requests = stub.requests
+        stub.reset()
+        bat = await timed_async(batched, repeat=1)
+        rows.append([n, seq_requests, f"{seq * 1000:.0f}", stub.requests, f"{bat * 1000:.0f}", f"{seq / bat:.1f}x"])
+    await GoogleCalendarClient.close()
+    table(["items", "seq requests", "seq ms", "batch requests", "batch ms", "speedup"], rows,
+          f"Stub round trip: {latency * 1000:.0f} ms; batch chunks of 50 are sent concurrently.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.08, help="simulated round trip in seconds")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50, 200])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.latency))
@@ -0,0 +1,82 @@
+"""Raw events.list items -> EventDTO: the old per-event path vs EventConverter's single validation pass."""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from benchmarks._common import table
+from app.schemas.domain.event import EventDTO
+from app.schemas.external.google import GoogleEvent
+from app.services.domain.event_converter import EventConverter
+
+
+def items(n: int) -> List[dict]:
+    start = datetime(2026, 10, 19, 9, tzinfo=timezone.utc)
+    result = []
+    for i in range(n):
+        begin = start + timedelta(minutes=30 * i)
+        result.append({
+            "id": f"event{i}",
+            "etag": f'"{i}"',
+            "summary": f"Meeting {i}",
+            "description": "Weekly sync" if i % 3 else None,
+            "location": "Room 4.12" if i % 2 else None,
+            "attendees": [{"email": f"person{j}@example.com", "responseStatus": "accepted"} for j in range(i % 5)],
+            # One in ten is all-day
+            "start": {"date": f"{begin:%Y-%m-%d}"} if i % 10 == 0 else {"dateTime": begin.isoformat(), "timeZone": "UTC"},
+            "end": {"date": f"{begin + timedelta(days=1):%Y-%m-%d}"} if i % 10 == 0 else {"dateTime": (begin + timedelta(minutes=30)).isoformat(), "timeZone": "UTC"},
+        })
+    return result
+
+async def old_convert(event: GoogleEvent, calendar_id: Optional[str] = "primary") -> EventDTO:
+    """The conversion EventService used before: a coroutine per event and a second validation as EventDTO."""
+    def parse_google_dt(gdt):
+        if getattr(gdt, "dateTime", None):
+            return gdt.dateTime
+        return datetime.fromisoformat(gdt.date).replace(tzinfo=timezone.utc)
+
+    return EventDTO(
+        id=event.id,
+        title=event.summary,
+        description=event.description,
+        start_dt=parse_google_dt(event.start),
+        end_dt=parse_google_dt(event.end),
+        location=event.location,
+        attendees=[a.email for a in (event.attendees or [])],
+        calendar_id=calendar_id,
+    )
+
+async def old_path(raw: List[dict]) -> List[EventDTO]:
+    events = [GoogleEvent.model_validate(i) for i in raw]
+    return [await old_convert(e) for e in events]
+
+def new_path(raw: List[dict]) -> List[EventDTO]:
+    return EventConverter.from_google_items(raw)
+
+async def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        if asyncio.iscoroutine(result):
+            await result
+        best = min(best, time.perf_counter() - started)
+    return best
+
+async def main(sizes: List[int]) -> None:
+    rows = []
+    for n in sizes:
+        raw = items(n)
+        repeat = max(3, min(200, 20000 // n))
+        old = await best_of(lambda: old_path(raw), repeat)
+        new = await best_of(lambda: new_path(raw), repeat)
+        assert [e.model_dump() for e in await old_path(raw)] == [e.model_dump() for e in new_path(raw)]
+        rows.append([f"{n:,}", f"{old * 1000:.2f}", f"{new * 1000:.2f}", f"{old / n * 1e6:.1f}", f"{new / n * 1e6:.1f}", f"{old / new:.1f}x"])
+    table(["events", "old ms", "new ms", "old µs/event", "new µs/event", "speedup"], rows, "Best of several runs; outputs are checked to be identical.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
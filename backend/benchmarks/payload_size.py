@@ -0,0 +1,80 @@
+"""Response size with and without the partial-response field masks, plain and gzipped, on a full events.list fixture.
+
+The fixture is a full events.list page (conference data, reminders, creator/organizer, attendee details, ...).
+The masks are applied here the way Google applies fields=, so adding a field to GoogleEvent shows up in the numbers.
+"""
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from benchmarks._common import table, timed
+from app.schemas.external.google import EVENT_FIELDS, EVENT_LIST_FIELDS, EVENT_SYNC_FIELDS, GoogleEvent
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "events_list_full.json"
+
+def parse_mask(mask: str) -> Dict[str, Any]:
+    """Parse a fields= mask such as "items(id,start(date)),nextPageToken" into a nested dict (None = whole value)."""
+    def parse(pos: int) -> Tuple[Dict[str, Any], int]:
+        fields: Dict[str, Any] = {}
+        name = ""
+        while pos < len(mask):
+            char = mask[pos]
+            if char == "(":
+                fields[name], pos = parse(pos + 1)
+                name = ""
+            elif char == ")":
+                break
+            elif char == ",":
+                if name:
+                    fields[name] = None
+                name = ""
+            else:
+                name += char
+            pos += 1
+        if name:
+            fields[name] = None
+        return fields, pos
+    return parse(0)[0]
+
+def project(value: Any, fields: Dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [project(v, fields) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {k: (v if fields[k] is None else project(v, fields[k])) for k, v in value.items() if k in fields}
+
+def sizes(payload: Any) -> Tuple[int, int]:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return len(raw), len(gzip.compress(raw))
+
+def main() -> None:
+    page = json.loads(FIXTURE.read_text())
+    single = page["items"][0]
+    cases = [
+        ("events.list", page, EVENT_LIST_FIELDS),
+        ("events.list (sync)", page, EVENT_SYNC_FIELDS),
+        ("events.get", single, EVENT_FIELDS),
+    ]
+    rows = []
+    for label, payload, mask in cases:
+        masked = project(payload, parse_mask(mask))
+        full_raw, full_gzip = sizes(payload)
+        masked_raw, masked_gzip = sizes(masked)
+        rows.append([label, f"{full_raw:,}", f"{full_gzip:,}", f"{masked_raw:,}", f"{masked_gzip:,}", f"{full_raw / masked_gzip:.1f}x"])
+
+    # The masked payload must still carry everything GoogleEvent needs
+    masked_items = project(page, parse_mask(EVENT_LIST_FIELDS))["items"]
+    assert [GoogleEvent.model_validate(i).model_dump() for i in masked_items] == [GoogleEvent.model_validate(i).model_dump() for i in page["items"]]
+
+    full_body = json.dumps(page).encode()
+    masked_body = json.dumps(project(page, parse_mask(EVENT_LIST_FIELDS))).encode()
+    decode = lambda body: [GoogleEvent.model_validate(i) for i in json.loads(body)["items"]]
+    full_ms, masked_ms = timed(lambda: decode(full_body), 50) * 1000, timed(lambda: decode(masked_body), 50) * 1000
+
+    table(["call", "full B", "full gzip B", "masked B", "masked gzip B", "reduction"], rows,
+          f"{len(page['items'])} events per page. Decode + validate one page: full {full_ms:.2f} ms, masked {masked_ms:.2f} ms.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Server-side expansion (singleEvents=true) vs fetching recurring masters and expanding them locally.
+
+The stub plays Google: for singleEvents=true it expands every rule itself and pages the instances,
+for singleEvents=false it returns masters and exceptions only. Both paths use their real field masks.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from dateutil.rrule import rrulestr
+
+from benchmarks._common import GoogleStub, creds, install, table, timed_async
+from app.services.domain.event_converter import EventConverter
+from app.services.domain.recurrence import RecurrenceExpander
+from app.services.external.google_calendar import GoogleCalendarClient, MAX_PAGE_SIZE
+
+
+UTC = timezone.utc
+ORIGIN = datetime(2026, 1, 5, tzinfo=UTC)
+ATTENDEES = [{"email": f"teammate{i}@example.com", "responseStatus": "accepted"} for i in range(6)]
+
+def calendar() -> list:
+    """Masters, exceptions and single events of a busy work calendar."""
+    items = []
+    rules = [
+        ("standup", "RRULE:FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR", 9, 15),
+        ("lunch", "RRULE:FREQ=DAILY", 12, 60),
+        ("focus", "RRULE:FREQ=DAILY;BYDAY=MO,TU,WE,TH,FR", 14, 120),
+        ("one-on-one", "RRULE:FREQ=WEEKLY;BYDAY=TU", 11, 30),
+        ("planning", "RRULE:FREQ=WEEKLY;BYDAY=MO", 10, 60),
+        ("retro", "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=FR", 16, 60),
+        ("all-hands", "RRULE:FREQ=MONTHLY;BYDAY=1TH", 15, 60),
+        ("gym", "RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR", 7, 60),
+    ]
+    for name, rule, hour, minutes in rules:
+        start = ORIGIN.replace(hour=hour)
+        items.append({
+            "id": name,
+            "etag": f'"{name}"',
+            "summary": name.title(),
+            "description": f"Recurring {name} with the team. Agenda and notes are linked in the invite.",
+            "location": "Room 4.12",
+            "attendees": ATTENDEES,
+            "start": {"dateTime": start.isoformat(), "timeZone": "UTC"},
+            "end": {"dateTime": (start + timedelta(minutes=minutes)).isoformat(), "timeZone": "UTC"},
+            "recurrence": [rule],
+        })
+    # A moved standup and a cancelled lunch every few weeks
+    for week in range(0, 52, 3):
+        day = ORIGIN + timedelta(weeks=week)
+        original = day.replace(hour=9)
+        items.append({
+            "id": f"standup_{original:%Y%m%dT%H%M%SZ}", "etag": '"x"', "summary": "Standup (moved)", "recurringEventId": "standup",
+            "originalStartTime": {"dateTime": original.isoformat()},
+            "start": {"dateTime": original.replace(hour=10).isoformat()}, "end": {"dateTime": original.replace(hour=10, minute=15).isoformat()},
+        })
+        lunch = day.replace(hour=12) + timedelta(days=2)
+        items.append({"id": f"lunch_{lunch:%Y%m%dT%H%M%SZ}", "status": "cancelled", "recurringEventId": "lunch", "originalStartTime": {"dateTime": lunch.isoformat()}})
+    for n in range(200):
+        start = ORIGIN + timedelta(days=n * 1.8, hours=15)
+        items.append({"id": f"single{n}", "etag": '"s"', "summary": f"Meeting {n}", "attendees": ATTENDEES[:3],
+                      "start": {"dateTime": start.isoformat()}, "end": {"dateTime": (start + timedelta(minutes=45)).isoformat()}})
+    return items
+
+def expand_server_side(items: list, time_min: datetime, time_max: datetime) -> list:
+    """What Google returns for singleEvents=true, ordered by start time."""
+    overridden = {(i["recurringEventId"], i["originalStartTime"]["dateTime"]) for i in items if i.get("recurringEventId")}
+    instances = []
+    for item in items:
+        if item.get("status") == "cancelled":
+            continue
+        if not item.get("recurrence"):
+            start = datetime.fromisoformat(item["start"]["dateTime"])
+            if start < time_max and datetime.fromisoformat(item["end"]["dateTime"]) > time_min:
+                instances.append({k: v for k, v in item.items() if k not in ("recurringEventId", "originalStartTime")})
+            continue
+        start = datetime.fromisoformat(item["start"]["dateTime"])
+        duration = datetime.fromisoformat(item["end"]["dateTime"]) - start
+        for occurrence in rrulestr(item["recurrence"][0], dtstart=start).between(time_min - duration, time_max):
+            if (item["id"], occurrence.isoformat()) in overridden:
+                continue
+            instance = {k: v for k, v in item.items() if k != "recurrence"}
+            instance["id"] = f"{item['id']}_{occurrence:%Y%m%dT%H%M%SZ}"
+            instance["start"] = {"dateTime": occurrence.isoformat(), "timeZone": "UTC"}
+            instance["end"] = {"dateTime": (occurrence + duration).isoformat(), "timeZone": "UTC"}
+            instances.append(instance)
+    instances.sort(key=lambda i: i["start"]["dateTime"])
+    return instances
+
+def _touches(item: dict, time_min: datetime, time_max: datetime) -> bool:
+    times = item.get("start") and (item["start"]["dateTime"], item["end"]["dateTime"])
+    if not times:
+        original = datetime.fromisoformat(item["originalStartTime"]["dateTime"])
+        return time_min <= original < time_max
+    return datetime.fromisoformat(times[0]) < time_max and datetime.fromisoformat(times[1]) > time_min
+
+def make_handler(items: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        time_min, time_max = datetime.fromisoformat(params["timeMin"]), datetime.fromisoformat(params["timeMax"])
+        if params.get("singleEvents") == "true":
+            instances = expand_server_side(items, time_min, time_max)
+            offset = int(params.get("pageToken") or 0)
+            size = int(params.get("maxResults") or MAX_PAGE_SIZE)
+            page = {"items": instances[offset:offset + size]}
+            if offset + size < len(instances):
+                page["nextPageToken"] = str(offset + size)
+            return httpx.Response(200, json=page)
+        # Masters always come back; single events and exceptions only when they touch the window
+        return httpx.Response(200, json={"items": [i for i in items if i.get("recurrence") or _touches(i, time_min, time_max)]})
+    return handler
+
+async def main(latency: float) -> None:
+    items = calendar()
+    stub = GoogleStub(make_handler(items), latency)
+    install(stub)
+    user = creds()
+    rows = []
+    for label, days in (("month", 30), ("year", 365)):
+        start, end = ORIGIN + timedelta(days=14), ORIGIN + timedelta(days=14 + days)
+
+        async def server_side():
+            return EventConverter.from_google_items(await GoogleCalendarClient.list_event_items(user, None, start, end, order_by="startTime"))
+
+        async def local():
+            return RecurrenceExpander.expand(await GoogleCalendarClient.list_raw_events(user, start, end), start, end)
+
+        stub.reset()
+        remote_events = await server_side()
+        remote_requests, remote_bytes = stub.requests, stub.response_bytes
+        remote_ms = await timed_async(server_side) * 1000
+        stub.reset()
+        local_events = await local()
+        local_requests, local_bytes = stub.requests, stub.response_bytes
+        local_ms = await timed_async(local) * 1000
+        same = sorted((e.id, e.start_dt) for e in remote_events) == sorted((e.id, e.start_dt) for e in local_events)
+        rows.append([label, len(remote_events), remote_requests, f"{remote_bytes / 1024:.0f}", f"{remote_ms:.0f}",
+                     local_requests, f"{local_bytes / 1024:.0f}", f"{local_ms:.0f}", "yes" if same else "NO"])
+    await GoogleCalendarClient.close()
+    table(["window", "events", "server reqs", "server KiB", "server ms", "local reqs", "local KiB", "local ms", "same output"], rows,
+          f"Stub round trip: {latency * 1000:.0f} ms; response sizes are uncompressed JSON.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.08, help="simulated round trip in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.latency))
@@ -0,0 +1,61 @@
+"""Time-expression parsing: a fresh parsedatetime.Calendar per call (old) vs TimeParser, cold and memoized."""
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import parsedatetime
+
+from benchmarks._common import table, timed
+from app.services.orchestrator.time_parser import TimeParser
+
+
+# Phrases the assistant passes to the calendar tools
+CORPUS = [
+    "today", "tomorrow", "tonight", "now", "in 30 minutes", "in 2 hours", "in an hour",
+    "tomorrow at 9am", "tomorrow at 10:30", "tomorrow morning", "tomorrow afternoon", "tomorrow evening",
+    "today at 3pm", "today at 17:00", "this afternoon", "this evening",
+    "monday", "next monday", "next tuesday at 11am", "friday at 4pm", "next friday 2pm", "wednesday 9:15",
+    "next week", "this week", "next month", "in 3 days", "in two weeks", "day after tomorrow",
+    "october 25", "oct 25 at 14:00", "25 october 10am", "2026-11-02 09:00", "11/03 3pm",
+    "noon", "tomorrow noon", "midnight", "end of day", "saturday morning", "sunday evening", "next thursday 18:30",
+]
+ZONE = "Europe/Moscow"
+
+def old_parse(expression: str) -> datetime:
+    """What parse_time_expression did before TimeParser."""
+    calendar = parsedatetime.Calendar()
+    parsed, status = calendar.parseDT(expression, sourceTime=datetime.now(ZoneInfo(ZONE)))
+    return parsed.astimezone(timezone.utc)
+
+def new_parse(expression: str) -> datetime:
+    return TimeParser.parse(expression, 60, ZONE)[0]
+
+def main() -> None:
+    def run(parse):
+        for expression in CORPUS:
+            try:
+                parse(expression)
+            except Exception:
+                pass
+
+    def cold():
+        TimeParser._cache.clear()
+        run(new_parse)
+
+    old = timed(lambda: run(old_parse), 5)
+    new_cold = timed(cold, 5)
+    run(new_parse)
+    new_warm = timed(lambda: run(new_parse), 20)
+    unparsed = [e for e in CORPUS if TimeParser._parse(e, datetime.now(ZoneInfo(ZONE)), TimeParser.get_zone(ZONE), "en_US") is None]
+    per = lambda seconds: f"{seconds / len(CORPUS) * 1e6:.0f}"
+    table(["path", "corpus ms", "µs/expression"], [
+        ["new Calendar per call (old)", f"{old * 1000:.2f}", per(old)],
+        ["TimeParser, empty cache", f"{new_cold * 1000:.2f}", per(new_cold)],
+        ["TimeParser, memoized", f"{new_warm * 1000:.2f}", per(new_warm)],
+    ], f"{len(CORPUS)} expressions in {ZONE}; not understood by parsedatetime: {unparsed or 'none'}")
+
+    # The old path read the user's wall time as UTC for explicit times; show one example
+    local_nine = old_parse("tomorrow at 9am").astimezone(ZoneInfo(ZONE)).strftime("%H:%M")
+    print(f"'tomorrow at 9am' in {ZONE}: old path -> {local_nine} local, TimeParser -> {new_parse('tomorrow at 9am').astimezone(ZoneInfo(ZONE)):%H:%M} local")
+
+if __name__ == "__main__":
+    main()
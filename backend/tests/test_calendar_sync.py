@@ -0,0 +1,41 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from app.orm.calendar_sync import CalendarSyncOrm
+from app.services.intergration.calendar_sync import CalendarSyncService
+
+
+def _state(**kwargs) -> CalendarSyncOrm:
+    now = datetime.now(timezone.utc)
+    return CalendarSyncOrm(calendar_id="primary", sync_token="t", synced_at=now - timedelta(hours=1), **kwargs)
+
+
+def test_watched_mirror_is_fresh():
+    state = _state(watched_until=datetime.now(timezone.utc) + timedelta(days=1))
+    assert CalendarSyncService.is_fresh(state)
+
+
+def test_failed_sync_is_not_fresh_while_watched():
+    now = datetime.now(timezone.utc)
+    state = _state(watched_until=now + timedelta(days=1), sync_failed_at=now)
+    assert not CalendarSyncService.is_fresh(state)
+
+
+def test_stale_unwatched_mirror_is_not_fresh():
+    assert not CalendarSyncService.is_fresh(_state())
+
+
+@pytest.mark.anyio
+async def test_calendar_locks_are_dropped_after_use():
+    user_id = uuid.uuid4()
+
+    async def hold():
+        async with CalendarSyncService._calendar_lock(user_id, "primary"):
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(hold(), hold(), hold())
+    assert (user_id, "primary") not in CalendarSyncService._locks
+    assert (user_id, "primary") not in CalendarSyncService._lock_users
@@ -0,0 +1,82 @@
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.intergration import calendar_watch as watch_module
+from app.services.intergration.calendar_watch import CalendarWatchService
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeChannels:
+    def __init__(self, channels, lock_free=True):
+        self.channels = channels
+        self.lock_free = lock_free
+
+    @asynccontextmanager
+    async def reconcile_lock(self):
+        yield self.lock_free
+
+    async def list_expiring(self, before):
+        return []
+
+    async def list_active(self, now):
+        return self.channels
+
+
+class FakeCalendars:
+    calls = 0
+
+    @classmethod
+    async def list_calendar_ids(cls, user_id):
+        cls.calls += 1
+        return ["primary", "team@group.calendar.google.com"]
+
+
+@pytest.fixture
+def watch(monkeypatch):
+    user_id = uuid.uuid4()
+    token = SimpleNamespace(id=uuid.uuid4(), user_id=user_id, created_at=datetime.now(timezone.utc))
+    registered = []
+
+    async def list_tokens():
+        return [token]
+
+    async def register(token, calendar_id="primary"):
+        registered.append(calendar_id)
+
+    FakeCalendars.calls = 0
+    monkeypatch.setattr(watch_module, "TokenRepository", SimpleNamespace(list=list_tokens))
+    monkeypatch.setattr(watch_module, "CalendarService", FakeCalendars)
+    monkeypatch.setattr(CalendarWatchService, "register", register)
+    CalendarWatchService._discovered.clear()
+    return SimpleNamespace(user_id=user_id, registered=registered, monkeypatch=monkeypatch)
+
+
+def _channel(user_id, calendar_id):
+    return SimpleNamespace(user_id=user_id, calendar_id=calendar_id, expiration=datetime.now(timezone.utc) + timedelta(days=1))
+
+
+async def test_reconcile_is_skipped_without_the_lock(watch):
+    watch.monkeypatch.setattr(watch_module, "WatchChannelRepository", FakeChannels([], lock_free=False))
+    await CalendarWatchService.reconcile()
+    assert FakeCalendars.calls == 0
+    assert watch.registered == []
+
+
+async def test_new_user_gets_a_channel_per_calendar(watch):
+    watch.monkeypatch.setattr(watch_module, "WatchChannelRepository", FakeChannels([]))
+    await CalendarWatchService.reconcile()
+    assert watch.registered == ["primary", "team@group.calendar.google.com"]
+
+
+async def test_calendar_list_is_not_reread_every_run(watch):
+    channels = [_channel(watch.user_id, "primary"), _channel(watch.user_id, "team@group.calendar.google.com")]
+    watch.monkeypatch.setattr(watch_module, "WatchChannelRepository", FakeChannels(channels))
+    for _ in range(3):
+        await CalendarWatchService.reconcile()
+    assert FakeCalendars.calls == 1
+    assert watch.registered == []
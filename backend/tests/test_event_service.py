@@ -0,0 +1,110 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas.domain.event import EventListCommand, EventStreamCommand
+from app.services.domain import event as event_module
+from app.services.domain.event import EventService
+
+pytestmark = pytest.mark.anyio
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+END = datetime(2024, 5, 4, tzinfo=timezone.utc)
+
+
+def _timed(id: str, start: str, end: str) -> dict:
+    return {"id": id, "start": {"dateTime": start}, "end": {"dateTime": end}}
+
+
+def _all_day(id: str, date: str, next_date: str) -> dict:
+    return {"id": id, "start": {"date": date}, "end": {"date": next_date}}
+
+
+# Google's orderBy=startTime for a calendar in Asia/Tokyo (UTC+9): the all-day event on May 2 sorts at
+# 2024-05-01T15:00Z, ahead of the 18:00Z timed event, although EventDTO puts it at 2024-05-02T00:00Z
+TOKYO_ITEMS = [
+    _timed("tokyo-1", "2024-05-01T10:00:00Z", "2024-05-01T11:00:00Z"),
+    _all_day("tokyo-holiday", "2024-05-02", "2024-05-03"),
+    _timed("tokyo-2", "2024-05-01T18:00:00Z", "2024-05-01T19:00:00Z"),
+    _timed("tokyo-3", "2024-05-02T03:00:00Z", "2024-05-02T04:00:00Z"),
+]
+PRIMARY_ITEMS = [
+    _timed("primary-1", "2024-05-01T12:00:00Z", "2024-05-01T13:00:00Z"),
+    _timed("primary-2", "2024-05-02T01:00:00Z", "2024-05-02T02:00:00Z"),
+]
+LIVE = {"primary": PRIMARY_ITEMS, "tokyo": TOKYO_ITEMS}
+
+
+class FakeClient:
+    @staticmethod
+    async def iter_event_pages(creds, limit=None, start_dt=None, end_dt=None, order_by=None, page_size=2, calendar_id="primary"):
+        items = LIVE[calendar_id][:limit]
+        for i in range(0, len(items), page_size):
+            yield items[i:i + page_size]
+
+    @staticmethod
+    async def list_event_items(creds, limit=None, start_dt=None, end_dt=None, order_by=None, calendar_id="primary"):
+        return LIVE[calendar_id][:limit]
+
+
+class FakeSync:
+    @staticmethod
+    async def get_state(user_id, calendar_id="primary"):
+        return None
+
+    @staticmethod
+    def is_ready(state):
+        return False
+
+    @staticmethod
+    def schedule_sync(user_id, creds, calendar_id="primary"):
+        pass
+
+
+class FakeCalendars:
+    @staticmethod
+    async def list_calendar_ids(user_id):
+        return ["primary", "tokyo"]
+
+
+@pytest.fixture
+def live(monkeypatch):
+    async def creds(user_id):
+        return None
+
+    monkeypatch.setattr(event_module, "GoogleCalendarClient", FakeClient)
+    monkeypatch.setattr(event_module, "CalendarSyncService", FakeSync)
+    monkeypatch.setattr(event_module, "CalendarService", FakeCalendars)
+    monkeypatch.setattr(event_module, "CALENDAR_LOCAL_RECURRENCE", False)
+    monkeypatch.setattr(EventService, "_get_fresh_creds_for_user", creds)
+
+
+EXPECTED = ["tokyo-1", "primary-1", "tokyo-2", "tokyo-holiday", "primary-2", "tokyo-3"]
+
+
+async def test_stream_merges_every_calendar_in_start_order(live):
+    events = [e async for e in EventService.iter_events(uuid.uuid4(), EventStreamCommand(start_dt=START, end_dt=END))]
+    assert [e.id for e in events] == EXPECTED
+
+
+async def test_stream_limit_applies_to_the_merged_order(live):
+    command = EventStreamCommand(start_dt=START, end_dt=END, limit=3)
+    events = [e async for e in EventService.iter_events(uuid.uuid4(), command)]
+    assert [e.id for e in events] == EXPECTED[:3]
+
+
+async def test_stream_honours_calendar_ids(live):
+    command = EventStreamCommand(start_dt=START, end_dt=END, calendar_ids=["tokyo"])
+    events = [e async for e in EventService.iter_events(uuid.uuid4(), command)]
+    assert [e.id for e in events] == ["tokyo-1", "tokyo-2", "tokyo-holiday", "tokyo-3"]
+
+
+async def test_list_merges_all_day_event_of_non_utc_calendar_in_order(live):
+    events = await EventService.list_events(uuid.uuid4(), EventListCommand(start_dt=START, end_dt=END, limit=10))
+    assert [e.id for e in events] == EXPECTED
+
+
+async def test_list_limit_cuts_the_merged_order(live):
+    events = await EventService.list_events(uuid.uuid4(), EventListCommand(start_dt=START, end_dt=END, limit=4))
+    assert [e.id for e in events] == EXPECTED[:4]
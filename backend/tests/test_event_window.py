@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from app.schemas.domain.event import EventDTO
+from app.services.domain.event_window import EventWindow
+
+
+def _event(id: str, start_hour: int, end_hour: int, day: int = 1) -> EventDTO:
+    return EventDTO(
+        id=id,
+        start_dt=datetime(2024, 5, day, start_hour, tzinfo=timezone.utc),
+        end_dt=datetime(2024, 5, day, end_hour, tzinfo=timezone.utc),
+    )
+
+
+def test_from_events_sorts_unordered_input():
+    # An all-day event on the 2nd listed ahead of timed events on the 1st, as Google returns them
+    events = [_event("all-day", 0, 23, day=2), _event("late", 15, 16), _event("early", 9, 10)]
+    window = EventWindow.from_events(events)
+    assert [e.id for e in window] == ["early", "late", "all-day"]
+
+
+def test_busy_merges_overlaps_after_sorting():
+    window = EventWindow.from_events([_event("b", 10, 12), _event("a", 9, 11)])
+    assert window.busy() == [
+        (datetime(2024, 5, 1, 9, tzinfo=timezone.utc), datetime(2024, 5, 1, 12, tzinfo=timezone.utc)),
+    ]
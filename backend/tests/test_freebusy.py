@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.domain.freebusy import FreeSlotQueryCommand
+from app.schemas.external.google import GoogleEvent
+from app.services.domain import event as event_module
+from app.services.domain import freebusy as freebusy_module
+from app.services.domain.freebusy import FreeBusyService
+from app.services.intergration.calendar_sync import CalendarSyncService
+
+pytestmark = pytest.mark.anyio
+
+
+def _at(hour: int) -> datetime:
+    return datetime(2024, 5, 1, hour, tzinfo=timezone.utc)
+
+
+def _row(google_id: str, start: int, end: int, all_day=False, transparency=None, response_status=None):
+    return SimpleNamespace(
+        google_id=google_id, calendar_id="primary", start_dt=_at(start), end_dt=_at(end), summary=None,
+        description=None, location=None, attendees=[], all_day=all_day, transparency=transparency,
+        response_status=response_status,
+    )
+
+
+MIRROR = [
+    _row("all-day", 0, 23, all_day=True),
+    _row("meeting", 9, 10),
+    _row("marked-free", 11, 12, transparency="transparent"),
+    _row("declined", 13, 14, response_status="declined"),
+    _row("accepted", 15, 16, response_status="accepted"),
+]
+
+
+class FreshMirror:
+    @staticmethod
+    async def get_state(user_id, calendar_id="primary"):
+        return SimpleNamespace()
+
+    @staticmethod
+    def is_ready(state):
+        return True
+
+    @staticmethod
+    def is_fresh(state):
+        return True
+
+
+class FakeRepository:
+    @staticmethod
+    async def stream_window(user_id, start_dt=None, end_dt=None, limit=None, calendar_id=None):
+        for row in MIRROR:
+            yield row
+
+
+async def test_mirror_busy_skips_transparent_declined_and_all_day(monkeypatch):
+    monkeypatch.setattr(freebusy_module, "CalendarSyncService", FreshMirror)
+    monkeypatch.setattr(event_module, "CalendarSyncService", FreshMirror)
+    monkeypatch.setattr(event_module, "EventRepository", FakeRepository)
+
+    command = FreeSlotQueryCommand(start_dt=_at(0), end_dt=_at(23))
+    busy = await FreeBusyService.get_busy(uuid.uuid4(), command)
+    assert list(busy) == [(_at(9), _at(10)), (_at(15), _at(16))]
+
+
+def test_mirror_row_keeps_transparency_and_own_response():
+    event = GoogleEvent.model_validate({
+        "id": "evt",
+        "start": {"dateTime": "2024-05-01T09:00:00Z"},
+        "end": {"dateTime": "2024-05-01T10:00:00Z"},
+        "transparency": "transparent",
+        "attendees": [
+            {"email": "organizer@example.com", "responseStatus": "accepted"},
+            {"email": "me@example.com", "responseStatus": "declined", "self": True},
+        ],
+    })
+    row = CalendarSyncService._to_row(uuid.uuid4(), "primary", event)
+    assert row["transparency"] == "transparent"
+    assert row["response_status"] == "declined"
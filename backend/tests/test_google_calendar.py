@@ -0,0 +1,221 @@
+import json
+import re
+from datetime import datetime, timezone
+from typing import Callable, List
+
+import httpx
+import pytest
+from google.oauth2.credentials import Credentials
+
+from app.core.config import GOOGLE_API_BASE_URL
+from app.schemas.external.google import EVENT_LIST_FIELDS
+from app.services.external.google_calendar import GoogleCalendarClient
+from app.services.external.google_scheduler import GoogleRequestScheduler
+from app.services.system.exceptions import ExternalAPIError, TooManyRequestsError
+
+
+pytestmark = pytest.mark.anyio
+
+def event(event_id: str, hour: int = 9) -> dict:
+    return {
+        "id": event_id,
+        "etag": f'"{event_id}-etag"',
+        "summary": f"Event {event_id}",
+        "start": {"dateTime": f"2026-10-19T{hour:02d}:00:00Z"},
+        "end": {"dateTime": f"2026-10-19T{hour + 1:02d}:00:00Z"},
+    }
+
+def batch_response(parts: List[tuple], boundary: str = "batch_resp") -> httpx.Response:
+    """Build a multipart/mixed batch response from (index, status, body) parts."""
+    chunks = []
+    for index, status_code, body in parts:
+        payload = json.dumps(body) if body is not None else ""
+        chunks.append(
+            f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-item-{index}>\r\n\r\n"
+            f"HTTP/1.1 {status_code} {httpx.codes.get_reason_phrase(status_code)}\r\nContent-Type: application/json\r\n\r\n{payload}\r\n"
+        )
+    text = "".join(chunks) + f"--{boundary}--\r\n"
+    return httpx.Response(200, text=text, headers={"Content-Type": f"multipart/mixed; boundary={boundary}"})
+
+def batch_items(request: httpx.Request) -> List[tuple]:
+    """Split a batch request into (index, method, path) items."""
+    body = request.content.decode()
+    return [
+        (int(index), method, path)
+        for index, method, path in re.findall(r"Content-ID: <item-(\d+)>\r\n\r\n(\w+) (\S+) HTTP/1.1", body)
+    ]
+
+
+class GoogleStub:
+    """Stands in for the Calendar API: records requests and answers through a swappable handler."""
+
+    def __init__(self):
+        self.requests: List[httpx.Request] = []
+        self.handler: Callable[[httpx.Request], httpx.Response] = lambda request: httpx.Response(404)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.handler(request)
+
+
+@pytest.fixture
+def google(monkeypatch):
+    stub = GoogleStub()
+    GoogleCalendarClient._client = httpx.AsyncClient(base_url=GOOGLE_API_BASE_URL, transport=httpx.MockTransport(stub))
+    # No real waiting between retries, and a fresh quota per test
+    monkeypatch.setattr(GoogleRequestScheduler, "_backoff", staticmethod(lambda attempt: 0))
+    GoogleRequestScheduler._user_buckets.clear()
+    yield stub
+    GoogleCalendarClient._client = None
+
+@pytest.fixture
+def creds():
+    return Credentials(token="access-token", refresh_token="refresh-token")
+
+
+async def test_list_events_walks_pages_with_field_mask(google, creds):
+    pages = {None: {"items": [event("a"), event("b")], "nextPageToken": "p2"}, "p2": {"items": [event("c")]}}
+    google.handler = lambda request: httpx.Response(200, json=pages[request.url.params.get("pageToken")])
+
+    events = await GoogleCalendarClient.list_events(creds, limit=None, start_dt=datetime(2026, 10, 19, tzinfo=timezone.utc))
+
+    assert [e.id for e in events] == ["a", "b", "c"]
+    first = google.requests[0]
+    assert first.url.path.endswith("/calendars/primary/events")
+    assert first.url.params["fields"] == EVENT_LIST_FIELDS
+    assert first.url.params["singleEvents"] == "true"
+    assert first.headers["Authorization"] == "Bearer access-token"
+
+async def test_list_events_stops_at_limit(google, creds):
+    google.handler = lambda request: httpx.Response(200, json={"items": [event("a"), event("b"), event("c")], "nextPageToken": "more"})
+
+    events = await GoogleCalendarClient.list_events(creds, limit=2)
+
+    assert [e.id for e in events] == ["a", "b"]
+    assert len(google.requests) == 1
+    assert google.requests[0].url.params["maxResults"] == "2"
+
+async def test_transient_error_is_retried(google, creds):
+    responses = iter([httpx.Response(503), httpx.Response(200, json=event("a"))])
+    google.handler = lambda request: next(responses)
+
+    result = await GoogleCalendarClient.get_event(creds, "a")
+
+    assert result.id == "a"
+    assert len(google.requests) == 2
+
+async def test_rate_limit_exhausting_retries_raises_too_many_requests(google, creds):
+    google.handler = lambda request: httpx.Response(429, json={"error": {"message": "Rate Limit Exceeded", "errors": [{"reason": "rateLimitExceeded"}]}})
+
+    with pytest.raises(TooManyRequestsError):
+        await GoogleCalendarClient.get_event(creds, "a")
+    assert len(google.requests) > 1
+
+async def test_gone_sync_token_is_not_retried(google, creds):
+    google.handler = lambda request: httpx.Response(410, json={"error": {"message": "Sync token is no longer valid", "errors": [{"reason": "fullSyncRequired"}]}})
+
+    with pytest.raises(ExternalAPIError) as error:
+        await GoogleCalendarClient.list_event_changes(creds, sync_token="stale")
+    assert error.value.status_code == 410
+    assert error.value.reason == "fullSyncRequired"
+    assert len(google.requests) == 1
+    assert google.requests[0].url.params["syncToken"] == "stale"
+
+async def test_get_event_not_modified_returns_none(google, creds):
+    google.handler = lambda request: httpx.Response(304)
+
+    assert await GoogleCalendarClient.get_event(creds, "a", etag='"a-etag"') is None
+    assert google.requests[0].headers["If-None-Match"] == '"a-etag"'
+
+async def test_event_paths_quote_calendar_and_event_ids(google, creds):
+    google.handler = lambda request: httpx.Response(204)
+
+    await GoogleCalendarClient.delete_event(creds, "a/b", calendar_id="team#1@group.calendar.google.com")
+
+    assert google.requests[0].url.raw_path.decode() == "/calendar/v3/calendars/team%231%40group.calendar.google.com/events/a%2Fb"
+
+async def test_batch_parses_responses_by_content_id(google, creds):
+    def handler(request: httpx.Request) -> httpx.Response:
+        items = batch_items(request)
+        assert [(method, path.rsplit("/", 1)[-1]) for _, method, path in items] == [("POST", "events"), ("PATCH", "b"), ("DELETE", "c")]
+        # Parts may come back in any order
+        return batch_response([
+            (2, 204, None),
+            (0, 200, event("a")),
+            (1, 404, {"error": {"message": "Not Found"}}),
+        ])
+    google.handler = handler
+
+    results = await GoogleCalendarClient.batch(creds, [
+        ("POST", "/calendars/primary/events", {"summary": "A"}),
+        ("PATCH", "/calendars/primary/events/b", {"summary": "B"}),
+        ("DELETE", "/calendars/primary/events/c", None),
+    ])
+
+    assert results == [(200, event("a")), (404, {"error": {"message": "Not Found"}}), (204, {})]
+    assert google.requests[0].headers["Content-Type"].startswith("multipart/mixed; boundary=")
+
+async def test_refresh_creds_updates_token(google, creds):
+    google.handler = lambda request: httpx.Response(200, json={"access_token": "new-token", "expires_in": 3600})
+
+    refreshed = await GoogleCalendarClient.refresh_creds(creds)
+
+    assert refreshed.token == "new-token"
+    assert refreshed.expiry > datetime.now(timezone.utc).replace(tzinfo=None)
+    assert b"grant_type=refresh_token" in google.requests[0].content
+
+async def test_batch_keeps_results_of_applied_chunks_when_one_fails(google, creds):
+    def handler(request: httpx.Request) -> httpx.Response:
+        items = batch_items(request)
+        if items[0][2].endswith("/events/fail-0"):
+            return httpx.Response(400, json={"error": {"message": "Invalid batch"}})
+        return batch_response([(index, 204, None) for index, _, _ in items])
+    google.handler = handler
+    calls = [("DELETE", f"/calendars/primary/events/ok-{i}", None) for i in range(50)]
+    calls += [("DELETE", f"/calendars/primary/events/fail-{i}", None) for i in range(10)]
+
+    results = await GoogleCalendarClient.batch(creds, calls)
+
+    assert len(results) == 60
+    assert all(status_code == 204 for status_code, _ in results[:50])
+    assert all(status_code == 400 and body["error"]["message"] for status_code, body in results[50:])
+
+async def test_batch_raises_when_every_chunk_fails(google, creds):
+    google.handler = lambda request: httpx.Response(400, json={"error": {"message": "Invalid batch"}})
+
+    with pytest.raises(ExternalAPIError):
+        await GoogleCalendarClient.batch(creds, [("DELETE", "/calendars/primary/events/a", None)])
+
+async def test_insert_is_not_retried_after_server_error(google, creds):
+    google.handler = lambda request: httpx.Response(500, json={"error": {"message": "Backend Error"}})
+
+    with pytest.raises(ExternalAPIError):
+        await GoogleCalendarClient.create_event(creds, {"title": "A"})
+    # A retry could create the event twice
+    assert len(google.requests) == 1
+
+async def test_insert_is_retried_after_rate_limit(google, creds):
+    responses = iter([httpx.Response(429), httpx.Response(200, json=event("a"))])
+    google.handler = lambda request: next(responses)
+
+    result = await GoogleCalendarClient.create_event(creds, {"title": "A"})
+
+    assert result.id == "a"
+    assert len(google.requests) == 2
+
+async def test_long_retry_after_fails_fast(google, creds):
+    google.handler = lambda request: httpx.Response(429, headers={"Retry-After": "3600"})
+
+    with pytest.raises(TooManyRequestsError) as error:
+        await GoogleCalendarClient.get_event(creds, "a")
+    assert error.value.retry_after == 3600
+    assert len(google.requests) == 1
+
+async def test_malformed_retry_after_falls_back_to_backoff(google, creds):
+    responses = iter([httpx.Response(503, headers={"Retry-After": "soon"}), httpx.Response(200, json=event("a"))])
+    google.handler = lambda request: next(responses)
+
+    result = await GoogleCalendarClient.get_event(creds, "a")
+
+    assert result.id == "a"
+    assert len(google.requests) == 2
@@ -0,0 +1,86 @@
+import asyncio
+import re
+import time
+
+import httpx
+import pytest
+
+from app.services.external import openai as openai_module
+from app.services.external.openai import ChatCompletionProvider
+
+
+pytestmark = pytest.mark.anyio
+
+LATENCY = 0.1
+USERS = 20
+
+class OpenAIStub:
+    """Answers the Assistants endpoints used by a turn after a fixed latency, tracking how many requests overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+            return self.route(request)
+        finally:
+            self.in_flight -= 1
+
+    @staticmethod
+    def route(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        thread_id = re.search(r"/threads/([^/]+)", path).group(1)
+        run = {"id": f"run_{thread_id}", "object": "thread.run", "thread_id": thread_id, "status": "completed"}
+        if request.method == "POST" and path.endswith("/messages"):
+            return httpx.Response(200, json={"id": "msg_user", "object": "thread.message", "thread_id": thread_id, "role": "user", "content": []})
+        if request.method == "POST" and path.endswith("/runs"):
+            return httpx.Response(200, json={**run, "status": "queued"})
+        if request.method == "GET" and "/runs/" in path:
+            return httpx.Response(200, json=run)
+        if request.method == "GET" and path.endswith("/messages"):
+            message = {
+                "id": "msg_reply", "object": "thread.message", "thread_id": thread_id, "role": "assistant",
+                "content": [{"type": "text", "text": {"value": f"Reply in {thread_id}", "annotations": []}}],
+            }
+            return httpx.Response(200, json={"object": "list", "data": [message], "has_more": False})
+        return httpx.Response(404, json={"error": {"message": f"Unexpected {request.method} {path}"}})
+
+
+@pytest.fixture
+async def openai_stub(monkeypatch):
+    stub = OpenAIStub()
+
+    class StubbedClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(transport=httpx.MockTransport(stub), **kwargs)
+
+    # Keep get_client's own construction and only swap the network for the stub
+    monkeypatch.setattr(openai_module.httpx, "AsyncClient", StubbedClient)
+    await ChatCompletionProvider.close()
+    yield stub
+    await ChatCompletionProvider.close()
+
+
+async def test_client_is_shared(openai_stub):
+    assert ChatCompletionProvider.get_client() is ChatCompletionProvider.get_client()
+
+async def test_concurrent_turns_are_served_in_parallel(openai_stub):
+    started = time.perf_counter()
+    one = await ChatCompletionProvider.complete("thread_warmup", "hello")
+    single_turn = time.perf_counter() - started
+    assert one.text == "Reply in thread_warmup"
+
+    started = time.perf_counter()
+    outputs = await asyncio.gather(*(ChatCompletionProvider.complete(f"thread_{n}", "hello") for n in range(USERS)))
+    elapsed = time.perf_counter() - started
+
+    assert [o.text for o in outputs] == [f"Reply in thread_{n}" for n in range(USERS)]
+    # All users' requests overlap on the shared client instead of queueing behind one another
+    assert openai_stub.max_in_flight >= USERS
+    assert elapsed < single_turn * 3, f"{USERS} turns took {elapsed:.2f}s, one turn {single_turn:.2f}s"
@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.domain.profile import ProfileUpdateDTO
+
+
+def test_timezone_is_optional():
+    assert ProfileUpdateDTO(name="Maria").model_dump(exclude_unset=True) == {"name": "Maria"}
+
+def test_valid_timezone_is_accepted():
+    assert ProfileUpdateDTO(timezone="Europe/Berlin").timezone == "Europe/Berlin"
+
+@pytest.mark.parametrize("value", [None, "Mars/Olympus", ""])
+def test_null_or_unknown_timezone_is_rejected(value):
+    with pytest.raises(ValidationError):
+        ProfileUpdateDTO(timezone=value)
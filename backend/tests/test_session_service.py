@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import AI_THREAD_MAX_MESSAGES
+from app.orm.session import SessionOrm
+from app.services.domain import session as session_module
+from app.services.domain.session import SessionService
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSessionRepository:
+    """In-memory stand-in for the sessions table shared by every simulated worker."""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def create(self, data: SessionOrm) -> SessionOrm:
+        data.id = data.id or uuid.uuid4()
+        data.created_at = data.updated_at = datetime.now(timezone.utc)
+        data.topic = data.topic or "general"
+        data.rotated_at = None
+        self.rows[data.id] = data
+        await asyncio.sleep(0)
+        return data
+
+    async def retrieve_by_user_id(self, user_id):
+        rows = [r for r in self.rows.values() if r.user_id == user_id]
+        return max(rows, key=lambda r: r.created_at) if rows else None
+
+    async def claim_rotation(self, id) -> bool:
+        await asyncio.sleep(0)
+        if self.rows[id].rotated_at is not None:
+            return False
+        self.rows[id].rotated_at = datetime.now(timezone.utc)
+        return True
+
+    async def release_rotation(self, id) -> None:
+        self.rows[id].rotated_at = None
+
+    async def add_usage(self, id, messages, tokens):
+        self.rows[id].message_count += messages
+        return self.rows[id].rotated_at
+
+
+class FakeProvider:
+    ACTIVE_RUN_STATUSES = set()
+    threads = 0
+
+    @classmethod
+    async def create_thread(cls, seed=None):
+        cls.threads += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(id=f"thread_{cls.threads}")
+
+    @classmethod
+    async def get_transcript(cls, thread_id, limit):
+        return [("user", "hello")]
+
+    @classmethod
+    async def summarize(cls, transcript):
+        return "said hello"
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    repo = FakeSessionRepository()
+    monkeypatch.setattr(session_module, "SessionRepository", repo)
+    monkeypatch.setattr(session_module, "ChatCompletionProvider", FakeProvider)
+    SessionService._sessions.clear()
+    SessionService._owners.clear()
+    return repo
+
+
+async def _full_session(repo, user_id):
+    row = await repo.create(SessionOrm(
+        id=uuid.uuid4(), user_id=user_id, provider_thread_id="thread_old", topic="general",
+        message_count=AI_THREAD_MAX_MESSAGES, token_estimate=0,
+    ))
+    return session_module.SessionDTO.model_validate(row)
+
+
+async def test_only_one_worker_rotates(repo):
+    user_id = uuid.uuid4()
+    old = await _full_session(repo, user_id)
+    # Two workers holding the same stale session rotate at once
+    results = await asyncio.gather(SessionService.rotate(old), SessionService.rotate(old.model_copy()))
+    successors = [r for r in repo.rows.values() if r.parent_session_id == old.id]
+    assert len(successors) == 1
+    assert {r.id for r in results} == {old.id, successors[0].id}
+
+
+async def test_stale_cache_picks_up_other_workers_rotation(repo):
+    user_id = uuid.uuid4()
+    old = await _full_session(repo, user_id)
+    SessionService._remember(old)
+    # Another worker already rotated the session
+    successor = await repo.create(SessionOrm(
+        id=uuid.uuid4(), user_id=user_id, provider_thread_id="thread_new", topic="general",
+        message_count=1, token_estimate=0, parent_session_id=old.id,
+    ))
+    repo.rows[old.id].rotated_at = datetime.now(timezone.utc)
+
+    session = await SessionService.get_or_create_for_user(user_id)
+    assert session.id == successor.id
+    assert not [r for r in repo.rows.values() if r.parent_session_id == old.id and r.id != successor.id]
+
+
+async def test_usage_on_retired_session_drops_cache(repo):
+    user_id = uuid.uuid4()
+    old = await _full_session(repo, user_id)
+    SessionService._remember(old)
+    repo.rows[old.id].rotated_at = datetime.now(timezone.utc)
+    await SessionService.record_usage(old.id, 1, 10)
+    assert SessionService._sessions.get(user_id) is None
@@ -0,0 +1,39 @@
+import json
+
+from app.services.orchestrator.tool_output import ToolOutputSerializer
+
+# Shared and team calendars look like c_<64 hex>@group.calendar.google.com, well past the 60-character text cap
+TEAM_CALENDAR_ID = "c_" + "0123456789abcdef" * 4 + "@group.calendar.google.com"
+
+
+def _event(i: int) -> dict:
+    return {
+        "id": f"{'r' * 40}_20240501T090000Z_{i}",
+        "title": "Weekly planning with the whole platform team " * 3,
+        "description": "Agenda: " + "x" * 500,
+        "start_dt": "2024-05-01T09:00:00+02:00",
+        "end_dt": "2024-05-01T10:00:00+02:00",
+        "location": "Meeting room on the third floor next to the kitchen " * 2,
+        "attendees": [f"person{n}@example.com" for n in range(10)],
+        "calendar_id": TEAM_CALENDAR_ID,
+    }
+
+
+def test_compaction_keeps_identifiers_whole():
+    events = [_event(i) for i in range(20)]
+    output = json.loads(ToolOutputSerializer.serialize("list_events", events))
+
+    assert output["events"]
+    for original, slim in zip(events, output["events"]):
+        assert slim["calendar_id"] == TEAM_CALENDAR_ID
+        assert slim["id"] == original["id"]
+        assert slim["start_dt"] == original["start_dt"]
+        assert slim["end_dt"] == original["end_dt"]
+        assert len(slim["title"]) <= 60 and slim["title"].endswith("…")
+
+
+def test_single_dict_result_keeps_calendar_id():
+    event = _event(0)
+    output = json.loads(ToolOutputSerializer.serialize("get_event", event))
+    assert output["calendar_id"] == TEAM_CALENDAR_ID
+    assert output["id"] == event["id"]